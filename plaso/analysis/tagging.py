@@ -14,7 +14,7 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
   def __init__(self):
     """Initializes a tagging analysis plugin."""
     super(TaggingAnalysisPlugin, self).__init__()
-    self._tagging_rules = None
+    self._tagging_rule_set = None
 
   def ExamineEvent(
       self, analysis_mediator, event, event_data, event_data_stream):
@@ -27,14 +27,10 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
     """
-    matched_label_names = []
-    for label_name, filter_objects in self._tagging_rules.items():
-      for filter_object in filter_objects:
-        # Note that tagging events based on existing labels is currently
-        # not supported.
-        if filter_object.Match(event, event_data, event_data_stream, None):
-          matched_label_names.append(label_name)
-          break
+    # Note that tagging events based on existing labels is currently
+    # not supported.
+    matched_label_names = self._tagging_rule_set.GetMatchingLabels(
+        event, event_data, event_data_stream, None)
 
     if matched_label_names:
       event_tag = self._CreateEventTag(event, matched_label_names)
@@ -53,7 +49,7 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
       tagging_file_path (str): path of the tagging file.
     """
     tagging_file_object = tagging_file.TaggingFile(tagging_file_path)
-    self._tagging_rules = tagging_file_object.GetEventTaggingRules()
+    self._tagging_rule_set = tagging_file_object.GetEventTaggingRuleSet()
 
 
 manager.AnalysisPluginManager.RegisterPlugin(TaggingAnalysisPlugin)
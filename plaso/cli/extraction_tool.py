@@ -89,6 +89,7 @@ class ExtractionTool(
     self._expanded_parser_filter_expression = None
     self._extract_winevt_resources = True
     self._extract_winreg_binary = True
+    self._incremental_extraction = False
     self._number_of_extraction_workers = 0
     self._parser_filter_expression = None
     self._preferred_codepage = None
@@ -106,11 +107,14 @@ class ExtractionTool(
     self._status_view_file = 'status.info'
     self._status_view_interval = 0.5
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
+    self._storage_compression_format = definitions.COMPRESSION_FORMAT_ZLIB
     self._storage_file_path = None
     self._storage_format = definitions.STORAGE_FORMAT_SQLITE
+    self._storage_serializer_format = definitions.SERIALIZER_FORMAT_JSON
     self._task_storage_format = definitions.STORAGE_FORMAT_SQLITE
     self._temporary_directory = None
     self._worker_memory_limit = None
+    self._worker_timelining = False
     self._worker_timeout = None
     self._yara_rules_string = None
 
@@ -199,6 +203,7 @@ class ExtractionTool(
         self._process_compressed_streams)
     configuration.extraction.yara_rules_string = self._yara_rules_string
     configuration.filter_file = self._filter_file
+    configuration.incremental_extraction = self._incremental_extraction
     configuration.log_filename = self._log_file
     configuration.parser_filter_expression = (
         self._expanded_parser_filter_expression)
@@ -209,8 +214,11 @@ class ExtractionTool(
     configuration.profiling.directory = self._profiling_directory
     configuration.profiling.sample_rate = self._profiling_sample_rate
     configuration.profiling.profilers = self._profilers
+    configuration.task_compression_format = self._storage_compression_format
+    configuration.task_serialization_format = self._storage_serializer_format
     configuration.task_storage_format = self._task_storage_format
     configuration.temporary_directory = self._temporary_directory
+    configuration.worker_timelining = self._worker_timelining
 
     return configuration
 
@@ -494,6 +502,10 @@ class ExtractionTool(
         self._CreateExtractionProcessingConfiguration())
     processing_configuration.force_parser = force_parser
 
+    if self._incremental_extraction and single_process_mode:
+      logger.warning(
+          'Incremental extraction is not supported in single process mode.')
+
     environment_variables = (
         extraction_engine.knowledge_base.GetEnvironmentVariables())
     user_accounts = list(storage_writer.GetAttributeContainers('user_account'))
@@ -739,7 +751,10 @@ class ExtractionTool(
           f'Unsupported storage format: {self._storage_format:s}')
 
     try:
-      storage_writer.Open(path=self._storage_file_path)
+      storage_writer.Open(
+          compression_format=self._storage_compression_format,
+          path=self._storage_file_path,
+          serialization_format=self._storage_serializer_format)
     except IOError as exception:
       raise IOError(f'Unable to open storage with error: {exception!s}')
 
@@ -4,6 +4,7 @@
 from plaso.cli import tools
 from plaso.cli.helpers import interface
 from plaso.cli.helpers import manager
+from plaso.lib import definitions
 from plaso.lib import errors
 
 
@@ -44,6 +45,13 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
             'Skip processing file content within compressed streams, such as '
             'syslog.gz and syslog.bz2.'))
 
+    argument_group.add_argument(
+        '--worker_timelining', '--worker-timelining', dest='worker_timelining',
+        action='store_true', default=False, help=(
+            'Generate events from event data in the worker processes instead '
+            'of the main (foreman) process. This can make processing faster '
+            'when many worker processes are used.'))
+
   @classmethod
   def ParseOptions(cls, options, configuration_object):
     """Parses and validates options.
@@ -55,6 +63,8 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
+      BadConfigOption: when worker timelining is used with a task storage
+          format that does not support it.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
@@ -65,12 +75,23 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
     extract_winreg_binary = getattr(options, 'extract_winreg_binary', False)
     process_compressed_streams = getattr(
         options, 'process_compressed_streams', True)
+    worker_timelining = getattr(options, 'worker_timelining', False)
+
+    # Worker timelining requires reading back the event data written to
+    # the task storage, which is not supported by the Redis task storage.
+    task_storage_format = getattr(options, 'task_storage_format', None)
+    if (worker_timelining and
+        task_storage_format == definitions.STORAGE_FORMAT_REDIS):
+      raise errors.BadConfigOption(
+          'Worker timelining is not supported with the Redis task storage '
+          'format.')
 
     setattr(configuration_object, '_extract_winreg_binary',
             extract_winreg_binary)
     setattr(configuration_object, '_preferred_year', preferred_year)
     setattr(configuration_object, '_process_compressed_streams',
             process_compressed_streams)
+    setattr(configuration_object, '_worker_timelining', worker_timelining)
 
 
 manager.ArgumentHelperManager.RegisterHelper(ExtractionArgumentsHelper)
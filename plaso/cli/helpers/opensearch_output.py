@@ -27,6 +27,7 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
 
   _DEFAULT_FLUSH_INTERVAL = 1000
   _DEFAULT_INDEX_NAME = uuid4().hex
+  _DEFAULT_NUMBER_OF_BULK_REQUESTS = 4
   _DEFAULT_PORT = 9200
   _DEFAULT_SERVER = '127.0.0.1'
 
@@ -51,6 +52,13 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         action='store', default=cls._DEFAULT_FLUSH_INTERVAL, metavar='INTERVAL',
         help='Events to queue up before bulk insert to OpenSearch.')
 
+    argument_group.add_argument(
+        '--bulk_requests', '--bulk-requests', dest='bulk_requests', type=int,
+        action='store', default=cls._DEFAULT_NUMBER_OF_BULK_REQUESTS,
+        metavar='NUMBER', help=(
+            'Number of bulk inserts that are sent to OpenSearch '
+            'concurrently.'))
+
     argument_group.add_argument(
         '--opensearch-server', '--opensearch_server', '--server', dest='server',
         type=str, action='store', default=cls._DEFAULT_SERVER,
@@ -118,6 +126,13 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         options, 'index_name', default_value=cls._DEFAULT_INDEX_NAME)
     flush_interval = cls._ParseNumericOption(
         options, 'flush_interval', default_value=cls._DEFAULT_FLUSH_INTERVAL)
+    number_of_bulk_requests = cls._ParseNumericOption(
+        options, 'bulk_requests',
+        default_value=cls._DEFAULT_NUMBER_OF_BULK_REQUESTS)
+
+    if number_of_bulk_requests < 1:
+      raise errors.BadConfigOption(
+          f'Invalid number of bulk requests: {number_of_bulk_requests:d}')
 
     mappings_file_path = cls._ParseStringOption(options, 'opensearch_mappings')
     opensearch_user = cls._ParseStringOption(options, 'opensearch_user')
@@ -150,6 +165,7 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
 
     output_module.SetIndexName(index_name)
     output_module.SetFlushInterval(flush_interval)
+    output_module.SetNumberOfBulkRequests(number_of_bulk_requests)
 
     output_module.SetUsername(opensearch_user)
     output_module.SetPassword(opensearch_password)
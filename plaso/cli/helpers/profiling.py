@@ -21,6 +21,7 @@ class ProfilingArgumentsHelper(interface.ArgumentsHelper):
       'analyzers': 'Profile CPU time of analyzers, like hashing',
       'format_checks': 'Profile CPU time per format check',
       'memory': 'Profile memory usage over time',
+      'parser_probes': 'Profile the results of format checks per parser',
       'parsers': 'Profile CPU time per parser',
       'processing': 'Profile CPU time of processing phases',
       'serializers': 'Profile CPU time of serialization',
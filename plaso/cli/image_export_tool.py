@@ -7,7 +7,11 @@ import collections
 import io
 import json
 import os
+import tempfile
 import textwrap
+import threading
+
+from concurrent import futures
 
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
@@ -58,7 +62,12 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
   _HASHES_FILENAME = 'hashes.json'
 
-  _READ_BUFFER_SIZE = 4096
+  # The maximum number of worker threads used by default.
+  _MAXIMUM_NUMBER_OF_WORKERS = 8
+
+  # The maximum number of file entries per worker thread that are queued
+  # for export.
+  _MAXIMUM_QUEUED_FILE_ENTRIES_PER_WORKER = 4
 
   # TODO: remove this redirect.
   _SOURCE_OPTION = 'image'
@@ -90,43 +99,19 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     self._digests = {}
     self._filter_collection = file_entry_filters.FileEntryFilterCollection()
     self._filter_file = None
+    self._lock = threading.Lock()
     self._no_hashes = False
+    self._number_of_workers = 1
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._process_memory_limit = None
     self._paths_by_hash = collections.defaultdict(list)
     self._resolver_context = context.Context()
     self._skip_duplicates = True
+    self._thread_local = threading.local()
 
     self.has_filters = False
     self.list_signature_identifiers = False
 
-  def _CalculateDigestHash(self, file_entry, data_stream_name):
-    """Calculates a SHA-256 digest of the contents of the file entry.
-
-    Args:
-      file_entry (dfvfs.FileEntry): file entry whose content will be hashed.
-      data_stream_name (str): name of the data stream whose content is to be
-          hashed.
-
-    Returns:
-      str: hexadecimal representation of the SHA-256 hash or None if the digest
-          cannot be determined.
-    """
-    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
-    if not file_object:
-      return None
-
-    file_object.seek(0, os.SEEK_SET)
-
-    hasher_object = hashers_manager.HashersManager.GetHasher('sha256')
-
-    data = file_object.read(self._READ_BUFFER_SIZE)
-    while data:
-      hasher_object.Update(data)
-      data = file_object.read(self._READ_BUFFER_SIZE)
-
-    return hasher_object.GetStringDigest()
-
   def _CreateSanitizedDestination(
       self, source_file_entry, file_system_path_spec, source_data_stream_name,
       destination_path):
@@ -185,6 +170,10 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       skip_duplicates=True):
     """Extracts a data stream.
 
+    The data stream is written to a temporary file in the target directory,
+    while its digest hash is calculated, and is renamed to the target file
+    when it is not a duplicate of a previously exported data stream.
+
     Args:
       file_entry (dfvfs.FileEntry): file entry containing the data stream.
       data_stream_name (str): name of the data stream.
@@ -198,19 +187,6 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
         file_entry.path_spec)
 
-    try:
-      digest = self._CalculateDigestHash(file_entry, data_stream_name)
-    except (IOError, dfvfs_errors.BackEndError) as exception:
-      logger.error((
-          f'[skipping] unable to read content of file entry: {display_name:s} '
-          f'with error: {exception!s}'))
-      return
-
-    if not digest:
-      logger.error(
-          f'[skipping] unable to read content of file entry: {display_name:s}')
-      return
-
     target_directory, target_filename = self._CreateSanitizedDestination(
         file_entry, file_entry.path_spec, data_stream_name, destination_path)
 
@@ -222,43 +198,57 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     if target_path.startswith(destination_path):
       path = target_path[len(destination_path):]
 
-    self._paths_by_hash[digest].append(path)
+    os.makedirs(target_directory, exist_ok=True)
 
-    if skip_duplicates:
-      duplicate_display_name = self._digests.get(digest, None)
-      if duplicate_display_name:
-        logger.warning((
-            f'[skipping] file entry: {display_name:s} is a duplicate of: '
-            f'{duplicate_display_name:s} with digest: {digest:s}'))
-        return
-
-      self._digests[digest] = display_name
-
-    if not os.path.isdir(target_directory):
-      os.makedirs(target_directory)
-
-    if os.path.exists(target_path):
-      logger.warning((
-          f'[skipping] unable to export contents of file entry: '
-          f'{display_name:s} because exported file: {target_path:s} already '
-          f'exists.'))
-      return
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        suffix='.partial', prefix='.', dir=target_directory)
+    os.close(file_descriptor)
 
     try:
-      self._WriteFileEntry(file_entry, data_stream_name, target_path)
+      digest = self._WriteFileEntry(
+          file_entry, data_stream_name, temporary_path)
     except (IOError, dfvfs_errors.BackEndError) as exception:
       logger.error((
           f'[skipping] unable to export contents of file entry: '
           f'{display_name:s} with error: {exception!s}'))
+      self._RemoveFile(temporary_path)
+      return
 
-      try:
-        os.remove(target_path)
-      except (IOError, OSError):
-        pass
+    if not digest:
+      logger.error(
+          f'[skipping] unable to read content of file entry: {display_name:s}')
+      self._RemoveFile(temporary_path)
+      return
 
-  def _ExtractFileEntry(
+    # The lock ensures that only one worker thread exports a data stream
+    # with a specific digest hash or to a specific target path.
+    with self._lock:
+      self._paths_by_hash[digest].append(path)
+
+      if skip_duplicates:
+        duplicate_display_name = self._digests.get(digest, None)
+        if duplicate_display_name:
+          logger.warning((
+              f'[skipping] file entry: {display_name:s} is a duplicate of: '
+              f'{duplicate_display_name:s} with digest: {digest:s}'))
+          self._RemoveFile(temporary_path)
+          return
+
+        self._digests[digest] = display_name
+
+      if os.path.exists(target_path):
+        logger.warning((
+            f'[skipping] unable to export contents of file entry: '
+            f'{display_name:s} because exported file: {target_path:s} already '
+            f'exists.'))
+        self._RemoveFile(temporary_path)
+        return
+
+      os.rename(temporary_path, target_path)
+
+  def _ExtractDataStreams(
       self, file_entry, destination_path, skip_duplicates=True):
-    """Extracts a file entry.
+    """Extracts the data streams of a file entry.
 
     Args:
       file_entry (dfvfs.FileEntry): file entry whose content is to be written.
@@ -266,9 +256,6 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       skip_duplicates (Optional[bool]): True if files with duplicate content
           should be skipped.
     """
-    if not self._filter_collection.Matches(file_entry):
-      return
-
     file_entry_processed = False
     for data_stream in file_entry.data_streams:
       if self._abort:
@@ -283,6 +270,54 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       self._ExtractDataStream(
           file_entry, '', destination_path, skip_duplicates=skip_duplicates)
 
+  def _ExtractFileEntry(
+      self, file_entry, destination_path, skip_duplicates=True):
+    """Extracts a file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry whose content is to be written.
+      destination_path (str): path where the extracted files should be stored.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    if not self._filter_collection.Matches(file_entry):
+      return
+
+    self._ExtractDataStreams(
+        file_entry, destination_path, skip_duplicates=skip_duplicates)
+
+  def _ExtractPathSpec(
+      self, path_spec, destination_path, skip_duplicates=True):
+    """Extracts the data streams of a file entry in a worker thread.
+
+    Since dfVFS resolver contexts are not thread-safe, the file entry is
+    opened with a resolver context of the worker thread.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the file entry.
+      destination_path (str): path where the extracted files should be stored.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    resolver_context = getattr(self._thread_local, 'resolver_context', None)
+    if not resolver_context:
+      resolver_context = context.Context()
+      self._thread_local.resolver_context = resolver_context
+
+    try:
+      file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+          path_spec, resolver_context=resolver_context)
+    except (IOError, dfvfs_errors.BackEndError) as exception:
+      path_spec_string = self._GetPathSpecificationString(path_spec)
+      logger.error((
+          f'[skipping] unable to open file entry for path specification: '
+          f'{path_spec_string:s} with error: {exception!s}'))
+      return
+
+    if file_entry:
+      self._ExtractDataStreams(
+          file_entry, destination_path, skip_duplicates=skip_duplicates)
+
   # TODO: merge with collector and/or engine.
   def _Extract(
       self, file_system_path_specs, destination_path, output_writer,
@@ -357,36 +392,83 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     output_writer.Write('Extracting file entries.\n')
 
-    for file_system_path_spec in file_system_path_specs:
-      path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
-          file_system_path_spec, find_specs=included_find_specs,
-          resolver_context=self._resolver_context)
+    if self._number_of_workers > 1:
+      executor = futures.ThreadPoolExecutor(
+          max_workers=self._number_of_workers)
+    else:
+      executor = None
 
-      for path_spec in path_spec_generator:
-        file_entry = path_spec_resolver.Resolver.OpenFileEntry(
-            path_spec, resolver_context=self._resolver_context)
+    maximum_number_of_queued_file_entries = (
+        self._number_of_workers * self._MAXIMUM_QUEUED_FILE_ENTRIES_PER_WORKER)
+    queued_file_entries = set()
 
-        if not file_entry:
-          path_spec_string = self._GetPathSpecificationString(path_spec)
-          logger.warning((
-              f'Unable to open file entry for path specfication: '
-              f'{path_spec_string:s}'))
-          continue
+    try:
+      for file_system_path_spec in file_system_path_specs:
+        for path_spec in self._path_spec_extractor.ExtractPathSpecs(
+            file_system_path_spec, find_specs=included_find_specs,
+            resolver_context=self._resolver_context):
+          file_entry = self._OpenFileEntry(path_spec, excluded_find_specs)
+          if not file_entry:
+            continue
+
+          if not executor:
+            self._ExtractFileEntry(
+                file_entry, destination_path, skip_duplicates=skip_duplicates)
+            continue
+
+          # Filters are matched in the main thread since these are not
+          # guaranteed to be thread-safe.
+          if not self._filter_collection.Matches(file_entry):
+            continue
+
+          if len(queued_file_entries) >= maximum_number_of_queued_file_entries:
+            done_file_entries, queued_file_entries = futures.wait(
+                queued_file_entries, return_when=futures.FIRST_COMPLETED)
+
+            for future in done_file_entries:
+              future.result()
+
+          future = executor.submit(
+              self._ExtractPathSpec, path_spec, destination_path,
+              skip_duplicates=skip_duplicates)
+          queued_file_entries.add(future)
+
+      for future in futures.as_completed(queued_file_entries):
+        future.result()
+
+    finally:
+      if executor:
+        executor.shutdown(wait=True)
+
+  def _OpenFileEntry(self, path_spec, excluded_find_specs):
+    """Opens a file entry that is not excluded.
 
-        skip_file_entry = False
-        for find_spec in excluded_find_specs or []:
-          skip_file_entry = find_spec.CompareLocation(file_entry)
-          if skip_file_entry:
-            break
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the file entry.
+      excluded_find_specs (list[dfvfs.FindSpec]): find specifications of
+          file entries that are excluded from the export.
 
-        if skip_file_entry:
-          logger.info((
-              f'Skipped: {file_entry.path_spec.location:s} because of '
-              f'exclusion filter.'))
-          continue
+    Returns:
+      dfvfs.FileEntry: file entry or None if not available or excluded.
+    """
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=self._resolver_context)
+
+    if not file_entry:
+      path_spec_string = self._GetPathSpecificationString(path_spec)
+      logger.warning((
+          f'Unable to open file entry for path specfication: '
+          f'{path_spec_string:s}'))
+      return None
 
-        self._ExtractFileEntry(
-            file_entry, destination_path, skip_duplicates=skip_duplicates)
+    for find_spec in excluded_find_specs or []:
+      if find_spec.CompareLocation(file_entry):
+        logger.info((
+            f'Skipped: {file_entry.path_spec.location:s} because of '
+            f'exclusion filter.'))
+        return None
+
+    return file_entry
 
   def _ParseExtensionsString(self, extensions_string):
     """Parses the extensions string.
@@ -533,9 +615,23 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     return specification_store
 
+  def _RemoveFile(self, path):
+    """Removes a file, such as a temporary file, if it exists.
+
+    Args:
+      path (str): path of the file.
+    """
+    try:
+      os.remove(path)
+    except (IOError, OSError):
+      pass
+
   def _WriteFileEntry(self, file_entry, data_stream_name, destination_file):
     """Writes the contents of the source file entry to a destination file.
 
+    The SHA-256 digest hash of the contents is calculated while the contents
+    are written, so that the source file entry is only read once.
+
     Note that this function will overwrite an existing file.
 
     Args:
@@ -543,20 +639,29 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       data_stream_name (str): name of the data stream whose content is to be
           written.
       destination_file (str): path of the destination file.
+
+    Returns:
+      str: hexadecimal representation of the SHA-256 hash of the contents or
+          None if the contents could not be read.
     """
     source_file_object = file_entry.GetFileObject(
         data_stream_name=data_stream_name)
     if not source_file_object:
-      return
+      return None
+
+    hasher_object = hashers_manager.HashersManager.GetHasher('sha256')
 
     with open(destination_file, 'wb') as destination_file_object:
       source_file_object.seek(0, os.SEEK_SET)
 
       data = source_file_object.read(self._COPY_BUFFER_SIZE)
       while data:
+        hasher_object.Update(data)
         destination_file_object.write(data)
         data = source_file_object.read(self._COPY_BUFFER_SIZE)
 
+    return hasher_object.GetStringDigest()
+
   def AddFilterOptions(self, argument_group):
     """Adds the filter options to the argument group.
 
@@ -669,6 +774,13 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
         default=False, help=(
             f'Do not generate the {self._HASHES_FILENAME:s} file'))
 
+    argument_parser.add_argument(
+        '--workers', dest='workers', action='store', type=int, default=0,
+        help=(
+            f'Number of worker threads used to export files, where 1 exports '
+            f'files one by one. The default is the number of available system '
+            f'CPUs, with a maximum of {self._MAXIMUM_NUMBER_OF_WORKERS:d}.'))
+
     argument_parser.add_argument(
         self._SOURCE_OPTION, nargs='?', action='store', metavar='IMAGE',
         default=None, type=str, help=(
@@ -780,6 +892,17 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     self._no_hashes = getattr(options, 'no_hashes', False)
 
+    number_of_workers = getattr(options, 'workers', None) or 0
+    if number_of_workers < 0:
+      raise errors.BadConfigOption(
+          'Invalid number of workers value cannot be less than 0.')
+
+    if not number_of_workers:
+      number_of_workers = min(
+          os.cpu_count() or 1, self._MAXIMUM_NUMBER_OF_WORKERS)
+
+    self._number_of_workers = number_of_workers
+
     self._EnforceProcessMemoryLimit(self._process_memory_limit)
 
   def PrintFilterCollection(self):
@@ -18,6 +18,12 @@ from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.lib import loggers
 from plaso.parsers import manager as parsers_manager
+from plaso.storage import compression
+
+try:
+  from plaso.serializer import msgpack_serializer
+except ModuleNotFoundError:
+  msgpack_serializer = None
 
 
 class Log2TimelineTool(extraction_tool.ExtractionTool):
@@ -73,7 +79,6 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
     """
     super(Log2TimelineTool, self).__init__(
         input_reader=input_reader, output_writer=output_writer)
-    self._storage_serializer_format = definitions.SERIALIZER_FORMAT_JSON
 
     self.dependencies_check = True
     self.list_archive_types = False
@@ -119,6 +124,28 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
             'The path of the storage file. If not specified, one will be made '
             'in the form <timestamp>-<source>.plaso'))
 
+    compression_formats = ', '.join(sorted(definitions.COMPRESSION_FORMATS))
+    argument_group.add_argument(
+        '--compression_format', '--compression-format', action='store',
+        choices=sorted(definitions.COMPRESSION_FORMATS),
+        dest='compression_format', type=str,
+        default=definitions.COMPRESSION_FORMAT_ZLIB, metavar='FORMAT', help=(
+            f'Format in which serialized attribute containers are compressed '
+            f'in the storage file, supported compression formats: '
+            f'{compression_formats:s}. The zstd format requires the '
+            f'zstandard Python module.'))
+
+    serializer_formats = ', '.join(sorted(definitions.SERIALIZER_FORMATS))
+    argument_group.add_argument(
+        '--serializer_format', '--serializer-format', action='store',
+        choices=sorted(definitions.SERIALIZER_FORMATS),
+        dest='serializer_format', type=str,
+        default=definitions.SERIALIZER_FORMAT_JSON, metavar='FORMAT', help=(
+            f'Format in which attribute containers are serialized in '
+            f'the storage file, supported serializer formats: '
+            f'{serializer_formats:s}. The msgpack format requires the '
+            f'msgpack Python module.'))
+
   def ParseArguments(self, arguments):
     """Parses the command line arguments.
 
@@ -154,6 +181,18 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
 
     self.AddStorageMediaImageOptions(extraction_group)
     self.AddExtractionOptions(extraction_group)
+
+    extraction_group.add_argument(
+        '--incremental', dest='incremental', action='store_true',
+        default=False, help=(
+            'Skip file entries that are unchanged since a previous extraction '
+            'into the same storage file. A file entry is considered unchanged '
+            'if its size and modification time are the same and it was '
+            'previously processed with all the enabled parsers and plugins. '
+            'To run only newly added parsers or plugins on unchanged file '
+            'entries, use a parser filter expression with only these '
+            'parsers or plugins. Only supported in multi process mode.'))
+
     self.AddVSSProcessingOptions(extraction_group)
     self.AddCredentialOptions(extraction_group)
 
@@ -304,6 +343,8 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
     self._ParsePerformanceOptions(options)
     self._ParseProcessingOptions(options)
 
+    self._incremental_extraction = getattr(options, 'incremental', False)
+
     self._storage_file_path = self.ParseStringOption(options, 'storage_file')
     if not self._storage_file_path:
       self._storage_file_path = self._GenerateStorageFileName()
@@ -311,11 +352,27 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
     if not self._storage_file_path:
       raise errors.BadConfigOption('Missing storage file option.')
 
+    compression_format = getattr(
+        options, 'compression_format', definitions.COMPRESSION_FORMAT_ZLIB)
+    supported_compression_formats = (
+        compression.CompressionCodecsManager.GetCompressionFormats())
+    if compression_format not in supported_compression_formats:
+      raise errors.BadConfigOption(
+          f'Unsupported storage compression format: {compression_format:s}')
+    self._storage_compression_format = compression_format
+
     serializer_format = getattr(
         options, 'serializer_format', definitions.SERIALIZER_FORMAT_JSON)
     if serializer_format not in definitions.SERIALIZER_FORMATS:
       raise errors.BadConfigOption(
           f'Unsupported storage serializer format: {serializer_format:s}')
+
+    if (serializer_format == definitions.SERIALIZER_FORMAT_MSGPACK and
+        not msgpack_serializer):
+      raise errors.BadConfigOption((
+          f'Storage serializer format: {serializer_format:s} requires the '
+          f'msgpack Python module.'))
+
     self._storage_serializer_format = serializer_format
 
     helpers_manager.ArgumentHelperManager.ParseOptions(
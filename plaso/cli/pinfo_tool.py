@@ -1237,6 +1237,7 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
     Args:
       storage_reader (StorageReader): storage reader.
     """
+    compression_format = storage_reader.GetCompressionFormat()
     format_version = storage_reader.GetFormatVersion()
     serialization_format = storage_reader.GetSerializationFormat()
 
@@ -1246,6 +1247,8 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
     table_view.AddRow(['Filename', os.path.basename(self._storage_file_path)])
     table_view.AddRow(['Format version', format_version])
     table_view.AddRow(['Serialization format', serialization_format])
+    if compression_format:
+      table_view.AddRow(['Compression format', compression_format])
     table_view.Write(self._output_writer)
 
   def _PrintWarningCountersJSON(
@@ -60,6 +60,7 @@ class PsortTool(
     super(PsortTool, self).__init__(
         input_reader=input_reader, output_writer=output_writer)
     self._deduplicate_events = True
+    self._number_of_formatting_workers = 0
     self._preferred_language = None
     self._process_memory_limit = None
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
@@ -225,6 +226,13 @@ class PsortTool(
     helpers_manager.ArgumentHelperManager.ParseOptions(
         options, self, names=argument_helper_names)
 
+    number_of_formatting_workers = getattr(options, 'formatting_workers', 0)
+
+    if number_of_formatting_workers and number_of_formatting_workers < 0:
+      raise errors.BadConfigOption((
+          f'Invalid number of formatting workers: '
+          f'{number_of_formatting_workers:d}, value must be 0 or greater.'))
+
     worker_memory_limit = getattr(options, 'worker_memory_limit', None)
 
     if worker_memory_limit and worker_memory_limit < 0:
@@ -239,6 +247,7 @@ class PsortTool(
           f'Invalid worker timeout: {worker_timeout:f}, value must be greater '
           f'than 0.0 minutes.'))
 
+    self._number_of_formatting_workers = number_of_formatting_workers or 0
     self._worker_memory_limit = worker_memory_limit
     self._worker_timeout = worker_timeout
 
@@ -272,6 +281,15 @@ class PsortTool(
             '15.0 minutes. If a worker process exceeds this timeout it is '
             'killed by the main (foreman) process.'))
 
+    argument_group.add_argument(
+        '--formatting_workers', '--formatting-workers',
+        dest='formatting_workers', action='store', type=int, default=0,
+        metavar='NUMBER', help=(
+            'Number of worker processes that format the events for output, '
+            'where 0 represents that the events are formatted by the main '
+            'process. The default is 0. The output order is the same as '
+            'when the events are formatted by the main process.'))
+
   def ListLanguageTags(self):
     """Lists the language tags."""
     table_view = views.ViewsFactory.GetTableView(
@@ -510,7 +528,9 @@ class PsortTool(
           storage_reader, self._output_module, configuration,
           deduplicate_events=self._deduplicate_events,
           event_filter=self._event_filter,
+          number_of_worker_processes=self._number_of_formatting_workers,
           status_update_callback=status_update_callback,
+          storage_file_path=self._storage_file_path,
           time_slice=self._time_slice, use_time_slicer=self._use_time_slicer)
 
       self._output_module.Close()
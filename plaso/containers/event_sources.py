@@ -14,7 +14,16 @@ class EventSource(interface.AttributeContainer):
 
   Attributes:
     data_type (str): attribute container type indicator.
+    event_data_stream_values (str): JSON serialized event data stream of
+        a record range or None if the event source is not a record range.
     file_entry_type (str): dfVFS file entry type.
+    file_size (int): size of the file entry data or None if not available.
+    first_record_index (int): index of the first record of a record range
+        or None if the event source is not a record range.
+    number_of_records (int): number of records of a record range or None if
+        the event source is not a record range.
+    parser_name (str): name of the parser to parse the record range with or
+        None if the event source is not a record range.
     path_spec (dfvfs.PathSpec): path specification.
   """
   CONTAINER_TYPE = 'event_source'
@@ -22,19 +31,30 @@ class EventSource(interface.AttributeContainer):
 
   SCHEMA = {
       'data_type': 'str',
+      'event_data_stream_values': 'str',
       'file_entry_type': 'str',
+      'file_size': 'int',
+      'first_record_index': 'int',
+      'number_of_records': 'int',
+      'parser_name': 'str',
       'path_spec': 'dfvfs.PathSpec'}
 
-  def __init__(self, file_entry_type=None, path_spec=None):
+  def __init__(self, file_entry_type=None, file_size=None, path_spec=None):
     """Initializes an event source.
 
     Args:
       file_entry_type (Optional[str]): dfVFS file entry type.
+      file_size (Optional[int]): size of the file entry data.
       path_spec (Optional[dfvfs.PathSpec]): path specification.
     """
     super(EventSource, self).__init__()
     self.data_type = self.DATA_TYPE
+    self.event_data_stream_values = None
     self.file_entry_type = file_entry_type
+    self.file_size = file_size
+    self.first_record_index = None
+    self.number_of_records = None
+    self.parser_name = None
     self.path_spec = path_spec
 
   # This method is necessary for heap sort.
@@ -59,4 +79,70 @@ class FileEntryEventSource(EventSource):
   DATA_TYPE = 'file_entry'
 
 
+class ProcessedEventSource(interface.AttributeContainer):
+  """Processed event source attribute container.
+
+  The processed event source records the fingerprint of a file entry that
+  was processed during extraction and the parsers and plugins it was processed
+  with. It is used by incremental extraction to skip unchanged file entries.
+
+  Attributes:
+    file_size (int): size of the file entry data or None if not available.
+    modification_time (int): modification date and time of the file entry,
+        as the number of microseconds since January 1, 1970, 00:00:00 UTC,
+        or None if not available.
+    parser_names (list[str]): names of the parsers and plugins the file entry
+        was processed with.
+    path_spec (dfvfs.PathSpec): path specification.
+  """
+  CONTAINER_TYPE = 'processed_event_source'
+
+  SCHEMA = {
+      'file_size': 'int',
+      'modification_time': 'int',
+      'parser_names': 'List[str]',
+      'path_spec': 'dfvfs.PathSpec'}
+
+  def __init__(
+      self, file_size=None, modification_time=None, parser_names=None,
+      path_spec=None):
+    """Initializes a processed event source.
+
+    Args:
+      file_size (Optional[int]): size of the file entry data.
+      modification_time (Optional[int]): modification date and time of
+          the file entry, as the number of microseconds since January 1, 1970,
+          00:00:00 UTC.
+      parser_names (Optional[list[str]]): names of the parsers and plugins
+          the file entry was processed with.
+      path_spec (Optional[dfvfs.PathSpec]): path specification.
+    """
+    super(ProcessedEventSource, self).__init__()
+    self.file_size = file_size
+    self.modification_time = modification_time
+    self.parser_names = parser_names
+    self.path_spec = path_spec
+
+  def IsUnchanged(self, file_size, modification_time):
+    """Determines if the fingerprint of the file entry is unchanged.
+
+    Args:
+      file_size (int): size of the file entry data or None if not available.
+      modification_time (int): modification date and time of the file entry,
+          as the number of microseconds since January 1, 1970, 00:00:00 UTC,
+          or None if not available.
+
+    Returns:
+      bool: True if the file entry is unchanged. A file entry without
+          a modification date and time is never considered unchanged.
+    """
+    if modification_time is None or self.modification_time is None:
+      return False
+
+    return (file_size == self.file_size and
+            modification_time == self.modification_time)
+
+
 manager.AttributeContainersManager.RegisterAttributeContainer(EventSource)
+manager.AttributeContainersManager.RegisterAttributeContainer(
+    ProcessedEventSource)
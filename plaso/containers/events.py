@@ -10,76 +10,172 @@ from acstore.containers import manager
 from dfdatetime import interface as dfdatetime_interface
 
 
-def CalculateEventValuesHash(event_data, event_data_stream):
-  """Calculates a digest hash of the event values.
+# Prefix of the event values hash that indicates the format of the hash.
+# Event values hashes without a prefix were calculated with an older format
+# and cannot be compared with event values hashes of the current format.
+EVENT_VALUES_HASH_PREFIX = 'v2:'
+
+# The maximum number of cached event data attribute names.
+_MAXIMUM_CACHED_ATTRIBUTE_NAMES = 4096
+
+# Type indicators of the supported attribute value types.
+_VALUE_TYPE_INDICATORS = {
+    bool: b'n',
+    float: b'n',
+    int: b'n',
+    list: b'l',
+    str: b's'}
+
+# Cache of the sorted names of the event data attributes that are used to
+# calculate the event values hash, per data type and attribute names.
+_attribute_names_cache = {}
+
+
+def _GetEventValuesHashAttributeNames(event_data):
+  """Retrieves the event data attribute names used for the event values hash.
 
   Args:
     event_data (EventData): event data.
-    event_data_stream (EventDataStream): an event data stream or None if not
-        available.
 
   Returns:
-    str: digest hash of the event values content.
-
-  Raises:
-    RuntimeError: if the event values hash cannot be determined.
+    list[tuple[str, bytes]]: sorted attribute names and their encoded form.
   """
-  attributes = ['data_type: {0:s}'.format(event_data.data_type)]
+  attribute_names = tuple(event_data.__dict__)
+  lookup_key = (event_data.data_type, attribute_names)
 
-  for attribute_name, attribute_value in sorted(event_data.GetAttributes()):
-    if attribute_value is None or attribute_name in (
-        '_event_data_stream_identifier', '_event_values_hash', '_parser_chain',
-        'data_type'):
-      continue
+  sorted_attribute_names = _attribute_names_cache.get(lookup_key, None)
+  if sorted_attribute_names is None:
+    sorted_attribute_names = [
+        (attribute_name, attribute_name.encode('utf-8') + b'\x00')
+        for attribute_name in sorted(attribute_names)
+        if attribute_name[0] != '_' and attribute_name != 'data_type']
+
+    if len(_attribute_names_cache) >= _MAXIMUM_CACHED_ATTRIBUTE_NAMES:
+      _attribute_names_cache.clear()
+
+    _attribute_names_cache[lookup_key] = sorted_attribute_names
 
+  return sorted_attribute_names
+
+
+def _GetEventValuesHashValueData(attribute_name, attribute_value):
+  """Retrieves the canonical encoding of an attribute value.
+
+  Args:
+    attribute_name (str): attribute name.
+    attribute_value (object): attribute value.
+
+  Returns:
+    bytes: canonical encoding of the attribute value, prefixed with a type
+        indicator and the size of the encoded value, or None if the attribute
+        value should be ignored.
+
+  Raises:
+    RuntimeError: if the attribute value type is not supported.
+  """
+  type_indicator = _VALUE_TYPE_INDICATORS.get(type(attribute_value), None)
+  if type_indicator is None:
     # Ignore date and time values.
     if isinstance(attribute_value, dfdatetime_interface.DateTimeValues):
-      continue
+      return None
 
-    if (isinstance(attribute_value, list) and attribute_value and
-        isinstance(attribute_value[0],
-                     dfdatetime_interface.DateTimeValues)):
-      continue
+    for value_type, value_type_indicator in _VALUE_TYPE_INDICATORS.items():
+      if isinstance(attribute_value, value_type):
+        type_indicator = value_type_indicator
+        break
 
-    if not isinstance(attribute_value, (bool, float, int, list, str)):
+    else:
       raise RuntimeError(
           'Unsupported attribute: {0:s} value type: {1!s}'.format(
               attribute_name, type(attribute_value)))
 
-    try:
-      attribute_string = '{0:s}: {1!s}'.format(
-          attribute_name, attribute_value)
-      attributes.append(attribute_string)
-    except UnicodeDecodeError:
-      raise RuntimeError(
-          'Failed to decode attribute {0:s}'.format(attribute_name))
+  if type_indicator == b's':
+    value_string = attribute_value
+
+  else:
+    # Ignore lists of date and time values.
+    if type_indicator == b'l' and attribute_value and isinstance(
+        attribute_value[0], dfdatetime_interface.DateTimeValues):
+      return None
 
-  if event_data_stream:
-    for attribute_name, attribute_value in sorted(
-        event_data_stream.GetAttributes()):
+    value_string = '{0!s}'.format(attribute_value)
 
-      if attribute_name == 'path_spec':
-        attribute_value = attribute_value.comparable
+  value_data = value_string.encode('utf-8', errors='surrogatepass')
 
-      elif not isinstance(attribute_value, (bool, float, int, list, str)):
-        raise RuntimeError(
-            'Unsupported attribute: {0:s} value type: {1!s}'.format(
-                attribute_name, type(attribute_value)))
+  return b''.join([type_indicator, b'%d\x00' % len(value_data), value_data])
+
+
+def CalculateEventDataStreamValuesDigest(event_data_stream):
+  """Calculates a digest of the event data stream values.
+
+  Args:
+    event_data_stream (EventDataStream): event data stream.
+
+  Returns:
+    bytes: digest of the event data stream values.
+
+  Raises:
+    RuntimeError: if the event data stream values digest cannot be determined.
+  """
+  hash_context = hashlib.blake2b(digest_size=16)
+
+  for attribute_name, attribute_value in sorted(
+      event_data_stream.GetAttributes()):
+    if attribute_name == 'path_spec':
+      attribute_value = attribute_value.comparable
+
+    value_data = _GetEventValuesHashValueData(attribute_name, attribute_value)
+    if value_data is not None:
+      hash_context.update(attribute_name.encode('utf-8') + b'\x00')
+      hash_context.update(value_data)
+
+  return hash_context.digest()
+
+
+def CalculateEventValuesHash(
+    event_data, event_data_stream, event_data_stream_values_digest=None):
+  """Calculates a digest hash of the event values.
+
+  Args:
+    event_data (EventData): event data.
+    event_data_stream (EventDataStream): an event data stream or None if not
+        available.
+    event_data_stream_values_digest (Optional[bytes]): digest of the event
+        data stream values, as calculated by
+        CalculateEventDataStreamValuesDigest, where None indicates the digest
+        should be calculated from the event data stream.
+
+  Returns:
+    str: digest hash of the event values content, prefixed with
+        EVENT_VALUES_HASH_PREFIX.
+
+  Raises:
+    RuntimeError: if the event values hash cannot be determined.
+  """
+  hash_context = hashlib.blake2b(digest_size=16)
+  hash_context.update(event_data.data_type.encode('utf-8') + b'\x00')
+
+  attribute_values = event_data.__dict__
+  for attribute_name, encoded_attribute_name in (
+      _GetEventValuesHashAttributeNames(event_data)):
+    attribute_value = attribute_values[attribute_name]
+    if attribute_value is None:
+      continue
 
-      try:
-        attribute_string = '{0:s}: {1!s}'.format(
-            attribute_name, attribute_value)
-        attributes.append(attribute_string)
-      except UnicodeDecodeError:
-        raise RuntimeError(
-            'Failed to decode attribute {0:s}'.format(attribute_name))
+    value_data = _GetEventValuesHashValueData(attribute_name, attribute_value)
+    if value_data is not None:
+      hash_context.update(encoded_attribute_name)
+      hash_context.update(value_data)
 
-  content = ', '.join(attributes)
-  content_data = content.encode('utf-8')
+  if event_data_stream and event_data_stream_values_digest is None:
+    event_data_stream_values_digest = CalculateEventDataStreamValuesDigest(
+        event_data_stream)
 
-  md5_context = hashlib.md5(content_data)
+  if event_data_stream_values_digest:
+    hash_context.update(b'\x00')
+    hash_context.update(event_data_stream_values_digest)
 
-  return md5_context.hexdigest()
+  return ''.join([EVENT_VALUES_HASH_PREFIX, hash_context.hexdigest()])
 
 
 class EventData(interface.AttributeContainer):
@@ -20,8 +20,13 @@ class Task(interface.AttributeContainer):
     aborted (bool): True if the task was aborted.
     completion_time (int): time that the task was completed. Contains the
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
+    event_data_stream_values (str): JSON serialized event data stream of
+        a record range to process or None if the task does not process
+        a record range.
     file_entry_type (str): dfVFS type of the file entry the path specification
         is referencing.
+    first_record_index (int): index of the first record of a record range to
+        process or None if the task does not process a record range.
     has_retry (bool): True if the task was previously abandoned and a retry
         task was created, False otherwise.
     identifier (str): unique identifier of the task.
@@ -29,7 +34,13 @@ class Task(interface.AttributeContainer):
         processed as number of milliseconds since January 1, 1970, 00:00:00 UTC.
     merge_priority (int): priority used for the task storage file merge, where
         a lower value indicates a higher priority to merge.
+    number_of_records (int): number of records of a record range to process
+        or None if the task does not process a record range.
+    parser_name (str): name of the parser to process a record range with or
+        None if the task does not process a record range.
     path_spec (dfvfs.PathSpec): path specification.
+    path_specs (list[dfvfs.PathSpec]): path specifications of a batch of file
+        entries to process, where None indicates only path_spec is processed.
     session_identifier (str): the identifier of the session the task is part of.
     start_time (int): time that the task was started. Contains the number
         of micro seconds since January 1, 1970, 00:00:00 UTC.
@@ -42,12 +53,17 @@ class Task(interface.AttributeContainer):
   SCHEMA = {
       'aborted': 'bool',
       'completion_time': 'int',
+      'event_data_stream_values': 'str',
       'file_entry_type': 'str',
+      'first_record_index': 'int',
       'has_retry': 'bool',
       'identifier': 'str',
       'last_processing_time': 'int',
       'merge_priority': 'int',
+      'number_of_records': 'int',
+      'parser_name': 'str',
       'path_spec': 'dfvfs.PathSpec',
+      'path_specs': 'List[dfvfs.PathSpec]',
       'session_identifier': 'str',
       'start_time': 'int',
       'storage_file_size': 'int',
@@ -63,12 +79,17 @@ class Task(interface.AttributeContainer):
     super(Task, self).__init__()
     self.aborted = False
     self.completion_time = None
+    self.event_data_stream_values = None
     self.file_entry_type = None
+    self.first_record_index = None
     self.has_retry = False
     self.identifier = '{0:s}'.format(uuid.uuid4().hex)
     self.last_processing_time = None
     self.merge_priority = None
+    self.number_of_records = None
+    self.parser_name = None
     self.path_spec = None
+    self.path_specs = None
     self.session_identifier = session_identifier
     self.start_time = int(time.time() * definitions.MICROSECONDS_PER_SECOND)
     self.storage_file_size = None
@@ -96,9 +117,14 @@ class Task(interface.AttributeContainer):
       Task: a task to retry a previously abandoned task.
     """
     retry_task = Task(session_identifier=self.session_identifier)
+    retry_task.event_data_stream_values = self.event_data_stream_values
     retry_task.file_entry_type = self.file_entry_type
+    retry_task.first_record_index = self.first_record_index
     retry_task.merge_priority = self.merge_priority
+    retry_task.number_of_records = self.number_of_records
+    retry_task.parser_name = self.parser_name
     retry_task.path_spec = self.path_spec
+    retry_task.path_specs = self.path_specs
     retry_task.storage_file_size = self.storage_file_size
     retry_task.storage_format = self.storage_format
 
@@ -30,6 +30,7 @@ PYTHON_DEPENDENCIES = {
     'flor': ('__version__', '1.1.3', None, False),
     'future': ('__version__', '0.16.0', None, True),
     'lz4': ('__version__', '0.10.0', None, True),
+    'msgpack': ('__version__', '1.0.0', None, False),
     'opensearchpy': ('__versionstr__', '', None, False),
     'pefile': ('__version__', '2021.5.24', None, True),
     'psutil': ('__version__', '5.4.3', None, True),
@@ -77,7 +78,8 @@ PYTHON_DEPENDENCIES = {
     'xlsxwriter': ('__version__', '0.9.3', None, True),
     'yaml': ('__version__', '3.10', None, True),
     'yara': ('YARA_VERSION', '3.4.0', None, True),
-    'zmq': ('__version__', '2.1.11', None, True)}
+    'zmq': ('__version__', '2.1.11', None, True),
+    'zstandard': ('__version__', '0.15.0', None, False)}
 
 _VERSION_SPLIT_REGEX = re.compile(r'\.|\-')
 
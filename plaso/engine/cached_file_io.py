@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""File-like object that caches the data of another file-like object."""
+
+import collections
+import os
+
+
+class CachedFileIO(object):
+  """File-like object that caches the data of another file-like object.
+
+  The data is cached in blocks, so that data read by one consumer, such as
+  the analyzers, can be reused by the next consumers, such as the signature
+  scanners and parsers, without reading and decoding the data again.
+
+  The blocks at the start of the data are retained, since these are read by
+  the signature scanners and most parsers. Other blocks are retained in
+  least recently used order.
+  """
+
+  _BLOCK_SIZE = 64 * 1024
+
+  # The maximum number of blocks at the start of the data that are retained.
+  _MAXIMUM_NUMBER_OF_HEADER_BLOCKS = 64
+
+  # The maximum number of other blocks that are retained.
+  _MAXIMUM_NUMBER_OF_CACHED_BLOCKS = 192
+
+  def __init__(self, file_object):
+    """Initializes a cached file-like object.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object to cache.
+    """
+    super(CachedFileIO, self).__init__()
+    self._cached_blocks = collections.OrderedDict()
+    self._current_offset = 0
+    self._file_object = file_object
+    self._header_blocks = {}
+    self._size = file_object.get_size()
+
+  def _GetBlocks(self, first_block_number, last_block_number):
+    """Retrieves blocks of data.
+
+    Consecutive blocks that are not cached are read at once.
+
+    Args:
+      first_block_number (int): number of the first block.
+      last_block_number (int): number of the last block.
+
+    Returns:
+      list[bytes]: data of the blocks.
+    """
+    blocks = []
+    uncached_block_number = None
+
+    for block_number in range(first_block_number, last_block_number + 1):
+      block_data = self._GetCachedBlock(block_number)
+      if block_data is None:
+        if uncached_block_number is None:
+          uncached_block_number = block_number
+        continue
+
+      if uncached_block_number is not None:
+        blocks.extend(self._ReadBlocks(
+            uncached_block_number, block_number - 1))
+        uncached_block_number = None
+
+      blocks.append(block_data)
+
+    if uncached_block_number is not None:
+      blocks.extend(self._ReadBlocks(uncached_block_number, last_block_number))
+
+    return blocks
+
+  def _GetCachedBlock(self, block_number):
+    """Retrieves a cached block of data.
+
+    Args:
+      block_number (int): number of the block.
+
+    Returns:
+      bytes: data of the block or None if not cached.
+    """
+    if block_number < self._MAXIMUM_NUMBER_OF_HEADER_BLOCKS:
+      return self._header_blocks.get(block_number, None)
+
+    block_data = self._cached_blocks.get(block_number, None)
+    if block_data is not None:
+      self._cached_blocks.move_to_end(block_number)
+
+    return block_data
+
+  def _ReadBlocks(self, first_block_number, last_block_number):
+    """Reads consecutive blocks of data and caches them.
+
+    Args:
+      first_block_number (int): number of the first block.
+      last_block_number (int): number of the last block.
+
+    Returns:
+      list[bytes]: data of the blocks.
+    """
+    offset = first_block_number * self._BLOCK_SIZE
+    read_size = (
+        (last_block_number - first_block_number + 1) * self._BLOCK_SIZE)
+
+    self._file_object.seek(offset, os.SEEK_SET)
+    data = self._file_object.read(read_size)
+
+    blocks = []
+    for data_offset in range(0, len(data), self._BLOCK_SIZE):
+      block_number = first_block_number + (data_offset // self._BLOCK_SIZE)
+      block_data = data[data_offset:data_offset + self._BLOCK_SIZE]
+
+      if block_number < self._MAXIMUM_NUMBER_OF_HEADER_BLOCKS:
+        self._header_blocks[block_number] = block_data
+      else:
+        self._cached_blocks[block_number] = block_data
+        if len(self._cached_blocks) > self._MAXIMUM_NUMBER_OF_CACHED_BLOCKS:
+          self._cached_blocks.popitem(last=False)
+
+      blocks.append(block_data)
+
+    return blocks
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size or a negative size was specified,
+    like the read function of Python file objects.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None or a negative
+          value is all remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    if self._current_offset >= self._size:
+      return b''
+
+    if (size is None or size < 0 or
+        self._current_offset + size > self._size):
+      size = self._size - self._current_offset
+
+    if size == 0:
+      return b''
+
+    first_block_number = self._current_offset // self._BLOCK_SIZE
+    last_block_number = (self._current_offset + size - 1) // self._BLOCK_SIZE
+
+    blocks = self._GetBlocks(first_block_number, last_block_number)
+
+    block_offset = self._current_offset % self._BLOCK_SIZE
+    data = b''.join(blocks)[block_offset:block_offset + size]
+
+    self._current_offset += len(data)
+
+    return data
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an
+          absolute or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+    """
+    return self._size
+
+  def seekable(self):
+    """Determines if the file-like object is seekable.
+
+    Returns:
+      bool: True since the file-like object is seekable.
+    """
+    return True
+
+  def tell(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
@@ -91,6 +91,8 @@ class ProfilingConfiguration(interface.AttributeContainer):
 
         * 'format_checks', which profiles CPU time consumed per format check;
         * 'memory', which profiles memory usage;
+        * 'parser_probes', which counts the results of probing data streams
+          per parser;
         * 'parsers', which profiles CPU time consumed by individual parsers;
         * 'processing', which profiles CPU time consumed by different parts of
           processing;
@@ -133,6 +135,14 @@ class ProfilingConfiguration(interface.AttributeContainer):
     """
     return 'memory' in self.profilers
 
+  def HaveProfileParserProbes(self):
+    """Determines if parser probes profiling is configured.
+
+    Returns:
+      bool: True if parser probes profiling is configured.
+    """
+    return 'parser_probes' in self.profilers
+
   def HaveProfileParsers(self):
     """Determines if parsers profiling is configured.
 
@@ -205,6 +215,8 @@ class ProcessingConfiguration(interface.AttributeContainer):
     filter_file (str): path to a file with find specifications.
     force_parser (bool): True if a specified parser should be forced to be used
         to extract events.
+    incremental_extraction (bool): True if file entries that are unchanged
+        since a previous extraction should be skipped.
     log_filename (str): name of the log file.
     parser_filter_expression (str): parser filter expression,
         where None represents all parsers and plugins.
@@ -215,10 +227,16 @@ class ProcessingConfiguration(interface.AttributeContainer):
     preferred_year (int): preferred initial year value for year-less date and
         time values.
     profiling (ProfilingConfiguration): profiling configuration.
+    task_compression_format (str): format in which task results are
+        compressed.
+    task_serialization_format (str): format in which task results are
+        serialized.
     task_storage_format (str): format to use for storing task results.
     task_storage_path (str): path of the directory containing SQLite task
         storage files.
     temporary_directory (str): path of the directory for temporary files.
+    worker_timelining (bool): True if events should be generated from event
+        data by the worker processes instead of the main (foreman) process.
   """
 
   CONTAINER_TYPE = 'processing_configuration'
@@ -238,6 +256,7 @@ class ProcessingConfiguration(interface.AttributeContainer):
     self.extraction = ExtractionConfiguration()
     self.filter_file = None
     self.force_parser = None
+    self.incremental_extraction = False
     self.log_filename = None
     self.parser_filter_expression = None
     self.preferred_codepage = None
@@ -246,6 +265,9 @@ class ProcessingConfiguration(interface.AttributeContainer):
     self.preferred_time_zone = None
     self.preferred_year = None
     self.profiling = ProfilingConfiguration()
+    self.task_compression_format = None
+    self.task_serialization_format = None
     self.task_storage_format = None
     self.task_storage_path = None
     self.temporary_directory = None
+    self.worker_timelining = False
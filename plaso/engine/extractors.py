@@ -2,6 +2,7 @@
 """Extractor classes, used to extract information from sources."""
 
 import copy
+import os
 import re
 
 import pysigscan
@@ -20,10 +21,18 @@ from plaso.parsers import manager as parsers_manager
 class EventDataExtractor(object):
   """The event data extractor."""
 
+  # The size of the data that is checked for binary data.
+  _BINARY_DATA_CHECK_SIZE = 4096
+
   _PARSE_RESULT_FAILURE = 1
   _PARSE_RESULT_SUCCESS = 2
   _PARSE_RESULT_UNSUPPORTED = 3
 
+  _PARSE_RESULT_NAMES = {
+      _PARSE_RESULT_FAILURE: 'failure',
+      _PARSE_RESULT_SUCCESS: 'success',
+      _PARSE_RESULT_UNSUPPORTED: 'unsupported'}
+
   def __init__(self, force_parser=False, parser_filter_expression=None):
     """Initializes an event extractor.
 
@@ -66,6 +75,33 @@ class EventDataExtractor(object):
 
     return False
 
+  def _ContainsBinaryData(self, file_object):
+    """Determines if a file-like object contains binary data.
+
+    The check is conservative and only considers the data binary if
+    the start of the data contains 4 consecutive 0-byte values at a 32-bit
+    aligned offset, which does not occur in UTF-8, UTF-16 and UTF-32 encoded
+    text without NUL characters.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object.
+
+    Returns:
+      bool: True if the file-like object contains binary data.
+    """
+    file_object.seek(0, os.SEEK_SET)
+    data = file_object.read(self._BINARY_DATA_CHECK_SIZE)
+    file_object.seek(0, os.SEEK_SET)
+
+    data_offset = data.find(b'\x00\x00\x00\x00')
+    while data_offset >= 0:
+      if data_offset % 4 == 0:
+        return True
+
+      data_offset = data.find(b'\x00\x00\x00\x00', data_offset + 1)
+
+    return False
+
   def _GetSignatureMatchParserNames(self, file_object):
     """Determines if a file-like object matches one of the known signatures.
 
@@ -203,6 +239,8 @@ class EventDataExtractor(object):
       result = self._PARSE_RESULT_UNSUPPORTED
 
     parser_mediator.SampleMemoryUsage(parser.NAME)
+    parser_mediator.SampleParserProbe(
+        parser.NAME, self._PARSE_RESULT_NAMES[result])
 
     return result
 
@@ -228,6 +266,9 @@ class EventDataExtractor(object):
     Raises:
       RuntimeError: if the parser object is missing.
     """
+    contains_binary_data = None
+    file_size = None
+
     parse_results = self._PARSE_RESULT_UNSUPPORTED
     for parser_name in parser_names:
       parser = self._parsers.get(parser_name, None)
@@ -240,6 +281,24 @@ class EventDataExtractor(object):
           parse_results = self._PARSE_RESULT_SUCCESS
           continue
 
+      # Skip file-like object parsers that cannot support the data stream
+      # without probing them, which is equivalent to them raising WrongParser.
+      if file_object and isinstance(
+          parser, parsers_interface.FileObjectParser):
+        if file_size is None:
+          file_size = file_object.get_size()
+
+        is_supported = file_size == 0 or parser.CheckFileSize(file_size)
+        if is_supported and parser.TEXT_BASED_FORMAT:
+          if contains_binary_data is None:
+            contains_binary_data = self._ContainsBinaryData(file_object)
+
+          is_supported = not contains_binary_data
+
+        if not is_supported:
+          parser_mediator.SampleParserProbe(parser_name, 'prefiltered')
+          continue
+
       display_name = parser_mediator.GetDisplayName(file_entry=file_entry)
       logger.debug((
           '[ParseFileEntryWithParsers] parsing file: {0:s} with parser: '
@@ -256,7 +315,8 @@ class EventDataExtractor(object):
 
     return parse_results
 
-  def ParseDataStream(self, parser_mediator, file_entry, data_stream_name):
+  def ParseDataStream(
+      self, parser_mediator, file_entry, data_stream_name, file_object=None):
     """Parses a data stream of a file entry with the enabled parsers.
 
     Args:
@@ -264,11 +324,15 @@ class EventDataExtractor(object):
           and other components, such as storage and dfVFS.
       file_entry (dfvfs.FileEntry): file entry.
       data_stream_name (str): data stream name.
+      file_object (Optional[file]): file-like object of the data stream, where
+          None indicates the file-like object should be retrieved from
+          the file entry.
 
     Raises:
       RuntimeError: if the file-like object or the parser object is missing.
     """
-    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+    if not file_object:
+      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
     if not file_object:
       raise RuntimeError(
           'Unable to retrieve file-like object from file entry.')
@@ -299,6 +363,38 @@ class EventDataExtractor(object):
           parser_mediator, self._usnjrnl_parser, file_entry,
           file_object=file_object)
 
+  def ParseDataStreamWithParser(
+      self, parser_mediator, parser_name, file_entry, data_stream_name,
+      file_object=None):
+    """Parses a data stream of a file entry with a specific parser.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      parser_name (str): name of the parser.
+      file_entry (dfvfs.FileEntry): file entry.
+      data_stream_name (str): data stream name.
+      file_object (Optional[file]): file-like object of the data stream, where
+          None indicates the file-like object should be retrieved from
+          the file entry.
+
+    Raises:
+      RuntimeError: if the file-like object or the parser object is missing.
+    """
+    parser = self._parsers.get(parser_name, None)
+    if not parser:
+      raise RuntimeError(
+          'Parser object missing for parser: {0:s}'.format(parser_name))
+
+    if not file_object:
+      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+    if not file_object:
+      raise RuntimeError(
+          'Unable to retrieve file-like object from file entry.')
+
+    self._ParseFileEntryWithParser(
+        parser_mediator, parser, file_entry, file_object=file_object)
+
   def ParseFileEntryMetadata(self, parser_mediator, file_entry):
     """Parses the file entry metadata such as file system data.
 
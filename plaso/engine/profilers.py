@@ -2,6 +2,7 @@
 """The profiler classes."""
 
 import codecs
+import collections
 import gzip
 import os
 import time
@@ -157,6 +158,64 @@ class AnalyzersProfiler(CPUTimeProfiler):
   _FILENAME_PREFIX = 'analyzers'
 
 
+class ParserProbesProfiler(SampleFileProfiler):
+  """The parser probes profiler.
+
+  The parser probes profiler counts the results of probing data streams with
+  individual parsers and writes the counts per parser when stopped.
+  """
+
+  _FILENAME_PREFIX = 'parser_probes'
+
+  _FILE_HEADER = 'Name\tPrefiltered\tUnsupported\tFailure\tSuccess\n'
+
+  _RESULTS = ('prefiltered', 'unsupported', 'failure', 'success')
+
+  def __init__(self, identifier, configuration):
+    """Initializes a parser probes profiler.
+
+    Args:
+      identifier (str): identifier of the profiling session used to create
+          the sample filename.
+      configuration (ProfilingConfiguration): profiling configuration.
+    """
+    super(ParserProbesProfiler, self).__init__(identifier, configuration)
+    self._results_per_profile_name = {}
+
+  def Sample(self, profile_name, result):
+    """Takes a sample for profiling.
+
+    Args:
+      profile_name (str): name of the profile to sample, such as the name of
+          the parser.
+      result (str): result of the probe, which is "prefiltered" when the
+          parser was skipped without probing, "unsupported" when the parser
+          raised WrongParser, "failure" or "success".
+
+    Raises:
+      ValueError: if the result is not supported.
+    """
+    if result not in self._RESULTS:
+      raise ValueError('Unsupported result: {0!s}'.format(result))
+
+    if profile_name not in self._results_per_profile_name:
+      self._results_per_profile_name[profile_name] = collections.Counter()
+
+    self._results_per_profile_name[profile_name][result] += 1
+
+  def Stop(self):
+    """Stops the profiler."""
+    for profile_name, results in sorted(
+        self._results_per_profile_name.items()):
+      sample = '{0:s}\t{1:d}\t{2:d}\t{3:d}\t{4:d}\n'.format(
+          profile_name, *[results[result] for result in self._RESULTS])
+      self._WritesString(sample)
+
+    self._results_per_profile_name = {}
+
+    super(ParserProbesProfiler, self).Stop()
+
+
 class ProcessingProfiler(CPUTimeProfiler):
   """The processing profiler."""
 
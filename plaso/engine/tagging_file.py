@@ -30,15 +30,12 @@ class TaggingFile(object):
     super(TaggingFile, self).__init__()
     self._path = path
 
-  def GetEventTaggingRules(self):
-    """Retrieves the event tagging rules from the tagging file.
+  def _ReadRulesPerLabel(self):
+    """Reads the event tagging rules per label from the tagging file.
 
     Returns:
-      dict[str, EventObjectFilter]: tagging rules, that consists of one or more
-          filter objects per label.
-
-    Raises:
-      TaggingFileError: if a filter expression cannot be compiled.
+      dict[str, list[str]]: filter expressions of the event tagging rules per
+          label.
     """
     rules_per_label = {}
 
@@ -62,6 +59,42 @@ class TaggingFile(object):
         elif label_name:
           rules_per_label[label_name].append(stripped_line)
 
+    return rules_per_label
+
+  def GetEventTaggingRuleSet(self):
+    """Retrieves the event tagging rules from the tagging file as a rule set.
+
+    Returns:
+      EventFilterRuleSet: event tagging rule set.
+
+    Raises:
+      TaggingFileError: if a filter expression cannot be compiled.
+    """
+    rule_set = event_filter.EventFilterRuleSet()
+
+    for label_name, rules in self._ReadRulesPerLabel().items():
+      for rule in rules:
+        try:
+          rule_set.AddRule(label_name, rule)
+        except errors.ParseError as exception:
+          raise errors.TaggingFileError((
+              'Unable to compile filter for label: {0:s} with error: '
+              '{1!s}').format(label_name, exception))
+
+    return rule_set
+
+  def GetEventTaggingRules(self):
+    """Retrieves the event tagging rules from the tagging file.
+
+    Returns:
+      dict[str, EventObjectFilter]: tagging rules, that consists of one or more
+          filter objects per label.
+
+    Raises:
+      TaggingFileError: if a filter expression cannot be compiled.
+    """
+    rules_per_label = self._ReadRulesPerLabel()
+
     filter_objects_per_label = {}
 
     for label_name, rules in rules_per_label.items():
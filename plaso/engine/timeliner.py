@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The timeliner, which is used to generate events from event data."""
 
+import bisect
 import collections
 import copy
 import datetime
@@ -27,6 +28,8 @@ class EventDataTimeliner(object):
 
   _DEFAULT_TIME_ZONE = pytz.UTC
 
+  _EPOCH = datetime.datetime(1970, 1, 1, 0, 0, 0, 0, tzinfo=None)
+
   _INT64_MIN = -1 << 63
   _INT64_MAX = (1 << 63) - 1
 
@@ -52,7 +55,9 @@ class EventDataTimeliner(object):
     self._place_holder_event = set()
     self._preferred_time_zone = None
     self._preferred_year = preferred_year
+    self._time_zone_per_hint = {}
     self._time_zone_per_path_spec = None
+    self._time_zone_transitions = {}
 
     self.number_of_produced_events = 0
     self.parsers_counter = collections.Counter()
@@ -75,6 +80,59 @@ class EventDataTimeliner(object):
             self._time_zone_per_path_spec[path_spec.parent] = (
                 system_configuration.time_zone)
 
+  def _CreateTimeZoneTransitions(self, time_zone):
+    """Creates the UTC offset transitions lookup table of a time zone.
+
+    Args:
+      time_zone (pytz.tzinfo.BaseTzInfo): time zone.
+
+    Returns:
+      tuple[list[int], list[int], list[int]]: local date and time, in number
+          of microseconds since January 1, 1970, 00:00:00, of the start and
+          end of every transition and UTC offset, in number of seconds, after
+          every transition. The first transition represents the UTC offset
+          before the actual transitions of the time zone.
+    """
+    utc_transition_times = getattr(time_zone, '_utc_transition_times', None)
+    transition_info = getattr(time_zone, '_transition_info', None)
+
+    if not utc_transition_times or not transition_info:
+      datetime_delta = time_zone.utcoffset(self._EPOCH)
+      return (
+          [self._INT64_MIN], [self._INT64_MIN],
+          [int(datetime_delta.total_seconds())])
+
+    previous_utc_offset = int(transition_info[0][0].total_seconds())
+
+    transition_starts = [self._INT64_MIN]
+    transition_ends = [self._INT64_MIN]
+    utc_offsets = [previous_utc_offset]
+
+    # Note that the first transition time of a pytz time zone is a placeholder
+    # for the UTC offset before the actual transitions.
+    for utc_transition_time, (datetime_delta, _, _) in zip(
+        utc_transition_times[1:], transition_info[1:]):
+      utc_offset = int(datetime_delta.total_seconds())
+
+      datetime_delta = utc_transition_time - self._EPOCH
+      timestamp = (
+          int(datetime_delta.total_seconds()) *
+          definitions.MICROSECONDS_PER_SECOND)
+
+      # Local date and time values between the start and the end of
+      # a transition are either ambiguous or do not exist.
+      transition_starts.append(timestamp + (
+          min(previous_utc_offset, utc_offset) *
+          definitions.MICROSECONDS_PER_SECOND))
+      transition_ends.append(timestamp + (
+          max(previous_utc_offset, utc_offset) *
+          definitions.MICROSECONDS_PER_SECOND))
+      utc_offsets.append(utc_offset)
+
+      previous_utc_offset = utc_offset
+
+    return transition_starts, transition_ends, utc_offsets
+
   def _GetBaseYear(self, storage_writer, event_data):
     """Retrieves the base year.
 
@@ -209,9 +267,8 @@ class EventDataTimeliner(object):
       if date_time.is_local_time:
         time_zone = None
         if date_time.time_zone_hint:
-          # TODO: cache time zones per hint.
           try:
-            time_zone = pytz.timezone(date_time.time_zone_hint)
+            time_zone = self._GetTimeZoneByHint(date_time.time_zone_hint)
           except pytz.UnknownTimeZoneError:
             message = (
                 'unsupported time zone hint: {0:s}, using default time '
@@ -230,16 +287,13 @@ class EventDataTimeliner(object):
         if not time_zone:
           time_zone = self._preferred_time_zone or self._DEFAULT_TIME_ZONE
 
-        date_time = copy.deepcopy(date_time)
+        # Note that the date and time values only contain immutable attribute
+        # values hence a shallow copy suffices.
+        date_time = copy.copy(date_time)
         date_time.is_local_time = False
 
         if time_zone != pytz.UTC:
-          datetime_object = datetime.datetime(
-              1970, 1, 1, 0, 0, 0, 0, tzinfo=None)
-          datetime_object += datetime.timedelta(microseconds=timestamp)
-
-          datetime_delta = time_zone.utcoffset(datetime_object, is_dst=False)
-          seconds_delta = int(datetime_delta.total_seconds())
+          seconds_delta = self._GetTimeZoneOffset(time_zone, timestamp)
           timestamp -= seconds_delta * definitions.MICROSECONDS_PER_SECOND
 
           date_time.time_zone_offset = seconds_delta // 60
@@ -254,6 +308,25 @@ class EventDataTimeliner(object):
 
     return event
 
+  def _GetTimeZoneByHint(self, time_zone_hint):
+    """Retrieves a time zone for a specific time zone hint.
+
+    Args:
+      time_zone_hint (str): time zone hint, such as "Europe/Amsterdam".
+
+    Returns:
+      pytz.tzfile: time zone.
+
+    Raises:
+      pytz.UnknownTimeZoneError: if the time zone is unknown.
+    """
+    time_zone = self._time_zone_per_hint.get(time_zone_hint, None)
+    if not time_zone:
+      time_zone = pytz.timezone(time_zone_hint)
+      self._time_zone_per_hint[time_zone_hint] = time_zone
+
+    return time_zone
+
   def _GetTimeZoneByPathSpec(self, path_spec):
     """Retrieves a time zone for a specific path specification.
 
@@ -283,6 +356,35 @@ class EventDataTimeliner(object):
 
     return time_zone
 
+  def _GetTimeZoneOffset(self, time_zone, timestamp):
+    """Retrieves the UTC offset of a time zone for a local date and time.
+
+    Args:
+      time_zone (pytz.tzinfo.BaseTzInfo): time zone.
+      timestamp (int): local date and time in number of microseconds since
+          January 1, 1970, 00:00:00.
+
+    Returns:
+      int: UTC offset in number of seconds.
+    """
+    transitions = self._time_zone_transitions.get(time_zone, None)
+    if not transitions:
+      transitions = self._CreateTimeZoneTransitions(time_zone)
+      self._time_zone_transitions[time_zone] = transitions
+
+    transition_starts, transition_ends, utc_offsets = transitions
+
+    transition_index = bisect.bisect_right(transition_starts, timestamp) - 1
+    if timestamp >= transition_ends[transition_index]:
+      return utc_offsets[transition_index]
+
+    # The local date and time is ambiguous or does not exist, hence pytz is
+    # used to determine the UTC offset.
+    datetime_object = self._EPOCH + datetime.timedelta(microseconds=timestamp)
+
+    datetime_delta = time_zone.utcoffset(datetime_object, is_dst=False)
+    return int(datetime_delta.total_seconds())
+
   def _ProduceTimeliningWarning(self, storage_writer, event_data, message):
     """Produces a timelining warning.
 
@@ -19,10 +19,12 @@ from plaso.analyzers import hashing_analyzer
 from plaso.analyzers import manager as analyzers_manager
 from plaso.containers import event_sources
 from plaso.containers import events
+from plaso.engine import cached_file_io
 from plaso.engine import extractors
 from plaso.engine import logger
 from plaso.lib import definitions
 from plaso.lib import errors
+from plaso.serializer import json_serializer
 
 
 class EventExtractionWorkerVolumeScanner(dfvfs_volume_scanner.VolumeScanner):
@@ -164,7 +166,8 @@ class EventExtractionWorker(object):
     self.processing_status = definitions.STATUS_INDICATOR_IDLE
 
   def _AnalyzeDataStream(
-      self, file_entry, data_stream_name, display_name, event_data_stream):
+      self, file_entry, data_stream_name, display_name, event_data_stream,
+      file_object=None):
     """Analyzes the contents of a specific data stream of a file entry.
 
     The results of the analyzers are set in the event data stream as
@@ -179,6 +182,9 @@ class EventExtractionWorker(object):
           currently being analyzed.
       event_data_stream (EventDataStream): event data stream attribute
            container.
+      file_object (Optional[file]): file-like object of the data stream, where
+          None indicates the file-like object should be retrieved from
+          the file entry.
 
     Raises:
       RuntimeError: if the file-like object cannot be retrieved from
@@ -191,7 +197,9 @@ class EventExtractionWorker(object):
       self._processing_profiler.StartTiming('analyzing')
 
     try:
-      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+      if not file_object:
+        file_object = file_entry.GetFileObject(
+            data_stream_name=data_stream_name)
       if not file_object:
         raise RuntimeError((
             'Unable to retrieve file-like object for file entry: '
@@ -428,7 +436,7 @@ class EventExtractionWorker(object):
     return scanner_object
 
   def _ExtractContentFromDataStream(
-      self, parser_mediator, file_entry, data_stream_name):
+      self, parser_mediator, file_entry, data_stream_name, file_object=None):
     """Extracts content from a data stream.
 
     Args:
@@ -437,6 +445,9 @@ class EventExtractionWorker(object):
       file_entry (dfvfs.FileEntry): file entry to extract its content.
       data_stream_name (str): name of the data stream whose content is to be
           extracted.
+      file_object (Optional[file]): file-like object of the data stream, where
+          None indicates the file-like object should be retrieved from
+          the file entry.
     """
     self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
 
@@ -444,7 +455,7 @@ class EventExtractionWorker(object):
       self._processing_profiler.StartTiming('extracting')
 
     self._event_data_extractor.ParseDataStream(
-        parser_mediator, file_entry, data_stream_name)
+        parser_mediator, file_entry, data_stream_name, file_object=file_object)
 
     if self._processing_profiler:
       self._processing_profiler.StopTiming('extracting')
@@ -493,6 +504,27 @@ class EventExtractionWorker(object):
 
     self.processing_status = definitions.STATUS_INDICATOR_RUNNING
 
+  def _GetCachedFileObject(self, file_entry, data_stream_name):
+    """Retrieves a cached file-like object of a data stream.
+
+    The cached file-like object is shared by the analyzers, the archive type
+    scanner, the signature scanner and the parsers, so that the data of
+    the data stream is only read once.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry containing the data stream.
+      data_stream_name (str): name of the data stream.
+
+    Returns:
+      CachedFileIO: cached file-like object or None if the file-like object
+          cannot be retrieved from the file entry.
+    """
+    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+    if not file_object:
+      return None
+
+    return cached_file_io.CachedFileIO(file_object)
+
   def _GetCompressedStreamTypes(self, parser_mediator, path_spec):
     """Determines if a data stream contains a compressed stream such as: gzip.
 
@@ -725,6 +757,10 @@ class EventExtractionWorker(object):
         if not sub_file_entry.IsAllocated():
           continue
 
+        file_size = None
+        if sub_file_entry.IsFile():
+          file_size = sub_file_entry.size
+
       except dfvfs_errors.BackEndError as exception:
         warning_message = (
             'unable to process directory entry: {0:s} with error: '
@@ -740,7 +776,7 @@ class EventExtractionWorker(object):
           continue
 
       event_source = event_sources.FileEntryEventSource(
-          file_entry_type=sub_file_entry.entry_type,
+          file_entry_type=sub_file_entry.entry_type, file_size=file_size,
           path_spec=sub_file_entry.path_spec)
 
       parser_mediator.ProduceEventSource(event_source)
@@ -811,6 +847,7 @@ class EventExtractionWorker(object):
         'file entry: {1:s}').format(data_stream_name, display_name))
 
     event_data_stream = None
+    file_object = None
     if data_stream:
       display_name = parser_mediator.GetDisplayName()
 
@@ -824,8 +861,10 @@ class EventExtractionWorker(object):
       if self._analyzers:
         # Since AnalyzeDataStream generates event data stream attributes it
         # needs to be called before producing events.
+        file_object = self._GetCachedFileObject(file_entry, data_stream.name)
         self._AnalyzeDataStream(
-            file_entry, data_stream.name, display_name, event_data_stream)
+            file_entry, data_stream.name, display_name, event_data_stream,
+            file_object=file_object)
 
     parser_mediator.ProduceEventDataStream(event_data_stream)
 
@@ -861,9 +900,12 @@ class EventExtractionWorker(object):
     else:
       results = []
       try:
-        file_object = file_entry.GetFileObject(
-            data_stream_name=data_stream_name)
+        if not file_object:
+          file_object = self._GetCachedFileObject(
+              file_entry, data_stream_name)
         if file_object:
+          file_object.seek(0, os.SEEK_SET)
+
           scan_state = pysigscan.scan_state()
           self._achive_type_scanner.scan_file_object(scan_state, file_object)
           results = [scan_result.identifier
@@ -895,7 +937,8 @@ class EventExtractionWorker(object):
 
         # Note that ZIP is also a compound format.
         self._ExtractContentFromDataStream(
-            parser_mediator, file_entry, data_stream.name)
+            parser_mediator, file_entry, data_stream.name,
+            file_object=file_object)
 
       else:
         if len(results) > 1:
@@ -905,7 +948,8 @@ class EventExtractionWorker(object):
               '{1:s}').format(results, display_name))
 
         self._ExtractContentFromDataStream(
-             parser_mediator, file_entry, data_stream.name)
+             parser_mediator, file_entry, data_stream.name,
+             file_object=file_object)
 
   def _ProcessMetadataFile(self, parser_mediator, file_entry):
     """Processes a metadata file.
@@ -1035,6 +1079,88 @@ class EventExtractionWorker(object):
 
     self.ProcessFileEntry(parser_mediator, file_entry)
 
+  def ProcessRecordRange(
+      self, parser_mediator, path_spec, parser_name, first_record_index,
+      number_of_records, event_data_stream_values=None):
+    """Processes a record range of a data stream.
+
+    A record range is produced by a parser that split the records of a large
+    file into ranges that are parsed by different tasks. Only the parser that
+    produced the record range is used and the file entry metadata is not
+    extracted, since this was done when the file was first processed. The
+    data stream is not analyzed again, instead the attribute values of
+    the event data stream of the task that split the file are used.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      path_spec (dfvfs.PathSpec): path specification of the data stream.
+      parser_name (str): name of the parser to parse the record range with.
+      first_record_index (int): index of the first record to parse.
+      number_of_records (int): number of records to parse.
+      event_data_stream_values (Optional[str]): JSON serialized event data
+          stream, where None indicates the data stream should be analyzed.
+    """
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=parser_mediator.resolver_context)
+
+    if file_entry is None:
+      display_name = parser_mediator.GetDisplayNameForPathSpec(path_spec)
+      logger.warning('Unable to open file entry: {0:s}'.format(display_name))
+      self.processing_status = definitions.STATUS_INDICATOR_IDLE
+      return
+
+    self.last_activity_timestamp = time.time()
+    self.processing_status = definitions.STATUS_INDICATOR_RUNNING
+
+    parser_mediator.SetFileEntry(file_entry)
+    parser_mediator.SetRecordRange(first_record_index, number_of_records)
+
+    try:
+      data_stream_name = getattr(path_spec, 'data_stream', None) or ''
+      file_object = self._GetCachedFileObject(file_entry, data_stream_name)
+
+      if event_data_stream_values is not None:
+        # The event data stream attributes need to be the same as those of
+        # the other record ranges for the event values hashes to match.
+        event_data_stream = (
+            json_serializer.JSONAttributeContainerSerializer.ReadSerialized(
+                event_data_stream_values))
+
+      else:
+        event_data_stream = events.EventDataStream()
+
+        if self._analyzers:
+          display_name = parser_mediator.GetDisplayName()
+          self._AnalyzeDataStream(
+              file_entry, data_stream_name, display_name, event_data_stream,
+              file_object=file_object)
+
+      event_data_stream.path_spec = path_spec
+
+      parser_mediator.ProduceEventDataStream(event_data_stream)
+
+      self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
+
+      if self._processing_profiler:
+        self._processing_profiler.StartTiming('extracting')
+
+      try:
+        self._event_data_extractor.ParseDataStreamWithParser(
+            parser_mediator, parser_name, file_entry, data_stream_name,
+            file_object=file_object)
+
+      finally:
+        if self._processing_profiler:
+          self._processing_profiler.StopTiming('extracting')
+
+    finally:
+      parser_mediator.ResetRecordRange()
+      parser_mediator.ResetFileEntry()
+
+      self.last_activity_timestamp = time.time()
+      self.processing_status = definitions.STATUS_INDICATOR_IDLE
+
   # TODO: move the functionality of this method into the constructor.
   def SetExtractionConfiguration(self, configuration):
     """Sets the extraction configuration settings.
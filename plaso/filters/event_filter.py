@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 """The event filter."""
 
+import collections
+
 from plaso.filters import expression_parser
+from plaso.filters import filters
 
 
 class EventObjectFilter(object):
@@ -12,11 +15,27 @@ class EventObjectFilter(object):
     super(EventObjectFilter, self).__init__()
     self._event_filter = None
     self._filter_expression = None
+    self._match_function = None
+
+  def __getstate__(self):
+    """Retrieves the state of the event filter for pickling.
+
+    The match function is a closure that cannot be pickled and is recreated
+    on first use.
+
+    Returns:
+      dict[str, object]: state of the event filter.
+    """
+    state = dict(self.__dict__)
+    state['_match_function'] = None
+    return state
 
   def CompileFilter(self, filter_expression):
     """Compiles the filter expression.
 
-    The filter expression contains an object filter expression.
+    The filter expression contains an object filter expression. The filter
+    is compiled into a match function, that is specialized for the filter,
+    on first use.
 
     Args:
       filter_expression (str): filter expression.
@@ -29,6 +48,27 @@ class EventObjectFilter(object):
 
     self._event_filter = expression.Compile()
     self._filter_expression = filter_expression
+    self._match_function = None
+
+  def GetSQLFilterExpression(self, column_names):
+    """Retrieves a SQL filter expression that corresponds to the filter.
+
+    The SQL filter expression can select more events than the filter, hence
+    the selected events still need to be matched against the filter.
+
+    Args:
+      column_names (dict[str, str]): SQL column names per attribute name
+          that can be used in the SQL filter expression.
+
+    Returns:
+      tuple[str, list[object]]: SQL filter expression and values of its
+          parameters, or None and None if the filter cannot be expressed
+          in SQL.
+    """
+    if not self._event_filter:
+      return None, None
+
+    return self._event_filter.GetSQLFilterExpression(column_names)
 
   def Match(self, event, event_data, event_data_stream, event_tag):
     """Determines if an event matches the filter.
@@ -45,5 +85,255 @@ class EventObjectFilter(object):
     if not self._event_filter:
       return True
 
-    return self._event_filter.Matches(
+    if not self._match_function:
+      self._match_function = self._event_filter.GetMatchFunction()
+
+    return self._match_function(
         event, event_data, event_data_stream, event_tag)
+
+
+class EventFilterRuleSet(object):
+  """Event filter rule set.
+
+  The rule set determines which labels of multiple event filter rules match
+  an event. Rules that require a specific data type are only evaluated for
+  events with that data type and costly operators that are shared by
+  multiple rules are evaluated once per event.
+
+  The match functions of the rules are created on first use, since they
+  are closures that cannot be pickled.
+  """
+
+  def __init__(self):
+    """Initializes an event filter rule set."""
+    super(EventFilterRuleSet, self).__init__()
+    self._evaluation_cache = {}
+    self._label_indexes = {}
+    self._label_names = []
+    self._match_functions_per_data_type = None
+    self._match_functions_without_data_type = None
+    self._rules_per_data_type = collections.defaultdict(list)
+    self._rules_without_data_type = []
+    self._shared_match_functions = {}
+
+  def __getstate__(self):
+    """Retrieves the state of the rule set for pickling.
+
+    Returns:
+      dict[str, object]: state of the rule set without the match functions.
+    """
+    state = dict(self.__dict__)
+    state['_evaluation_cache'] = {}
+    state['_match_functions_per_data_type'] = None
+    state['_match_functions_without_data_type'] = None
+    state['_shared_match_functions'] = {}
+    return state
+
+  def _CreateMatchFunctions(self):
+    """Creates the match functions of the rules."""
+    self._shared_match_functions = {}
+
+    self._match_functions_per_data_type = {
+        data_type: self._GetRuleMatchFunctions(rules)
+        for data_type, rules in self._rules_per_data_type.items()}
+    self._match_functions_without_data_type = self._GetRuleMatchFunctions(
+        self._rules_without_data_type)
+
+  def _GetArguments(self, filter_object, filter_class):
+    """Retrieves the arguments of nested filters of a specific class.
+
+    Args:
+      filter_object (Filter): filter.
+      filter_class (type): filter class, such as AndFilter or OrFilter.
+
+    Returns:
+      list[Filter]: arguments of the filter and its nested filters of
+          the filter class or the filter itself if not of the filter class.
+    """
+    if not isinstance(filter_object, filter_class) or not filter_object.args:
+      return [filter_object]
+
+    arguments = []
+    for argument in filter_object.args:
+      arguments.extend(self._GetArguments(argument, filter_class))
+
+    return arguments
+
+  def _GetDataType(self, filter_object):
+    """Retrieves the data type that a filter requires.
+
+    Args:
+      filter_object (Filter): filter.
+
+    Returns:
+      str: data type or None if the filter does not require a data type.
+    """
+    if (isinstance(filter_object, filters.EqualsOperator) and
+        filter_object.left_operand == 'data_type' and
+        not filter_object.IsNegated() and
+        isinstance(filter_object.right_operand, str)):
+      return filter_object.right_operand or None
+
+    return None
+
+  def _GetMatchFunction(self, filter_object):
+    """Retrieves a match function of a filter.
+
+    The results of the match functions of costly operators are cached per
+    event, so that operators shared by multiple rules are evaluated once.
+
+    Args:
+      filter_object (Filter): filter.
+
+    Returns:
+      function: function that determines if the event, data and tag match
+          the filter.
+    """
+    evaluation_key = None
+    if (isinstance(filter_object, filters.GenericBinaryOperator) and
+        filter_object.GetEvaluationCost() > 1):
+      evaluation_key = filter_object.GetEvaluationKey()
+
+    if not evaluation_key:
+      return filter_object.GetMatchFunction()
+
+    shared_match_function = self._shared_match_functions.get(
+        evaluation_key, None)
+    if not shared_match_function:
+      match_function = filter_object.GetMatchFunction()
+
+      def _MatchesShared(event, event_data, event_data_stream, event_tag):
+        result = self._evaluation_cache.get(evaluation_key, None)
+        if result is None:
+          result = match_function(
+              event, event_data, event_data_stream, event_tag)
+          self._evaluation_cache[evaluation_key] = result
+        return result
+
+      shared_match_function = _MatchesShared
+      self._shared_match_functions[evaluation_key] = shared_match_function
+
+    return shared_match_function
+
+  def _GetRuleMatchFunction(self, filter_objects):
+    """Retrieves a match function of the filters of a rule.
+
+    Args:
+      filter_objects (list[Filter]): filters that all need to match.
+
+    Returns:
+      function: function that determines if the event, data and tag match
+          all the filters.
+    """
+    filter_objects = sorted(
+        filter_objects, key=lambda filter_object: (
+            filter_object.GetEvaluationCost()))
+    match_functions = [
+        self._GetMatchFunction(filter_object)
+        for filter_object in filter_objects]
+
+    if len(match_functions) == 1:
+      return match_functions[0]
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      for match_function in match_functions:
+        if not match_function(event, event_data, event_data_stream, event_tag):
+          return False
+      return True
+
+    return _Matches
+
+  def _GetRuleMatchFunctions(self, rules):
+    """Retrieves the match functions of rules.
+
+    Args:
+      rules (list[tuple[int, list[Filter]]]): label index and filters of
+          the rules, where the filters are None if the rule always matches.
+
+    Returns:
+      list[tuple[int, function]]: label index and match function of the rules,
+          where the match function is None if the rule always matches.
+    """
+    return [
+        (label_index, self._GetRuleMatchFunction(rule_filters)
+         if rule_filters else None)
+        for label_index, rule_filters in rules]
+
+  def AddRule(self, label_name, filter_expression):
+    """Adds a rule.
+
+    Args:
+      label_name (str): name of the label of the event when the rule matches.
+      filter_expression (str): filter expression of the rule.
+
+    Raises:
+      ParseError: if the filter expression cannot be parsed.
+    """
+    parser = expression_parser.EventFilterExpressionParser()
+    expression = parser.Parse(filter_expression)
+    filter_object = expression.Compile()
+
+    label_index = self._label_indexes.get(label_name, None)
+    if label_index is None:
+      label_index = len(self._label_names)
+      self._label_indexes[label_name] = label_index
+      self._label_names.append(label_name)
+
+    for rule_filter in self._GetArguments(filter_object, filters.OrFilter):
+      rule_filters = self._GetArguments(rule_filter, filters.AndFilter)
+
+      data_type = None
+      for index, sub_filter in enumerate(rule_filters):
+        data_type = self._GetDataType(sub_filter)
+        if data_type:
+          # The data type is matched by the rule set and is therefore not
+          # evaluated by the match function of the rule.
+          del rule_filters[index]
+          break
+
+      if data_type:
+        self._rules_per_data_type[data_type].append(
+            (label_index, rule_filters or None))
+      else:
+        self._rules_without_data_type.append(
+            (label_index, rule_filters or None))
+
+    self._match_functions_per_data_type = None
+    self._match_functions_without_data_type = None
+
+  def GetMatchingLabels(self, event, event_data, event_data_stream, event_tag):
+    """Determines the labels of the rules that match an event.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+      event_tag (EventTag): event tag.
+
+    Returns:
+      list[str]: names of the labels of the rules that match the event, in
+          the order the labels were added.
+    """
+    if self._match_functions_per_data_type is None:
+      self._CreateMatchFunctions()
+
+    self._evaluation_cache = {}
+
+    data_type = getattr(event_data, 'data_type', None)
+    rules_per_data_type = self._match_functions_per_data_type.get(
+        data_type, [])
+
+    matched_label_indexes = set()
+    for rules in (
+        rules_per_data_type, self._match_functions_without_data_type):
+      for label_index, match_function in rules:
+        if label_index in matched_label_indexes:
+          continue
+
+        if not match_function or match_function(
+            event, event_data, event_data_stream, event_tag):
+          matched_label_indexes.add(label_index)
+
+    return [
+        self._label_names[label_index]
+        for label_index in sorted(matched_label_indexes)]
@@ -8,6 +8,7 @@ import re
 from dfdatetime import interface as dfdatetime_interface
 
 from plaso.containers import artifacts
+from plaso.containers import events
 from plaso.filters import logger
 from plaso.filters import value_types
 from plaso.lib import errors
@@ -53,6 +54,46 @@ class Filter(object):
       return codecs.decode(value, 'utf8', 'ignore')
     return value
 
+  def GetEvaluationCost(self):
+    """Retrieves the relative cost of evaluating the filter.
+
+    Returns:
+      int: relative cost of evaluating the filter.
+    """
+    return 1
+
+  def GetMatchFunction(self):
+    """Retrieves a function that determines if an event matches the filter.
+
+    The match function is specialized for the filter, such that values that
+    do not depend on the event are determined once, instead of every time
+    the filter is matched against an event.
+
+    Returns:
+      function: function that determines if the event, data and tag match
+          the filter, that has the same arguments and return value as
+          Matches.
+    """
+    return self.Matches
+
+  def GetSQLFilterExpression(self, column_names):
+    """Retrieves a SQL filter expression that corresponds to the filter.
+
+    The SQL filter expression allows the storage to select events without
+    deserializing them. It can select more events than the filter, hence
+    the selected events still need to be matched against the filter.
+
+    Args:
+      column_names (dict[str, str]): SQL column names per attribute name
+          that can be used in the SQL filter expression.
+
+    Returns:
+      tuple[str, list[object]]: SQL filter expression and values of its
+          parameters, or None and None if the filter cannot be expressed
+          in SQL.
+    """
+    return None, None
+
   @abc.abstractmethod
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
@@ -74,6 +115,71 @@ class AndFilter(Filter):
   Note that if no conditions are passed, all objects will pass.
   """
 
+  def GetEvaluationCost(self):
+    """Retrieves the relative cost of evaluating the filter.
+
+    Returns:
+      int: relative cost of evaluating the filter.
+    """
+    return sum(sub_filter.GetEvaluationCost() for sub_filter in self.args)
+
+  def GetMatchFunction(self):
+    """Retrieves a function that determines if an event matches the filter.
+
+    The arguments are evaluated in order of their relative cost, so that
+    the least costly arguments can short-circuit the evaluation.
+
+    Returns:
+      function: function that determines if the event, data and tag match
+          the filter, that has the same arguments and return value as
+          Matches.
+    """
+    sub_filters = sorted(
+        self.args, key=lambda sub_filter: sub_filter.GetEvaluationCost())
+    match_functions = [
+        sub_filter.GetMatchFunction() for sub_filter in sub_filters]
+
+    if len(match_functions) == 1:
+      return match_functions[0]
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      for match_function in match_functions:
+        if not match_function(event, event_data, event_data_stream, event_tag):
+          return False
+      return True
+
+    return _Matches
+
+  def GetSQLFilterExpression(self, column_names):
+    """Retrieves a SQL filter expression that corresponds to the filter.
+
+    Arguments that cannot be expressed in SQL are omitted, since these only
+    make the filter more strict.
+
+    Args:
+      column_names (dict[str, str]): SQL column names per attribute name
+          that can be used in the SQL filter expression.
+
+    Returns:
+      tuple[str, list[object]]: SQL filter expression and values of its
+          parameters, or None and None if the filter cannot be expressed
+          in SQL.
+    """
+    sql_filter_expressions = []
+    sql_parameters = []
+    for sub_filter in self.args:
+      sql_filter_expression, sub_filter_sql_parameters = (
+          sub_filter.GetSQLFilterExpression(column_names))
+      if sql_filter_expression:
+        sql_filter_expressions.append(
+            '({0:s})'.format(sql_filter_expression))
+        sql_parameters.extend(sub_filter_sql_parameters)
+
+    if not sql_filter_expressions:
+      return None, None
+
+    return ' AND '.join(sql_filter_expressions), sql_parameters
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -100,6 +206,72 @@ class OrFilter(Filter):
   Note that if no conditions are passed, all objects will pass.
   """
 
+  def GetEvaluationCost(self):
+    """Retrieves the relative cost of evaluating the filter.
+
+    Returns:
+      int: relative cost of evaluating the filter.
+    """
+    return sum(sub_filter.GetEvaluationCost() for sub_filter in self.args)
+
+  def GetMatchFunction(self):
+    """Retrieves a function that determines if an event matches the filter.
+
+    The arguments are evaluated in order of their relative cost, so that
+    the least costly arguments can short-circuit the evaluation.
+
+    Returns:
+      function: function that determines if the event, data and tag match
+          the filter, that has the same arguments and return value as
+          Matches.
+    """
+    sub_filters = sorted(
+        self.args, key=lambda sub_filter: sub_filter.GetEvaluationCost())
+    match_functions = [
+        sub_filter.GetMatchFunction() for sub_filter in sub_filters]
+
+    if not match_functions:
+      return self.Matches
+
+    if len(match_functions) == 1:
+      return match_functions[0]
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      for match_function in match_functions:
+        if match_function(event, event_data, event_data_stream, event_tag):
+          return True
+      return False
+
+    return _Matches
+
+  def GetSQLFilterExpression(self, column_names):
+    """Retrieves a SQL filter expression that corresponds to the filter.
+
+    Args:
+      column_names (dict[str, str]): SQL column names per attribute name
+          that can be used in the SQL filter expression.
+
+    Returns:
+      tuple[str, list[object]]: SQL filter expression and values of its
+          parameters, or None and None if the filter cannot be expressed
+          in SQL.
+    """
+    sql_filter_expressions = []
+    sql_parameters = []
+    for sub_filter in self.args:
+      sql_filter_expression, sub_filter_sql_parameters = (
+          sub_filter.GetSQLFilterExpression(column_names))
+      if not sql_filter_expression:
+        return None, None
+
+      sql_filter_expressions.append('({0:s})'.format(sql_filter_expression))
+      sql_parameters.extend(sub_filter_sql_parameters)
+
+    if not sql_filter_expressions:
+      return None, None
+
+    return ' OR '.join(sql_filter_expressions), sql_parameters
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -211,6 +383,10 @@ class GenericBinaryOperator(BinaryOperator):
       'message', 'parser', 'source', 'source_long', 'source_short',
       'sourcetype'])
 
+  # SQL comparison operator that corresponds to the operator or None if
+  # not supported.
+  _SQL_OPERATOR = None
+
   def __init__(self, arguments=None, **kwargs):
     """Initializes a generic binary operator.
 
@@ -232,6 +408,51 @@ class GenericBinaryOperator(BinaryOperator):
       bool: True if the values match according to the operator, False otherwise.
     """
 
+  def _GetSQLFilterExpression(self, column_name, sql_value):
+    """Retrieves a SQL filter expression that corresponds to the operator.
+
+    Args:
+      column_name (str): SQL column name of the left operand.
+      sql_value (str): SQL literal of the right operand.
+
+    Returns:
+      str: SQL filter expression or None if the operator cannot be expressed
+          in SQL.
+    """
+    if not self._SQL_OPERATOR:
+      return None
+
+    return '{0:s} {1:s} {2:s}'.format(
+        column_name, self._SQL_OPERATOR, sql_value)
+
+  def _GetSQLValue(self):
+    """Retrieves the right operand as a SQL literal.
+
+    Date and time values are converted to a timestamp in number of
+    microseconds since January 1, 1970 00:00:00 UTC, as stored in
+    the timestamp column.
+
+    Returns:
+      str: SQL literal or None if the right operand cannot be expressed in
+          SQL.
+    """
+    if self.left_operand == 'timestamp':
+      if not isinstance(
+          self.right_operand, dfdatetime_interface.DateTimeValues):
+        return None
+
+      timestamp = self.right_operand.GetPlasoTimestamp()
+      if timestamp is None:
+        return None
+
+      return '{0:d}'.format(timestamp)
+
+    # Only string values are supported to prevent type conversion by SQLite.
+    if not isinstance(self.right_operand, str) or '\x00' in self.right_operand:
+      return None
+
+    return '\'{0:s}\''.format(self.right_operand.replace('\'', '\'\''))
+
   def _GetValue(
       self, attribute_name, event, event_data, event_data_stream, event_tag):
     """Retrieves the value of a specific event, data or tag attribute.
@@ -275,11 +496,163 @@ class GenericBinaryOperator(BinaryOperator):
 
     return attribute_value
 
+  def _GetValueFunction(self):
+    """Retrieves a function that retrieves the value of the left operand.
+
+    The source of the attribute value is determined once, where _GetValue
+    determines it for every event.
+
+    Returns:
+      function: function that retrieves the attribute value from the event,
+          data, data stream and tag, that has the same arguments and return
+          value as _GetValue without the attribute name.
+    """
+    attribute_name = self.left_operand
+
+    if attribute_name in self._UNSUPPORTED_ATTRIBUTE_NAMES:
+      logger.warning(
+          'Expansion of {0:s} in event filter no longer supported'.format(
+              attribute_name))
+
+    # pylint: disable=unused-argument
+    if attribute_name in self._EVENT_ATTRIBUTE_NAMES:
+      def _GetEventValue(event, event_data, event_data_stream, event_tag):
+        return self._GetValue(attribute_name, event, None, None, None)
+
+      return _GetEventValue
+
+    event_data_stream_attribute_names = frozenset(
+        events.EventDataStream().GetAttributeNames())
+
+    if attribute_name in event_data_stream_attribute_names:
+      def _GetEventDataStreamValue(
+          event, event_data, event_data_stream, event_tag):
+        if event_data_stream:
+          return getattr(event_data_stream, attribute_name, None)
+        return getattr(event_data, attribute_name, None)
+
+      return _GetEventDataStreamValue
+
+    if attribute_name == 'tag':
+      def _GetEventTagValue(event, event_data, event_data_stream, event_tag):
+        return getattr(event_tag, 'labels', None)
+
+      return _GetEventTagValue
+
+    def _GetEventDataValue(event, event_data, event_data_stream, event_tag):
+      return getattr(event_data, attribute_name, None)
+
+    return _GetEventDataValue
+
   def FlipBool(self):
     """Negates the internal boolean value attribute."""
     logger.debug('Negative matching.')
     self._bool_value = not self._bool_value
 
+  def GetEvaluationKey(self):
+    """Retrieves a key that identifies the evaluation of the operator.
+
+    Operators with the same evaluation key match the same events.
+
+    Returns:
+      tuple: evaluation key or None if the right operand is not a string
+          or integer.
+    """
+    if not isinstance(self.right_operand, (int, str)):
+      return None
+
+    return (
+        self.__class__.__name__, self.left_operand, self.right_operand,
+        self._bool_value)
+
+  def GetMatchFunction(self):
+    """Retrieves a function that determines if an event matches the filter.
+
+    Date and time values of comparison operators on the timestamp are
+    converted once to a timestamp in number of microseconds since
+    January 1, 1970 00:00:00 UTC, so that they can be compared against
+    the timestamp of the event without conversion.
+
+    Returns:
+      function: function that determines if the event, data and tag match
+          the filter, that has the same arguments and return value as
+          Matches.
+    """
+    # pylint: disable=unused-argument
+    bool_value = self._bool_value
+    compare_function = self._CompareValue
+    filter_value = self.right_operand
+
+    # Operators that have a SQL comparison operator compare values by order
+    # or equality, which is the same for timestamps and date time values.
+    if (self.left_operand == 'timestamp' and self._SQL_OPERATOR and
+        isinstance(filter_value, dfdatetime_interface.DateTimeValues)):
+      timestamp = filter_value.GetPlasoTimestamp()
+      if timestamp is not None:
+        def _MatchesTimestamp(event, event_data, event_data_stream, event_tag):
+          event_timestamp = event.timestamp
+          if isinstance(event_timestamp, dfdatetime_interface.DateTimeValues):
+            event_timestamp = event_timestamp.GetPlasoTimestamp()
+
+          if event_timestamp is not None and compare_function(
+              event_timestamp, timestamp):
+            return bool_value
+          return not bool_value
+
+        return _MatchesTimestamp
+
+    get_value_function = self._GetValueFunction()
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      value = get_value_function(
+          event, event_data, event_data_stream, event_tag)
+
+      if value and compare_function(value, filter_value):
+        return bool_value
+      return not bool_value
+
+    return _Matches
+
+  def GetSQLFilterExpression(self, column_names):
+    """Retrieves a SQL filter expression that corresponds to the filter.
+
+    Args:
+      column_names (dict[str, str]): SQL column names per attribute name
+          that can be used in the SQL filter expression.
+
+    Returns:
+      tuple[str, list[object]]: SQL filter expression and values of its
+          parameters, or None and None if the filter cannot be expressed
+          in SQL.
+    """
+    # A negated operator also matches events without the attribute value,
+    # which is not expressed in SQL.
+    if not self._bool_value:
+      return None, None
+
+    column_name = column_names.get(self.left_operand, None)
+    if not column_name:
+      return None, None
+
+    sql_value = self._GetSQLValue()
+    if sql_value is None:
+      return None, None
+
+    sql_filter_expression = self._GetSQLFilterExpression(
+        column_name, sql_value)
+    if not sql_filter_expression:
+      return None, None
+
+    return sql_filter_expression, []
+
+  def IsNegated(self):
+    """Determines if the operator is negated.
+
+    Returns:
+      bool: True if the operator is negated.
+    """
+    return not self._bool_value
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -303,6 +676,8 @@ class GenericBinaryOperator(BinaryOperator):
 class EqualsOperator(GenericBinaryOperator):
   """Equals (==) operator."""
 
+  _SQL_OPERATOR = '='
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if two values are equal.
 
@@ -319,6 +694,8 @@ class EqualsOperator(GenericBinaryOperator):
 class NotEqualsOperator(GenericBinaryOperator):
   """Not equals (!=) operator."""
 
+  _SQL_OPERATOR = '!='
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if two values are not equal.
 
@@ -335,6 +712,8 @@ class NotEqualsOperator(GenericBinaryOperator):
 class LessThanOperator(GenericBinaryOperator):
   """Less than (<) operator."""
 
+  _SQL_OPERATOR = '<'
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is less than the second.
 
@@ -351,6 +730,8 @@ class LessThanOperator(GenericBinaryOperator):
 class LessEqualOperator(GenericBinaryOperator):
   """Less than or equals (<=) operator."""
 
+  _SQL_OPERATOR = '<='
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is less than or equals the second.
 
@@ -368,6 +749,8 @@ class LessEqualOperator(GenericBinaryOperator):
 class GreaterThanOperator(GenericBinaryOperator):
   """Greater than (>) operator."""
 
+  _SQL_OPERATOR = '>'
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is greater than the second.
 
@@ -384,6 +767,8 @@ class GreaterThanOperator(GenericBinaryOperator):
 class GreaterEqualOperator(GenericBinaryOperator):
   """Greater than or equals (>=) operator."""
 
+  _SQL_OPERATOR = '>='
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is greater than or equals the second.
 
@@ -425,6 +810,34 @@ class Contains(GenericBinaryOperator):
     except (AttributeError, TypeError):
       return False
 
+  def _GetSQLFilterExpression(self, column_name, sql_value):
+    """Retrieves a SQL filter expression that corresponds to the operator.
+
+    Note that SQLite only supports case insensitive comparison of ASCII
+    characters.
+
+    Args:
+      column_name (str): SQL column name of the left operand.
+      sql_value (str): SQL literal of the right operand.
+
+    Returns:
+      str: SQL filter expression or None if the operator cannot be expressed
+          in SQL.
+    """
+    if self.left_operand == 'timestamp' or not self.right_operand.isascii():
+      return None
+
+    return 'INSTR(LOWER({0:s}), LOWER({1:s})) > 0'.format(
+        column_name, sql_value)
+
+  def GetEvaluationCost(self):
+    """Retrieves the relative cost of evaluating the filter.
+
+    Returns:
+      int: relative cost of evaluating the filter.
+    """
+    return 2
+
 
 # TODO: Change to an N-ary Operator?
 class InSet(GenericBinaryOperator):
@@ -459,6 +872,67 @@ class InSet(GenericBinaryOperator):
     except TypeError:
       return False
 
+  def _GetSQLFilterExpression(self, column_name, sql_value):
+    """Retrieves a SQL filter expression that corresponds to the operator.
+
+    Args:
+      column_name (str): SQL column name of the left operand.
+      sql_value (str): SQL literal of the right operand.
+
+    Returns:
+      str: SQL filter expression or None if the operator cannot be expressed
+          in SQL.
+    """
+    if self.left_operand == 'timestamp':
+      return None
+
+    return 'INSTR({0:s}, {1:s}) > 0'.format(sql_value, column_name)
+
+  def GetEvaluationCost(self):
+    """Retrieves the relative cost of evaluating the filter.
+
+    Returns:
+      int: relative cost of evaluating the filter.
+    """
+    return 2
+
+  def GetSQLFilterExpression(self, column_names):
+    """Retrieves a SQL filter expression that corresponds to the filter.
+
+    A right operand that is a sequence of strings is expressed as an IN
+    expression with a parameter per string.
+
+    Args:
+      column_names (dict[str, str]): SQL column names per attribute name
+          that can be used in the SQL filter expression.
+
+    Returns:
+      tuple[str, list[object]]: SQL filter expression and values of its
+          parameters, or None and None if the filter cannot be expressed
+          in SQL.
+    """
+    if not isinstance(self.right_operand, (frozenset, list, set, tuple)):
+      return super(InSet, self).GetSQLFilterExpression(column_names)
+
+    if not self._bool_value or self.left_operand == 'timestamp':
+      return None, None
+
+    column_name = column_names.get(self.left_operand, None)
+    if not column_name:
+      return None, None
+
+    # Only string values are supported to prevent type conversion by SQLite.
+    if not self.right_operand or not all(
+        isinstance(value, str) for value in self.right_operand):
+      return None, None
+
+    sql_parameters = sorted(self.right_operand)
+
+    sql_filter_expression = '{0:s} IN ({1:s})'.format(
+        column_name, ', '.join(['?'] * len(sql_parameters)))
+
+    return sql_filter_expression, sql_parameters
+
 
 # TODO: is GenericBinaryOperator the most suitable super class here?
 # Would BinaryOperator be a better fit?
@@ -469,6 +943,9 @@ class Regexp(GenericBinaryOperator):
     compiled_re (???): compiled regular expression.
   """
 
+  # Inline flags of the regular expression in the SQL filter expression.
+  _SQL_REGEXP_FLAGS = '(?s)'
+
   def __init__(self, arguments=None, **kwargs):
     """Initializes a regular expression operator.
 
@@ -514,10 +991,41 @@ class Regexp(GenericBinaryOperator):
 
     return False
 
+  def _GetSQLFilterExpression(self, column_name, sql_value):
+    """Retrieves a SQL filter expression that corresponds to the operator.
+
+    The REGEXP operator requires the storage to provide a regexp function
+    that uses Python regular expressions.
+
+    Args:
+      column_name (str): SQL column name of the left operand.
+      sql_value (str): SQL literal of the right operand.
+
+    Returns:
+      str: SQL filter expression or None if the operator cannot be expressed
+          in SQL.
+    """
+    if self.left_operand == 'timestamp':
+      return None
+
+    expression = ''.join([self._SQL_REGEXP_FLAGS, self.right_operand])
+    return '{0:s} REGEXP \'{1:s}\''.format(
+        column_name, expression.replace('\'', '\'\''))
+
+  def GetEvaluationCost(self):
+    """Retrieves the relative cost of evaluating the filter.
+
+    Returns:
+      int: relative cost of evaluating the filter.
+    """
+    return 4
+
 
 class RegexpInsensitive(Regexp):
   """Operator to determine if a value matches a regular expression."""
 
+  _SQL_REGEXP_FLAGS = '(?is)'
+
   def __init__(self, arguments=None, **kwargs):
     """Initializes a regular expression operator.
 
@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
-"""Circular buffer for storing event objects."""
+"""Buffers for storing event objects."""
+
+import heapq
+import pickle
+import tempfile
 
 
 class CircularBuffer(object):
@@ -70,3 +74,93 @@ class CircularBuffer(object):
       return None
 
     return self._list[index]
+
+
+class SortedRunsBuffer(object):
+  """Class that defines a buffer of sorted runs for an external merge sort.
+
+  Sorted runs of items are written to temporary files so that the number of
+  items that need to be kept in memory is bounded. The items of the runs are
+  read back, one at a time per run, during a k-way merge.
+  """
+
+  def __init__(self, temporary_directory=None):
+    """Initializes a sorted runs buffer.
+
+    Args:
+      temporary_directory (Optional[str]): path of the directory to store
+          the temporary files of the runs, where None represents the default
+          temporary directory.
+    """
+    super(SortedRunsBuffer, self).__init__()
+    self._number_of_items = 0
+    self._run_files = []
+    self._temporary_directory = temporary_directory
+
+  @property
+  def number_of_items(self):
+    """int: number of items in the runs."""
+    return self._number_of_items
+
+  @property
+  def number_of_runs(self):
+    """int: number of runs."""
+    return len(self._run_files)
+
+  def _ReadRun(self, run_file):
+    """Reads the items of a run.
+
+    Args:
+      run_file (file): file-like object of the run.
+
+    Yields:
+      object: item.
+    """
+    run_file.seek(0, 0)
+    while True:
+      try:
+        yield pickle.load(run_file)
+      except EOFError:
+        break
+
+  def Clear(self):
+    """Removes all runs."""
+    for run_file in self._run_files:
+      run_file.close()
+
+    self._number_of_items = 0
+    self._run_files = []
+
+  def Merge(self, items, key=None):
+    """Merges sorted items with the items of the runs and clears the buffer.
+
+    Args:
+      items (list[object]): sorted items that are kept in memory.
+      key (Optional[function]): function to extract the comparison key from
+          an item, where None represents the item is compared directly.
+
+    Yields:
+      object: item, in sort order.
+    """
+    run_iterators = [self._ReadRun(run_file) for run_file in self._run_files]
+
+    try:
+      for item in heapq.merge(items, *run_iterators, key=key):
+        yield item
+
+    finally:
+      self.Clear()
+
+  def WriteRun(self, items):
+    """Writes sorted items as a run.
+
+    Args:
+      items (list[object]): sorted items, which must be picklable.
+    """
+    run_file = tempfile.TemporaryFile(dir=self._temporary_directory)  # pylint: disable=consider-using-with
+
+    for item in items:
+      pickle.dump(item, run_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    self._number_of_items += len(items)
+    self._run_files.append(run_file)
@@ -26,12 +26,16 @@ NON_PRINTABLE_CHARACTER_TRANSLATION_TABLE = str.maketrans(
     NON_PRINTABLE_CHARACTERS)
 
 # Compression formats.
+COMPRESSION_FORMAT_LZ4 = 'lz4'
 COMPRESSION_FORMAT_NONE = 'none'
 COMPRESSION_FORMAT_ZLIB = 'zlib'
+COMPRESSION_FORMAT_ZSTD = 'zstd'
 
 COMPRESSION_FORMATS = frozenset([
+    COMPRESSION_FORMAT_LZ4,
     COMPRESSION_FORMAT_NONE,
-    COMPRESSION_FORMAT_ZLIB])
+    COMPRESSION_FORMAT_ZLIB,
+    COMPRESSION_FORMAT_ZSTD])
 
 # Operating system families.
 OPERATING_SYSTEM_FAMILY_LINUX = 'Linux'
@@ -49,8 +53,11 @@ OPERATING_SYSTEM_FAMILIES = frozenset([
 
 # Serialization formats.
 SERIALIZER_FORMAT_JSON = 'json'
+SERIALIZER_FORMAT_MSGPACK = 'msgpack'
 
-SERIALIZER_FORMATS = frozenset([SERIALIZER_FORMAT_JSON])
+SERIALIZER_FORMATS = frozenset([
+    SERIALIZER_FORMAT_JSON,
+    SERIALIZER_FORMAT_MSGPACK])
 
 # Source types.
 SOURCE_TYPE_ARCHIVE = 'archive'
@@ -3,6 +3,7 @@
 
 import collections
 import os
+import pickle
 import time
 
 from plaso.containers import counts
@@ -33,6 +34,10 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   _CONTAINER_TYPE_ANALYSIS_REPORT = reports.AnalysisReport.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
+  # The maximum number of events that are pushed to the analysis plugins
+  # as a single batch.
+  _MAXIMUM_EVENT_BATCH_SIZE = 1000
+
   _PROCESS_JOIN_TIMEOUT = 5.0
 
   _QUEUE_TIMEOUT = 10 * 60
@@ -114,21 +119,10 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     filter_limit = getattr(event_filter, 'limit', None)
 
-    for event in storage_writer.GetSortedEvents():
-      event_data_identifier = event.GetEventDataIdentifier()
-      event_data = storage_writer.GetAttributeContainerByIdentifier(
-          events.EventData.CONTAINER_TYPE, event_data_identifier)
-
-      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
-      if event_data_stream_identifier:
-        event_data_stream = storage_writer.GetAttributeContainerByIdentifier(
-            events.EventDataStream.CONTAINER_TYPE, event_data_stream_identifier)
-      else:
-        event_data_stream = None
-
-      event_identifier = event.GetIdentifier()
-      event_tag = storage_writer.GetEventTagByEventIdentifer(event_identifier)
+    event_batch = []
 
+    for event, event_data, event_data_stream, event_tag in (
+        storage_writer.GetSortedEventsWithData()):
       if event_filter:
         filter_match = event_filter.Match(
             event, event_data, event_data_stream, event_tag)
@@ -140,9 +134,10 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         number_of_filtered_events += 1
         continue
 
-      for event_queue in self._event_queues.values():
-        # TODO: Check for premature exit of analysis plugins.
-        event_queue.PushItem((event, event_data, event_data_stream))
+      event_batch.append((event, event_data, event_data_stream))
+      if len(event_batch) >= self._MAXIMUM_EVENT_BATCH_SIZE:
+        self._PushEventBatch(event_batch)
+        event_batch = []
 
       self._number_of_consumed_events += 1
 
@@ -150,6 +145,9 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           filter_limit == self._number_of_consumed_events):
         break
 
+    if event_batch:
+      self._PushEventBatch(event_batch)
+
     logger.debug('Finished pushing events to analysis plugins.')
     # Signal that we have finished adding events.
     for event_queue in self._event_queues.values():
@@ -328,6 +326,24 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return number_of_containers
 
+  def _PushEventBatch(self, event_batch):
+    """Pushes a batch of events to the analysis plugins.
+
+    The batch is serialized once and the serialized batch is pushed to
+    the event queue of every analysis plugin, instead of serializing every
+    event for every analysis plugin.
+
+    Args:
+      event_batch (list[tuple[EventObject, EventData, EventDataStream]]):
+          events with their event data and event data stream.
+    """
+    serialized_event_batch = pickle.dumps(
+        event_batch, protocol=pickle.HIGHEST_PROTOCOL)
+
+    for event_queue in self._event_queues.values():
+      # TODO: Check for premature exit of analysis plugins.
+      event_queue.PushItem(serialized_event_batch)
+
   def _StartAnalysisProcesses(self, analysis_plugins):
     """Starts the analysis processes.
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The multi-process analysis worker process."""
 
+import pickle
 import threading
 
 from plaso.analysis import mediator as analysis_mediator
@@ -165,9 +166,18 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
           logger.debug('ConsumeItems exiting, dequeued QueueAbort object.')
           break
 
-        self._ProcessEvent(self._analysis_mediator, *queued_object)
+        # The events are pushed as a serialized batch that is shared by
+        # the analysis processes.
+        event_batch = pickle.loads(queued_object)
 
-        self._number_of_consumed_events += 1
+        for event, event_data, event_data_stream in event_batch:
+          if self._abort:
+            break
+
+          self._ProcessEvent(
+              self._analysis_mediator, event, event_data, event_data_stream)
+
+          self._number_of_consumed_events += 1
 
       logger.debug(
           '{0!s} (PID: {1:d}) stopped monitoring event queue.'.format(
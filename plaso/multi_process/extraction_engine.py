@@ -11,6 +11,7 @@ import time
 import traceback
 
 from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
@@ -34,7 +35,28 @@ from plaso.multi_process import zeromq_queue
 
 
 class _EventSourceHeap(object):
-  """Class that defines an event source heap."""
+  """Class that defines an event source heap.
+
+  Directories are popped first, since they produce new event sources. Files
+  are popped in order of descending estimated processing cost, so that large
+  files are not processed at the end of the extraction. Small files are popped
+  in batches to reduce the per task overhead.
+  """
+
+  # File name extensions of formats that are known to be slow to process
+  # relative to their size.
+  _SLOW_FORMAT_FILE_NAME_EXTENSIONS = frozenset([
+      '.db', '.edb', '.evtx', '.sqlite'])
+
+  # Factor the size of a file in a slow format is multiplied with to estimate
+  # its processing cost.
+  _SLOW_FORMAT_COST_FACTOR = 4
+
+  # Maximum size of a file that is processed in a batch of files.
+  _MAXIMUM_BATCH_FILE_SIZE = 256 * 1024
+
+  # Maximum number of files that are processed in a batch.
+  _MAXIMUM_BATCH_NUMBER_OF_FILES = 64
 
   def __init__(self, maximum_number_of_items=50000):
     """Initializes an event source heap.
@@ -47,6 +69,20 @@ class _EventSourceHeap(object):
     self._heap = []
     self._maximum_number_of_items = maximum_number_of_items
 
+  def _IsBatchFile(self, event_source):
+    """Determines if an event source is a file that can be batched.
+
+    Args:
+      event_source (EventSource): event source.
+
+    Returns:
+      bool: True if the event source is a file that can be batched.
+    """
+    return (
+        event_source.file_entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_FILE
+        and event_source.file_size is not None and
+        event_source.file_size <= self._MAXIMUM_BATCH_FILE_SIZE)
+
   def IsFull(self):
     """Determines if the heap is full.
 
@@ -62,13 +98,37 @@ class _EventSourceHeap(object):
       EventSource: an event source or None on if no event source is available.
     """
     try:
-      _, _, event_source = heapq.heappop(self._heap)
+      _, _, _, event_source = heapq.heappop(self._heap)
 
     except IndexError:
       return None
 
     return event_source
 
+  def PopEventSources(self):
+    """Pops a batch of event sources from the heap.
+
+    Returns:
+      list[EventSource]: event sources, where multiple event sources are only
+          returned for a batch of small files, or an empty list if no event
+          source is available.
+    """
+    event_source = self.PopEventSource()
+    if not event_source:
+      return []
+
+    event_sources_batch = [event_source]
+    if self._IsBatchFile(event_source):
+      while (self._heap and
+             len(event_sources_batch) < self._MAXIMUM_BATCH_NUMBER_OF_FILES):
+        _, _, _, event_source = self._heap[0]
+        if not self._IsBatchFile(event_source):
+          break
+
+        event_sources_batch.append(self.PopEventSource())
+
+    return event_sources_batch
+
   def PushEventSource(self, event_source):
     """Pushes an event source onto the heap.
 
@@ -78,10 +138,22 @@ class _EventSourceHeap(object):
     if event_source.file_entry_type == (
         dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY):
       weight = 1
+      cost = 0
+
+    elif event_source.file_size is None:
+      weight = 50
+      cost = 0
+
     else:
       weight = 100
+      cost = event_source.file_size
+
+      location = getattr(event_source.path_spec, 'location', None) or ''
+      _, file_name_extension = os.path.splitext(location)
+      if file_name_extension.lower() in self._SLOW_FORMAT_FILE_NAME_EXTENSIONS:
+        cost *= self._SLOW_FORMAT_COST_FACTOR
 
-    heap_values = (weight, time.time(), event_source)
+    heap_values = (weight, -cost, time.time(), event_source)
     heapq.heappush(self._heap, heap_values)
 
 
@@ -93,9 +165,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   * merge results returned by extraction worker processes.
   """
 
+  _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
+  _CONTAINER_TYPE_PARSER_COUNT = counts.ParserCount.CONTAINER_TYPE
   _CONTAINER_TYPE_YEAR_LESS_LOG_HELPER = events.YearLessLogHelper.CONTAINER_TYPE
 
   # Maximum number of dfVFS file system objects to cache in the foreman process.
@@ -104,6 +178,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   # Maximum number of concurrent tasks.
   _MAXIMUM_NUMBER_OF_TASKS = 10000
 
+  # Number of attribute containers read from a task storage at once on merge.
+  _MERGE_BLOCK_SIZE = 1000
+
   _TASK_QUEUE_TIMEOUT_SECONDS = 2
 
   _UNICODE_SURROGATES_RE = re.compile('[\ud800-\udfff]')
@@ -168,9 +245,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     super(ExtractionMultiProcessEngine, self).__init__()
     self._enable_sigsegv_handler = False
+    self._enabled_parser_names = None
     self._event_data_timeliner = None
     self._extraction_worker = None
     self._file_system_cache = []
+    self._incremental_extraction = False
     self._maximum_number_of_containers = 50
     self._maximum_number_of_tasks = maximum_number_of_tasks
     self._merge_task = None
@@ -180,8 +259,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._number_of_produced_event_data = 0
     self._number_of_produced_events = 0
     self._number_of_produced_sources = 0
+    self._number_of_skipped_sources = 0
     self._number_of_worker_processes = number_of_worker_processes
     self._path_spec_extractor = extractors.PathSpecExtractor()
+    self._pending_processed_event_sources = {}
+    self._processed_event_sources = {}
     self._resolver_context = context.Context()
     self._status = definitions.STATUS_INDICATOR_IDLE
     self._status_update_callback = status_update_callback
@@ -192,6 +274,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._task_queue_port = None
     self._task_storage_format = None
     self._worker_memory_limit = worker_memory_limit
+    self._worker_timelining = False
     self._worker_timeout = worker_timeout
     self._system_configurations = None
 
@@ -233,6 +316,55 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return False
 
+  def _CheckProcessedFileEntry(self, storage_writer, file_entry):
+    """Checks if a file entry was processed by a previous extraction.
+
+    A file entry can be skipped if its size and modification date and time
+    are unchanged and it was previously processed with all the enabled parsers
+    and plugins. The sub file entries of a skipped directory are added as
+    event sources, since these can have changed. The fingerprints of file
+    entries that need to be processed are kept until their task is merged.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      bool: True if the file entry was processed previously and can be
+          skipped.
+    """
+    path_spec_comparable = file_entry.path_spec.comparable
+
+    file_size = None
+    if file_entry.IsFile():
+      file_size = file_entry.size
+
+    modification_time = None
+    if file_entry.modification_time:
+      modification_time = file_entry.modification_time.GetPlasoTimestamp()
+
+    parser_names = self._enabled_parser_names
+
+    processed_event_source = self._processed_event_sources.pop(
+        path_spec_comparable, None)
+    if processed_event_source and processed_event_source.IsUnchanged(
+        file_size, modification_time):
+      processed_parser_names = set(processed_event_source.parser_names or [])
+      if parser_names.issubset(processed_parser_names):
+        if file_entry.IsDirectory():
+          self._ProduceSubFileEntryEventSources(storage_writer, file_entry)
+
+        return True
+
+      parser_names = parser_names.union(processed_parser_names)
+
+    self._pending_processed_event_sources[path_spec_comparable] = (
+        event_sources.ProcessedEventSource(
+            file_size=file_size, modification_time=modification_time,
+            parser_names=sorted(parser_names), path_spec=file_entry.path_spec))
+
+    return False
+
   def _CollectInitialEventSources(self, storage_writer, file_system_path_specs):
     """Collects the initial event sources.
 
@@ -278,41 +410,69 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         if self._status_update_callback:
           self._status_update_callback(self._processing_status)
 
-  def _CreateTask(self, storage_writer, session_identifier, event_source):
-    """Creates a task to processes an event source.
+  def _CreateTask(
+      self, storage_writer, session_identifier, event_sources_batch):
+    """Creates a task to processes a batch of event sources.
 
     Args:
       storage_writer (StorageWriter): storage writer for a session storage.
       session_identifier (str): the identifier of the session the tasks are
           part of.
-      event_source (EventSource): event source.
+      event_sources_batch (list[EventSource]): event sources.
 
     Returns:
       Task: task or None if no task could be created.
     """
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
-        event_source.path_spec, resolver_context=self._resolver_context)
-    if file_entry is None:
-      self._ProduceExtractionWarning(
-          storage_writer, 'Unable to open file entry', event_source.path_spec)
-      return None
+    path_specs = []
+    for event_source in event_sources_batch:
+      file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+          event_source.path_spec, resolver_context=self._resolver_context)
+      if file_entry is None:
+        self._ProduceExtractionWarning(
+            storage_writer, 'Unable to open file entry', event_source.path_spec)
+        continue
 
-    file_system = file_entry.GetFileSystem()
+      file_system = file_entry.GetFileSystem()
 
-    if not event_source.path_spec.IsSystemLevel():
-      self._CacheFileSystem(file_system)
+      if not event_source.path_spec.IsSystemLevel():
+        self._CacheFileSystem(file_system)
 
-    if self._CheckExcludedPathSpec(file_system, event_source.path_spec):
-      display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
-          event_source.path_spec)
-      logger.debug('Excluded from extraction: {0:s}.'.format(
-          display_name))
+      if self._CheckExcludedPathSpec(file_system, event_source.path_spec):
+        display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
+            event_source.path_spec)
+        logger.debug('Excluded from extraction: {0:s}.'.format(
+            display_name))
+        continue
+
+      # Record ranges are only produced for file entries that are processed.
+      if self._incremental_extraction and not event_source.parser_name:
+        if self._CheckProcessedFileEntry(storage_writer, file_entry):
+          display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
+              event_source.path_spec)
+          logger.debug('Skipped unchanged: {0:s}.'.format(display_name))
+
+          self._number_of_skipped_sources += 1
+          continue
+
+      path_specs.append(event_source.path_spec)
+
+    if not path_specs:
       return None
 
     task = self._task_manager.CreateTask(
         session_identifier, storage_format=self._task_storage_format)
-    task.file_entry_type = event_source.file_entry_type
-    task.path_spec = event_source.path_spec
+    task.file_entry_type = event_sources_batch[0].file_entry_type
+    task.path_spec = path_specs[0]
+
+    if len(path_specs) > 1:
+      task.path_specs = path_specs
+
+    elif event_sources_batch[0].parser_name:
+      task.event_data_stream_values = (
+          event_sources_batch[0].event_data_stream_values)
+      task.first_record_index = event_sources_batch[0].first_record_index
+      task.number_of_records = event_sources_batch[0].number_of_records
+      task.parser_name = event_sources_batch[0].parser_name
 
     return task
 
@@ -387,7 +547,36 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     """
     self._status = definitions.STATUS_INDICATOR_MERGING
 
-    if container.CONTAINER_TYPE in (
+    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_PARSER_COUNT:
+      # Parser counts of worker timelined events are aggregated and written
+      # to the session storage when processing has completed.
+      self._event_data_timeliner.parsers_counter[container.name] += (
+          container.number_of_events)
+      self._status = definitions.STATUS_INDICATOR_RUNNING
+      return
+
+    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT:
+      event_data_identifier = container.GetEventDataIdentifier()
+      event_data_lookup_key = event_data_identifier.CopyToString()
+
+      event_data_identifier = merge_helper.GetAttributeContainerIdentifier(
+          event_data_lookup_key)
+
+      if not event_data_identifier:
+        identifier = container.GetIdentifier()
+        identifier_string = identifier.CopyToString()
+
+        # TODO: store this as a merge warning so this is preserved
+        # in the storage file.
+        logger.error((
+            'Unable to merge event attribute container: {0:s} since '
+            'corresponding event data: {1:s} could not be found.').format(
+                identifier_string, event_data_lookup_key))
+        return
+
+      container.SetEventDataIdentifier(event_data_identifier)
+
+    elif container.CONTAINER_TYPE in (
         self._CONTAINER_TYPE_EVENT_DATA,
         self._CONTAINER_TYPE_YEAR_LESS_LOG_HELPER):
       event_data_stream_identifier = container.GetEventDataStreamIdentifier()
@@ -460,7 +649,18 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       identifier = container.GetIdentifier()
       merge_helper.SetAttributeContainerIdentifier(lookup_key, identifier)
 
-    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
+    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA_STREAM:
+      merge_helper.SetEventDataStream(container)
+
+    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT:
+      self._number_of_produced_events += 1
+
+    elif (container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA and
+          self._worker_timelining):
+      self._number_of_produced_event_data += 1
+      self._number_of_consumed_event_data += 1
+
+    elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
       self._number_of_produced_event_data += 1
 
       self._status = definitions.STATUS_INDICATOR_TIMELINING
@@ -469,10 +669,14 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
       event_data_stream = None
       if event_data_stream_identifier:
-        event_data_stream = (
-            self._storage_writer.GetAttributeContainerByIdentifier(
-                self._CONTAINER_TYPE_EVENT_DATA_STREAM,
-                event_data_stream_identifier))
+        event_data_stream = merge_helper.GetEventDataStream(
+            event_data_stream_identifier)
+
+        if not event_data_stream:
+          event_data_stream = (
+              self._storage_writer.GetAttributeContainerByIdentifier(
+                  self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+                  event_data_stream_identifier))
 
       # Generate events on merge.
       self._event_data_timeliner.ProcessEventData(
@@ -503,17 +707,29 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     """
     number_of_containers = 0
 
-    container = merge_helper.GetAttributeContainer()
+    # Attribute containers are read from the task storage in blocks to reduce
+    # the number of round trips to the task storage.
+    block_size = self._MERGE_BLOCK_SIZE
+    if maximum_number_of_containers > 0:
+      block_size = min(block_size, maximum_number_of_containers)
 
-    while container:
-      number_of_containers += 1
+    containers = merge_helper.GetAttributeContainers(
+        maximum_number_of_containers=block_size)
 
-      self._MergeAttributeContainer(storage_writer, merge_helper, container)
+    while containers:
+      for container in containers:
+        self._MergeAttributeContainer(storage_writer, merge_helper, container)
 
-      if 0 < maximum_number_of_containers <= number_of_containers:
-        break
+      number_of_containers += len(containers)
+
+      if maximum_number_of_containers > 0:
+        block_size = min(
+            block_size, maximum_number_of_containers - number_of_containers)
+        if block_size <= 0:
+          break
 
-      container = merge_helper.GetAttributeContainer()
+      containers = merge_helper.GetAttributeContainers(
+          maximum_number_of_containers=block_size)
 
     return number_of_containers
 
@@ -642,6 +858,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
               'Unable to complete task: {0:s} with error: {1!s}'.format(
                   self._merge_task.identifier, exception))
 
+        if self._incremental_extraction:
+          self._WriteProcessedEventSources(storage_writer, self._merge_task)
+
         if not self._task_merge_helper_on_hold:
           self._merge_task = None
           self._task_merge_helper = None
@@ -671,6 +890,42 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if path_spec:
       self._processing_status.error_path_specs.append(path_spec)
 
+  def _ProduceSubFileEntryEventSources(self, storage_writer, file_entry):
+    """Produces event sources for the sub file entries of a directory.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      file_entry (dfvfs.FileEntry): file entry of the directory.
+    """
+    for sub_file_entry in file_entry.sub_file_entries:
+      try:
+        if not sub_file_entry.IsAllocated():
+          continue
+
+        file_size = None
+        if sub_file_entry.IsFile():
+          file_size = sub_file_entry.size
+
+      except dfvfs_errors.BackEndError as exception:
+        self._ProduceExtractionWarning(storage_writer, (
+            'unable to process directory entry: {0:s} with error: '
+            '{1!s}').format(sub_file_entry.name, exception),
+            file_entry.path_spec)
+        continue
+
+      # For TSK-based file entries only, ignore the virtual /$OrphanFiles
+      # directory.
+      if sub_file_entry.type_indicator == dfvfs_definitions.TYPE_INDICATOR_TSK:
+        if file_entry.IsRoot() and sub_file_entry.name == '$OrphanFiles':
+          continue
+
+      event_source = event_sources.FileEntryEventSource(
+          file_entry_type=sub_file_entry.entry_type, file_size=file_size,
+          path_spec=sub_file_entry.path_spec)
+      storage_writer.AddAttributeContainer(event_source)
+
+      self._number_of_produced_sources += 1
+
   def _ProcessEventSources(self, storage_writer, session_identifier):
     """Processes event sources.
 
@@ -693,12 +948,12 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._FillEventSourceHeap(
         storage_writer, event_source_heap, start_with_first=True)
 
-    event_source = event_source_heap.PopEventSource()
+    event_sources_batch = event_source_heap.PopEventSources()
 
     task = None
     has_pending_tasks = True
 
-    while event_source or has_pending_tasks:
+    while event_sources_batch or has_pending_tasks:
       if self._abort:
         break
 
@@ -706,13 +961,13 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         if not task:
           task = self._task_manager.CreateRetryTask()
 
-        if not task and event_source:
+        if not task and event_sources_batch:
           task = self._CreateTask(
-              storage_writer, session_identifier, event_source)
+              storage_writer, session_identifier, event_sources_batch)
 
-          event_source = None
+          self._number_of_consumed_sources += len(event_sources_batch)
 
-          self._number_of_consumed_sources += 1
+          event_sources_batch = []
 
         if task:
           if not self._ScheduleTask(task):
@@ -735,8 +990,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         else:
           self._FillEventSourceHeap(storage_writer, event_source_heap)
 
-        if not task and not event_source:
-          event_source = event_source_heap.PopEventSource()
+        if not task and not event_sources_batch:
+          event_sources_batch = event_source_heap.PopEventSources()
 
         has_pending_tasks = self._task_manager.HasPendingTasks()
 
@@ -752,10 +1007,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       # All exceptions need to be caught here to prevent the foreman
       # from being killed by an uncaught exception.
       except Exception as exception:  # pylint: disable=broad-except
-        self._ProduceExtractionWarning(storage_writer, (
-            'unable to process path specification with error: '
-            '{0!s}').format(exception), event_source.path_spec)
-        event_source = None
+        for event_source in event_sources_batch:
+          self._ProduceExtractionWarning(storage_writer, (
+              'unable to process path specification with error: '
+              '{0!s}').format(exception), event_source.path_spec)
+        event_sources_batch = []
 
     for task in self._task_manager.GetFailedTasks():
       self._ProduceExtractionWarning(
@@ -788,6 +1044,13 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._number_of_produced_event_data = 0
     self._number_of_produced_events = 0
     self._number_of_produced_sources = 0
+    self._number_of_skipped_sources = 0
+
+    if self._incremental_extraction:
+      self._processed_event_sources = {
+          processed_event_source.path_spec.comparable: processed_event_source
+          for processed_event_source in storage_writer.GetAttributeContainers(
+              event_sources.ProcessedEventSource.CONTAINER_TYPE)}
 
     stored_parsers_counter = collections.Counter({
         parser_count.name: parser_count
@@ -798,6 +1061,13 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     self._ProcessEventSources(storage_writer, session_identifier)
 
+    if self._incremental_extraction:
+      logger.info('Skipped {0:d} unchanged file entries.'.format(
+          self._number_of_skipped_sources))
+
+      self._pending_processed_event_sources = {}
+      self._processed_event_sources = {}
+
     if self._abort:
       self._status = definitions.STATUS_INDICATOR_ABORTED
     else:
@@ -1051,6 +1321,22 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
+  def _WriteProcessedEventSources(self, storage_writer, task):
+    """Writes the processed event sources of a merged task.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      task (Task): task that was merged.
+    """
+    if task.aborted or task.parser_name:
+      return
+
+    for path_spec in task.path_specs or [task.path_spec]:
+      processed_event_source = self._pending_processed_event_sources.pop(
+          path_spec.comparable, None)
+      if processed_event_source:
+        storage_writer.AddAttributeContainer(processed_event_source)
+
   def ProcessSourceMulti(
       self, storage_writer, session_identifier, processing_configuration,
       system_configurations, file_system_path_specs,
@@ -1116,10 +1402,22 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._processing_configuration = processing_configuration
 
     self._debug_output = processing_configuration.debug_output
+    self._incremental_extraction = False
+    if processing_configuration.incremental_extraction:
+      if processing_configuration.parser_filter_expression:
+        self._enabled_parser_names = set(
+            processing_configuration.parser_filter_expression.split(','))
+        self._incremental_extraction = True
+      else:
+        logger.warning((
+            'Incremental extraction requires an expanded parser filter '
+            'expression and is disabled.'))
+
     self._log_filename = processing_configuration.log_filename
     self._storage_file_path = storage_file_path
     self._storage_writer = storage_writer
     self._task_storage_format = processing_configuration.task_storage_format
+    self._worker_timelining = processing_configuration.worker_timelining
 
     # Set up the task queue.
     task_outbound_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
@@ -1213,11 +1511,14 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # Reset values.
     self._enable_sigsegv_handler = None
     self._event_data_timeliner = None
+    self._enabled_parser_names = None
     self._file_system_cache = []
+    self._incremental_extraction = False
     self._processing_configuration = None
     self._storage_file_path = None
     self._storage_writer = None
     self._system_configurations = None
     self._task_storage_format = None
+    self._worker_timelining = False
 
     return self._processing_status
@@ -5,6 +5,9 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.containers import counts
+from plaso.containers import events
+from plaso.engine import timeliner
 from plaso.engine import worker
 from plaso.lib import definitions
 from plaso.lib import errors
@@ -43,9 +46,11 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     self._abort = False
     self._buffer_size = 0
     self._current_display_name = ''
+    self._event_data_timeliner = None
     self._extraction_worker = None
     self._file_system_cache = []
     self._number_of_consumed_sources = 0
+    self._number_of_produced_events = 0
     self._parser_mediator = None
     self._registry_find_specs = registry_find_specs
     self._resolver_context = None
@@ -102,6 +107,7 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         processing_configuration.preferred_codepage)
     parser_mediator.SetPreferredLanguage(
         processing_configuration.preferred_language)
+    parser_mediator.SetSplitRecordRanges(True)
     parser_mediator.SetTemporaryDirectory(
         processing_configuration.temporary_directory)
 
@@ -122,6 +128,11 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       number_of_produced_event_data = None
       number_of_produced_sources = None
 
+    if self._event_data_timeliner:
+      number_of_produced_events = self._number_of_produced_events
+    else:
+      number_of_produced_events = None
+
     if self._extraction_worker and self._parser_mediator:
       last_activity_timestamp = max(
           self._extraction_worker.last_activity_timestamp,
@@ -155,7 +166,7 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         'number_of_consumed_sources': self._number_of_consumed_sources,
         'number_of_produced_event_data': number_of_produced_event_data,
         'number_of_produced_event_tags': None,
-        'number_of_produced_events': None,
+        'number_of_produced_events': number_of_produced_events,
         'number_of_produced_sources': number_of_produced_sources,
         'processing_status': processing_status,
         'task_identifier': task_identifier,
@@ -189,6 +200,20 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     self._extraction_worker.SetExtractionConfiguration(
         self._processing_configuration.extraction)
 
+    if self._processing_configuration.worker_timelining:
+      self._event_data_timeliner = timeliner.EventDataTimeliner(
+          data_location=self._processing_configuration.data_location,
+          preferred_year=self._processing_configuration.preferred_year,
+          system_configurations=self._system_configurations)
+
+      try:
+        self._event_data_timeliner.SetPreferredTimeZone(
+            self._processing_configuration.preferred_time_zone)
+      except ValueError as exception:
+        logger.error((
+            'Unable to set preferred time zone with error: {0!s}').format(
+                exception))
+
     self._parser_mediator.StartProfiling(
         self._processing_configuration.profiling, self._name,
         self._process_information)
@@ -245,6 +270,7 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     self._StopProfiling()
     self._parser_mediator.StopProfiling()
 
+    self._event_data_timeliner = None
     self._extraction_worker = None
     self._file_system_cache = []
     self._parser_mediator = None
@@ -300,6 +326,34 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
             '{0:s}.').format(self._current_display_name))
         logger.exception(exception)
 
+  def _ProcessRecordRange(self, extraction_worker, parser_mediator, task):
+    """Processes a record range.
+
+    Args:
+      extraction_worker (worker.ExtractionWorker): extraction worker.
+      parser_mediator (ParserMediator): parser mediator.
+      task (Task): task that defines the record range.
+    """
+    self._current_display_name = parser_mediator.GetDisplayNameForPathSpec(
+        task.path_spec)
+
+    try:
+      extraction_worker.ProcessRecordRange(
+          parser_mediator, task.path_spec, task.parser_name,
+          task.first_record_index, task.number_of_records,
+          event_data_stream_values=task.event_data_stream_values)
+
+    except Exception as exception:  # pylint: disable=broad-except
+      parser_mediator.ProduceExtractionWarning((
+          'unable to process record range with error: {0!s}').format(
+              exception), path_spec=task.path_spec)
+
+      if self._processing_configuration.debug_output:
+        logger.warning((
+            'Unhandled exception while processing record range of: '
+            '{0:s}.').format(self._current_display_name))
+        logger.exception(exception)
+
   def _ProcessTask(self, task):
     """Processes a task.
 
@@ -329,16 +383,34 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     storage_file_path = self._GetTaskStorageFilePath(
         self._processing_configuration.task_storage_format, task)
     task_storage_writer.Open(
-        path=storage_file_path, session_identifier=task.session_identifier,
+        compression_format=(
+            self._processing_configuration.task_compression_format),
+        path=storage_file_path,
+        serialization_format=(
+            self._processing_configuration.task_serialization_format),
+        session_identifier=task.session_identifier,
         task_identifier=task.identifier)
 
     try:
       task_storage_writer.AddAttributeContainer(task)
 
       # TODO: add support for more task types.
-      self._ProcessPathSpec(
-          self._extraction_worker, self._parser_mediator, task.path_spec)
-      self._number_of_consumed_sources += 1
+      if task.parser_name:
+        self._ProcessRecordRange(
+            self._extraction_worker, self._parser_mediator, task)
+        self._number_of_consumed_sources += 1
+
+      else:
+        for path_spec in task.path_specs or [task.path_spec]:
+          if self._abort:
+            break
+
+          self._ProcessPathSpec(
+              self._extraction_worker, self._parser_mediator, path_spec)
+          self._number_of_consumed_sources += 1
+
+      if self._event_data_timeliner and not self._abort:
+        self._TimelineEventData(task_storage_writer)
 
     finally:
       task.aborted = self._abort
@@ -361,6 +433,44 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
 
     logger.debug('Completed processing task: {0:s}.'.format(task.identifier))
 
+  def _TimelineEventData(self, task_storage_writer):
+    """Generates events from the event data written to the task storage.
+
+    The events and the corresponding parser counts are written to the task
+    storage so that the main (foreman) process only needs to merge them.
+
+    Args:
+      task_storage_writer (StorageWriter): task storage writer.
+    """
+    self._event_data_timeliner.parsers_counter.clear()
+
+    event_data = task_storage_writer.GetFirstWrittenEventData()
+    while event_data:
+      if self._abort:
+        break
+
+      event_data_stream = None
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream = (
+            task_storage_writer.GetAttributeContainerByIdentifier(
+                events.EventDataStream.CONTAINER_TYPE,
+                event_data_stream_identifier))
+
+      self._event_data_timeliner.ProcessEventData(
+          task_storage_writer, event_data, event_data_stream)
+
+      self._number_of_produced_events += (
+          self._event_data_timeliner.number_of_produced_events)
+
+      event_data = task_storage_writer.GetNextWrittenEventData()
+
+    for name, number_of_events in sorted(
+        self._event_data_timeliner.parsers_counter.items()):
+      parser_count = counts.ParserCount(
+          name=name, number_of_events=number_of_events)
+      task_storage_writer.AddAttributeContainer(parser_count)
+
   def SignalAbort(self):
     """Signals the process to abort."""
     self._abort = True
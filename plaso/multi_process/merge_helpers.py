@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 """Classes to assist in merging attribute containers of tasks."""
 
+import itertools
+
 from plaso.containers import analysis_results
 from plaso.containers import artifacts
+from plaso.containers import counts
 from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import reports
@@ -67,6 +70,25 @@ class BaseTaskMergeHelper(object):
 
     return container
 
+  def GetAttributeContainers(self, maximum_number_of_containers=0):
+    """Retrieves a block of attribute containers to merge.
+
+    Args:
+      maximum_number_of_containers (Optional[int]): maximum number of
+          containers to retrieve, where 0 represent no limit.
+
+    Returns:
+      list[AttributeContainer]: attribute containers or an empty list if
+          no more attribute containers are available.
+    """
+    if maximum_number_of_containers > 0:
+      generator = itertools.islice(
+          self._generator, maximum_number_of_containers)
+    else:
+      generator = self._generator
+
+    return list(generator)
+
   def GetAttributeContainerIdentifier(self, lookup_key):
     """Retrieves an attribute container.
 
@@ -121,8 +143,52 @@ class ExtractionTaskMergeHelper(BaseTaskMergeHelper):
       # data containers.
       events.YearLessLogHelper.CONTAINER_TYPE,
       events.EventData.CONTAINER_TYPE,
+      # Events and parser counts are only produced by the extraction worker
+      # processes when worker timelining is enabled. Events reference event
+      # data and therefore need to be merged after event data containers.
+      events.EventObject.CONTAINER_TYPE,
+      counts.ParserCount.CONTAINER_TYPE,
       warnings.ExtractionWarning.CONTAINER_TYPE,
       warnings.RecoveryWarning.CONTAINER_TYPE,
+      warnings.TimeliningWarning.CONTAINER_TYPE,
       artifacts.WindowsEventLogMessageFileArtifact.CONTAINER_TYPE,
       artifacts.WindowsEventLogMessageStringArtifact.CONTAINER_TYPE,
       artifacts.WindowsWevtTemplateEvent.CONTAINER_TYPE)
+
+  def __init__(self, task_storage_reader, task_identifier):
+    """Initialize a helper for merging extraction task attribute containers.
+
+    Args:
+      task_storage_reader (StorageReader): task storage reader.
+      task_identifier (str): identifier of the task that is merged.
+    """
+    super(ExtractionTaskMergeHelper, self).__init__(
+        task_storage_reader, task_identifier)
+    self._event_data_streams = {}
+
+  def GetEventDataStream(self, identifier):
+    """Retrieves a merged event data stream.
+
+    Args:
+      identifier (AttributeContainerIdentifier): identifier of the event data
+          stream in the session storage.
+
+    Returns:
+      EventDataStream: event data stream or None if not available.
+    """
+    lookup_key = identifier.CopyToString()
+    return self._event_data_streams.get(lookup_key, None)
+
+  def SetEventDataStream(self, event_data_stream):
+    """Sets a merged event data stream.
+
+    Merged event data streams are kept in memory so that they do not need to
+    be read back from the session storage when event data is timelined.
+
+    Args:
+      event_data_stream (EventDataStream): event data stream that has been
+          merged into the session storage.
+    """
+    identifier = event_data_stream.GetIdentifier()
+    lookup_key = identifier.CopyToString()
+    self._event_data_streams[lookup_key] = event_data_stream
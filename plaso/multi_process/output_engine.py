@@ -3,7 +3,11 @@
 
 import collections
 import heapq
+import multiprocessing
 import os
+import queue
+
+from acstore.containers import interface as containers_interface
 
 from plaso.containers import events
 from plaso.engine import processing_status
@@ -12,25 +16,126 @@ from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.multi_process import engine
 from plaso.multi_process import logger
+from plaso.multi_process import output_process
 from plaso.output import mediator as output_mediator
 from plaso.storage import time_range as storage_time_range
 
 
 class PsortEventHeap(object):
-  """Psort event heap."""
+  """Psort event heap.
+
+  If a storage reader is provided and the number of events on the heap
+  exceeds the maximum, the heap is written as a sorted run to a temporary
+  file. The runs only contain the sort keys and event identifiers and are
+  merged with the events on the heap when the events are popped. The events
+  of a run are read back from the storage, hence the events are sorted and
+  deduplicated in their entirety with a bounded number of events in memory.
+  """
 
   _MAXIMUM_CACHED_HASHES = 500000
 
-  def __init__(self):
-    """Initializes a psort events heap."""
+  _MAXIMUM_NUMBER_OF_EVENTS = 100000
+
+  def __init__(self, storage_reader=None):
+    """Initializes a psort events heap.
+
+    Args:
+      storage_reader (Optional[StorageReader]): storage reader to read back
+          the events of sorted runs, where None represents the events are
+          only kept in memory.
+    """
     super(PsortEventHeap, self).__init__()
     self._event_values_hash_cache = collections.OrderedDict()
     self._heap = []
+    self._merged_events = None
+    self._sorted_runs = bufferlib.SortedRunsBuffer()
+    self._storage_reader = storage_reader
 
   @property
   def number_of_events(self):
-    """int: number of events on the heap."""
-    return len(self._heap)
+    """int: number of events on the heap, including the sorted runs."""
+    return len(self._heap) + self._sorted_runs.number_of_items
+
+  def _GetSortKey(self, heap_values):
+    """Retrieves the sort key of heap values.
+
+    Args:
+      heap_values (tuple): heap values or values of a sorted run.
+
+    Returns:
+      tuple[str, str, int]: event values hash, timestamp description and
+          sequence number of the event.
+    """
+    return heap_values[:3]
+
+  def _MergeEvents(self):
+    """Merges the events on the heap with the sorted runs.
+
+    Yields:
+      tuple: containing:
+
+        str: identifier of the event content.
+        EventObject: event.
+        EventData: event data.
+        EventDataStream: event data stream.
+    """
+    heap = sorted(self._heap, key=self._GetSortKey)
+    self._heap = []
+
+    for heap_values in self._sorted_runs.Merge(heap, key=self._GetSortKey):
+      if len(heap_values) == 3:
+        event, event_data, event_data_stream = self._ReadEvent(heap_values[2])
+      else:
+        _, _, _, event, event_data, event_data_stream = heap_values
+
+      yield heap_values[0], event, event_data, event_data_stream
+
+  def _ReadEvent(self, sequence_number):
+    """Reads an event and its data from the storage.
+
+    Args:
+      sequence_number (int): sequence number of the event.
+
+    Returns:
+      tuple: containing:
+
+        EventObject: event.
+        EventData: event data.
+        EventDataStream: event data stream or None if not available.
+
+    Raises:
+      RuntimeError: if the event or event data cannot be read.
+    """
+    event_identifier = containers_interface.AttributeContainerIdentifier(
+        name='event', sequence_number=sequence_number)
+    event = self._storage_reader.GetAttributeContainerByIdentifier(
+        'event', event_identifier)
+    if not event:
+      raise RuntimeError('Unable to read event: {0:d}'.format(sequence_number))
+
+    event_data_identifier = event.GetEventDataIdentifier()
+    event_data = self._storage_reader.GetAttributeContainerByIdentifier(
+        'event_data', event_data_identifier)
+    if not event_data:
+      raise RuntimeError('Unable to read event data of event: {0:d}'.format(
+          sequence_number))
+
+    event_data_stream = None
+    event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+    if event_data_stream_identifier:
+      event_data_stream = (
+          self._storage_reader.GetAttributeContainerByIdentifier(
+              'event_data_stream', event_data_stream_identifier))
+
+    return event, event_data, event_data_stream
+
+  def _WriteSortedRun(self):
+    """Writes the events on the heap as a sorted run."""
+    heap = sorted(self._heap, key=self._GetSortKey)
+    self._heap = []
+
+    self._sorted_runs.WriteRun([
+        heap_values[:3] for heap_values in heap])
 
   def PopEvent(self):
     """Pops an event from the heap.
@@ -38,15 +143,23 @@ class PsortEventHeap(object):
     Returns:
       tuple: containing:
 
-        str: identifier of the event MACB group or None if the event cannot
-            be grouped.
         str: identifier of the event content.
         EventObject: event.
         EventData: event data.
         EventDataStream: event data stream.
     """
+    if self._sorted_runs.number_of_runs and not self._merged_events:
+      self._merged_events = self._MergeEvents()
+
+    if self._merged_events:
+      try:
+        return next(self._merged_events)
+      except StopIteration:
+        self._merged_events = None
+        return None
+
     try:
-      (event_values_hash, _, event, event_data,
+      (event_values_hash, _, _, event, event_data,
        event_data_stream) = heapq.heappop(self._heap)
       return event_values_hash, event, event_data, event_data_stream
 
@@ -59,8 +172,6 @@ class PsortEventHeap(object):
     Yields:
       tuple: containing:
 
-        str: identifier of the event MACB group or None if the event cannot
-            be grouped.
         str: identifier of the event content.
         EventObject: event.
         EventData: event data.
@@ -81,9 +192,12 @@ class PsortEventHeap(object):
     """
     event_values_hash = getattr(event_data, '_event_values_hash', None)
 
-    if not event_values_hash:
+    if not event_values_hash or not event_values_hash.startswith(
+        events.EVENT_VALUES_HASH_PREFIX):
       # Note that this is kept for backwards compatibility for event_data
-      # containers that do not have a _event_values_hash attribute value.
+      # containers that do not have a _event_values_hash attribute value or
+      # a value calculated with an older format. Hashes of different formats
+      # cannot be compared to deduplicate events.
       event_data_identifier = event_data.GetIdentifier()
       lookup_key = event_data_identifier.CopyToString()
 
@@ -103,12 +217,20 @@ class PsortEventHeap(object):
       logger.warning('Missing timestamp_desc attribute')
       timestamp_desc = definitions.TIME_DESCRIPTION_UNKNOWN
 
+    event_identifier = event.GetIdentifier()
+    sequence_number = event_identifier.sequence_number or 0
+
     # Note that only events with the same timestamp are stored in the event
     # heap. The event values hash is stored first to cluster events with
-    # similar event values.
+    # similar event values. The sequence number of the event is stored to
+    # sort events with the same values in a deterministic way.
     heapq.heappush(self._heap, (
-        event_values_hash, timestamp_desc, event, event_data,
-        event_data_stream))
+        event_values_hash, timestamp_desc, sequence_number,
+        event, event_data, event_data_stream))
+
+    if (self._storage_reader and
+        len(self._heap) >= self._MAXIMUM_NUMBER_OF_EVENTS):
+      self._WriteSortedRun()
 
 
 class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
@@ -117,7 +239,13 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
   # TODO: move this to a single process engine.
   # pylint: disable=abstract-method
 
-  _HEAP_MAXIMUM_EVENTS = 100000
+  # Maximum number of events or MACB groups in a batch that is formatted by
+  # a formatting worker process.
+  _FORMATTING_BATCH_SIZE = 1000
+
+  # Number of seconds to wait for a formatted batch before checking if the
+  # formatting worker processes are still alive.
+  _FORMATTING_QUEUE_TIMEOUT = 1
 
   _MESSAGE_FORMATTERS_DIRECTORY_NAME = 'formatters'
 
@@ -131,7 +259,16 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     self._events_status = processing_status.EventsStatus()
     self._export_event_heap = PsortEventHeap()
     self._export_event_timestamp = 0
+    self._formatted_batches = {}
+    self._formatting_batch = []
+    self._formatting_input_queue = None
+    self._formatting_output_queue = None
+    self._formatting_processes = []
+    self._maximum_number_of_queued_batches = 0
+    self._next_batch_identifier = 0
+    self._next_batch_to_write = 0
     self._number_of_consumed_events = 0
+    self._queued_batches = {}
     self._output_mediator = None
     self._processing_configuration = None
     self._status = definitions.STATUS_INDICATOR_IDLE
@@ -188,8 +325,7 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
     """
-    if (event.timestamp != self._export_event_timestamp or
-        self._export_event_heap.number_of_events > self._HEAP_MAXIMUM_EVENTS):
+    if event.timestamp != self._export_event_timestamp:
       self._FlushExportBuffer(
           storage_reader, output_module, deduplicate_events=deduplicate_events)
       self._export_event_timestamp = event.timestamp
@@ -215,6 +351,11 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     """
     self._status = definitions.STATUS_INDICATOR_EXPORTING
 
+    # The storage reader is used to read back events of the export event heap
+    # that were written to sorted runs, when a large number of events share
+    # the same timestamp.
+    self._export_event_heap = PsortEventHeap(storage_reader=storage_reader)
+
     time_slice_buffer = None
     time_slice_range = None
 
@@ -229,24 +370,18 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     filter_limit = getattr(event_filter, 'limit', None)
     forward_entries = 0
 
+    # The time slicer exports events around an event of interest that do not
+    # match the event filter, hence the storage cannot select the events.
+    storage_event_filter = None
+    if not time_slice_buffer:
+      storage_event_filter = event_filter
+
     self._events_status.number_of_filtered_events = 0
     self._events_status.number_of_events_from_time_slice = 0
 
-    for event in storage_reader.GetSortedEvents(time_range=time_slice_range):
-      event_data_identifier = event.GetEventDataIdentifier()
-      event_data = storage_reader.GetAttributeContainerByIdentifier(
-          events.EventData.CONTAINER_TYPE, event_data_identifier)
-
-      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
-      if event_data_stream_identifier:
-        event_data_stream = storage_reader.GetAttributeContainerByIdentifier(
-            events.EventDataStream.CONTAINER_TYPE, event_data_stream_identifier)
-      else:
-        event_data_stream = None
-
-      event_identifier = event.GetIdentifier()
-      event_tag = storage_reader.GetEventTagByEventIdentifer(event_identifier)
-
+    for event, event_data, event_data_stream, event_tag in (
+        storage_reader.GetSortedEventsWithData(
+            time_range=time_slice_range, event_filter=storage_event_filter)):
       if time_slice_range and event.timestamp != time_slice.event_timestamp:
         self._events_status.number_of_events_from_time_slice += 1
 
@@ -345,13 +480,11 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
       if macb_group_identifier is None:
         if macb_group:
-          output_module.WriteFieldValuesOfMACBGroup(
-              self._output_mediator, macb_group)
+          self._WriteMACBGroup(output_module, macb_group)
           macb_group = []
 
-        output_module.WriteFieldValues(
-            self._output_mediator, event, event_data, event_data_stream,
-            event_tag)
+        self._WriteEvent(
+            output_module, event, event_data, event_data_stream, event_tag)
 
       else:
         if (last_macb_group_identifier == macb_group_identifier or
@@ -359,8 +492,7 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           macb_group.append((event, event_data, event_data_stream, event_tag))
 
         else:
-          output_module.WriteFieldValuesOfMACBGroup(
-              self._output_mediator, macb_group)
+          self._WriteMACBGroup(output_module, macb_group)
           macb_group = [(event, event_data, event_data_stream, event_tag)]
 
         self._events_status.number_of_macb_grouped_events += 1
@@ -370,8 +502,32 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       last_timestamp_desc = timestamp_desc
 
     if macb_group:
-      output_module.WriteFieldValuesOfMACBGroup(
-          self._output_mediator, macb_group)
+      self._WriteMACBGroup(output_module, macb_group)
+
+  def _QueueFormattingBatch(self, output_module):
+    """Queues the current batch of events to be formatted.
+
+    If the maximum number of queued batches is reached this function waits
+    for formatted batches to be written first.
+
+    Args:
+      output_module (OutputModule): output module.
+
+    Raises:
+      RuntimeError: if a formatting worker process failed.
+    """
+    if not self._formatting_batch:
+      return
+
+    batch_identifier = self._next_batch_identifier
+    self._next_batch_identifier += 1
+
+    self._queued_batches[batch_identifier] = self._formatting_batch
+    self._formatting_input_queue.put((batch_identifier, self._formatting_batch))
+    self._formatting_batch = []
+
+    while len(self._queued_batches) >= self._maximum_number_of_queued_batches:
+      self._WriteFormattedBatches(output_module)
 
   def _ReadMessageFormatters(
       self, output_mediator_object, data_location, custom_formatters_path):
@@ -421,6 +577,71 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
             'Unable to read custrom message formatters from file: {0:s} with '
             'error: {1!s}').format(formatters_file, exception))
 
+  def _StartFormattingProcesses(
+      self, output_module, storage_file_path, number_of_worker_processes):
+    """Starts the formatting worker processes.
+
+    Args:
+      output_module (OutputModule): output module.
+      storage_file_path (str): path of the storage file.
+      number_of_worker_processes (int): number of formatting worker processes
+          to start.
+    """
+    self._formatted_batches = {}
+    self._formatting_batch = []
+    self._formatting_input_queue = multiprocessing.Queue()
+    self._formatting_output_queue = multiprocessing.Queue()
+    self._maximum_number_of_queued_batches = 2 * number_of_worker_processes
+    self._next_batch_identifier = 0
+    self._next_batch_to_write = 0
+    self._queued_batches = {}
+
+    for process_index in range(number_of_worker_processes):
+      process_name = 'Formatting Worker_{0:02d}'.format(process_index)
+      process = output_process.OutputFormattingProcess(
+          self._formatting_input_queue, self._formatting_output_queue,
+          output_module, self._output_mediator, storage_file_path,
+          name=process_name)
+      process.start()
+
+      logger.debug((
+          'Started formatting worker process: {0:s} (PID: {1:d})').format(
+              process_name, process.pid))
+
+      self._formatting_processes.append(process)
+
+  def _StopFormattingProcesses(self, abort=False):
+    """Stops the formatting worker processes.
+
+    Args:
+      abort (Optional[bool]): True if the formatting worker processes should
+          be terminated instead of being signaled to stop.
+    """
+    if not abort:
+      for _ in self._formatting_processes:
+        self._formatting_input_queue.put(None)
+
+    for process in self._formatting_processes:
+      if abort:
+        process.terminate()
+
+      process.join(timeout=self._FORMATTING_QUEUE_TIMEOUT * 5)
+      if process.is_alive():
+        logger.warning('Killing formatting worker process: {0:s}'.format(
+            process.name))
+        process.kill()
+        process.join()
+
+    self._formatting_input_queue.close()
+    self._formatting_output_queue.close()
+
+    self._formatted_batches = {}
+    self._formatting_batch = []
+    self._formatting_input_queue = None
+    self._formatting_output_queue = None
+    self._formatting_processes = []
+    self._queued_batches = {}
+
   def _UpdateForemanProcessStatus(self):
     """Update the foreman process status."""
     used_memory = self._process_information.GetUsedMemory() or 0
@@ -438,10 +659,104 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
+  def _WriteEvent(
+      self, output_module, event, event_data, event_data_stream, event_tag):
+    """Writes an event to the output module.
+
+    If formatting worker processes are used the event is formatted by one of
+    the formatting worker processes before it is written.
+
+    Args:
+      output_module (OutputModule): output module.
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+      event_tag (EventTag): event tag.
+    """
+    if not self._formatting_processes:
+      output_module.WriteFieldValues(
+          self._output_mediator, event, event_data, event_data_stream,
+          event_tag)
+
+    else:
+      self._formatting_batch.append(
+          (False, [(event, event_data, event_data_stream, event_tag)]))
+
+      if len(self._formatting_batch) >= self._FORMATTING_BATCH_SIZE:
+        self._QueueFormattingBatch(output_module)
+
+  def _WriteFormattedBatches(self, output_module):
+    """Waits for a formatted batch and writes the formatted batches in order.
+
+    Args:
+      output_module (OutputModule): output module.
+
+    Raises:
+      RuntimeError: if a formatting worker process failed.
+    """
+    formatted_batch_values = None
+    while not formatted_batch_values:
+      try:
+        formatted_batch_values = self._formatting_output_queue.get(
+            timeout=self._FORMATTING_QUEUE_TIMEOUT)
+      except queue.Empty:
+        for process in self._formatting_processes:
+          if not process.is_alive():
+            raise RuntimeError(
+                'Formatting worker process: {0:s} exited unexpectedly.'.format(
+                    process.name))
+
+    batch_identifier, formatted_batch = formatted_batch_values
+    if formatted_batch is None:
+      raise RuntimeError('Unable to format batch: {0:d}'.format(
+          batch_identifier))
+
+    self._formatted_batches[batch_identifier] = formatted_batch
+
+    # Formatted batches can be returned out of order, hence they are only
+    # written when all preceding batches have been written.
+    while self._next_batch_to_write in self._formatted_batches:
+      formatted_batch = self._formatted_batches.pop(self._next_batch_to_write)
+      batch = self._queued_batches.pop(self._next_batch_to_write)
+      self._next_batch_to_write += 1
+
+      for (is_macb_group, batch_events), field_values_list in zip(
+          batch, formatted_batch):
+        if is_macb_group:
+          output_module.WriteFormattedFieldValuesOfMACBGroup(
+              self._output_mediator, batch_events, field_values_list)
+        else:
+          event = batch_events[0][0]
+          output_module.WriteFormattedFieldValues(
+              self._output_mediator, event, field_values_list[0])
+
+  def _WriteMACBGroup(self, output_module, macb_group):
+    """Writes a MACB group to the output module.
+
+    If formatting worker processes are used the MACB group is formatted by one
+    of the formatting worker processes before it is written.
+
+    Args:
+      output_module (OutputModule): output module.
+      macb_group (list[tuple[event, event_data, event_data_stream, event_tag]]):
+          group of event, event_data, event_data_stream and event_tag objects
+          with identical timestamps, attributes and values.
+    """
+    if not self._formatting_processes:
+      output_module.WriteFieldValuesOfMACBGroup(
+          self._output_mediator, macb_group)
+
+    else:
+      self._formatting_batch.append((True, macb_group))
+
+      if len(self._formatting_batch) >= self._FORMATTING_BATCH_SIZE:
+        self._QueueFormattingBatch(output_module)
+
   def ExportEvents(
       self, storage_reader, output_module, processing_configuration,
-      deduplicate_events=True, event_filter=None, status_update_callback=None,
-      time_slice=None, use_time_slicer=False):
+      deduplicate_events=True, event_filter=None, number_of_worker_processes=0,
+      status_update_callback=None, storage_file_path=None, time_slice=None,
+      use_time_slicer=False):
     """Exports events using an output module.
 
     Args:
@@ -452,8 +767,13 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
       event_filter (Optional[EventObjectFilter]): event filter.
+      number_of_worker_processes (Optional[int]): number of formatting worker
+          processes, where 0 represents events are formatted by the main
+          process.
       status_update_callback (Optional[function]): callback function for status
           updates.
+      storage_file_path (Optional[str]): path of the storage file, which is
+          required when formatting worker processes are used.
       time_slice (Optional[TimeSlice]): slice of time to output.
       use_time_slicer (Optional[bool]): True if the 'time slicer' should be
           used. The 'time slicer' will provide a context of events around
@@ -462,7 +782,13 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     Raises:
       BadConfigOption: if the message formatters file or directory cannot be
           read.
+      RuntimeError: if a formatting worker process failed.
+      ValueError: if formatting worker processes are used and the storage
+          file path is missing.
     """
+    if number_of_worker_processes > 0 and not storage_file_path:
+      raise ValueError('Missing storage file path.')
+
     self._events_status = processing_status.EventsStatus()
     self._processing_configuration = processing_configuration
     self._status_update_callback = status_update_callback
@@ -481,7 +807,11 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     self._output_mediator = self._CreateOutputMediator(
         storage_reader, processing_configuration)
 
-    output_module.WriteHeader(output_mediator)
+    output_module.WriteHeader(self._output_mediator)
+
+    if number_of_worker_processes > 0:
+      self._StartFormattingProcesses(
+          output_module, storage_file_path, number_of_worker_processes)
 
     self._StartStatusUpdateThread()
 
@@ -493,6 +823,12 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           event_filter=event_filter, time_slice=time_slice,
           use_time_slicer=use_time_slicer)
 
+      if self._formatting_processes:
+        self._QueueFormattingBatch(output_module)
+
+        while self._queued_batches:
+          self._WriteFormattedBatches(output_module)
+
       self._status = definitions.STATUS_INDICATOR_COMPLETED
 
     finally:
@@ -500,6 +836,10 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
 
+      if self._formatting_processes:
+        self._StopFormattingProcesses(
+            abort=self._status != definitions.STATUS_INDICATOR_COMPLETED)
+
     output_module.WriteFooter()
 
     # Update the status view one last time.
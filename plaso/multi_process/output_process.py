@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""The multi-process output formatting worker process."""
+
+import multiprocessing
+import signal
+
+from plaso.multi_process import logger
+from plaso.storage import factory as storage_factory
+
+
+class OutputFormattingProcess(multiprocessing.Process):
+  """Multi-processing output formatting worker process.
+
+  The formatting process retrieves batches of events from the input queue,
+  formats them into output field values and puts the output field values
+  on the output queue. Writing the output field values is left to the main
+  process, so that the order of the output remains deterministic.
+
+  A batch consists of a list of (is_macb_group, events) tuples, where events
+  is a list of (event, event_data, event_data_stream, event_tag) tuples. The
+  resulting list contains the list of output field values per tuple in the
+  batch or None if the batch could not be formatted.
+  """
+
+  def __init__(
+      self, input_queue, output_queue, output_module, output_mediator,
+      storage_file_path, **kwargs):
+    """Initializes an output formatting worker process.
+
+    Non-specified keyword arguments (kwargs) are directly passed to
+    multiprocessing.Process.
+
+    Args:
+      input_queue (multiprocessing.Queue): queue of batches of events to
+          format.
+      output_queue (multiprocessing.Queue): queue of formatted batches.
+      output_module (OutputModule): output module used to format the events.
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      storage_file_path (str): path of the storage file, that is opened by
+          the worker process to read information needed for formatting.
+    """
+    super(OutputFormattingProcess, self).__init__(**kwargs)
+    self._input_queue = input_queue
+    self._output_mediator = output_mediator
+    self._output_module = output_module
+    self._output_queue = output_queue
+    self._storage_file_path = storage_file_path
+
+  def _FormatBatch(self, batch):
+    """Formats a batch of events.
+
+    Args:
+      batch (list[tuple[bool, list[tuple[EventObject, EventData,
+          EventDataStream, EventTag]]]]): batch of events to format.
+
+    Returns:
+      list[list[dict[str, str]]]: output field values per name of the events
+          in the batch.
+    """
+    formatted_batch = []
+    for is_macb_group, batch_events in batch:
+      if is_macb_group:
+        field_values_list = self._output_module.GetFieldValuesOfMACBGroup(
+            self._output_mediator, batch_events)
+      else:
+        event, event_data, event_data_stream, event_tag = batch_events[0]
+        field_values = self._output_module.GetFieldValues(
+            self._output_mediator, event, event_data, event_data_stream,
+            event_tag)
+        field_values_list = [field_values]
+
+      formatted_batch.append(field_values_list)
+
+    return formatted_batch
+
+  # This method is part of the multiprocessing.Process interface hence
+  # its name does not follow the style guide.
+  def run(self):
+    """Runs the process."""
+    # Prevent the KeyboardInterrupt being raised inside the process.
+    # The main process is responsible for handling the interrupt.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # The storage reader of the main process cannot be shared with the worker
+    # process, hence the worker process opens the storage file itself.
+    storage_reader = (
+        storage_factory.StorageFactory.CreateStorageReaderForFile(
+            self._storage_file_path))
+    self._output_mediator.SetStorageReader(storage_reader)
+
+    try:
+      queued_item = self._input_queue.get()
+      while queued_item is not None:
+        batch_identifier, batch = queued_item
+
+        try:
+          formatted_batch = self._FormatBatch(batch)
+
+        except Exception as exception:  # pylint: disable=broad-except
+          logger.exception((
+              'Unable to format batch: {0:d} in process: {1:s} with error: '
+              '{2!s}').format(batch_identifier, self.name, exception))
+          formatted_batch = None
+
+        self._output_queue.put((batch_identifier, formatted_batch))
+
+        queued_item = self._input_queue.get()
+
+    finally:
+      self._output_mediator.SetStorageReader(None)
+      if storage_reader:
+        storage_reader.Close()
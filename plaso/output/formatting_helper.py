@@ -2,6 +2,7 @@
 """Output module field formatting helper."""
 
 import abc
+import bisect
 import datetime
 import math
 import pytz
@@ -35,6 +36,154 @@ class EventFormattingHelper(object):
     """
 
 
+class TimestampFormattingHelper(object):
+  """Timestamp formatting helper.
+
+  The helper converts timestamps to date and time strings in a specific time
+  zone using a cache of the time zone offset transitions, instead of creating
+  a datetime object per timestamp. Events are formatted in chronological
+  order, hence the last time zone offset range, date and formatted timestamp
+  are cached as well.
+
+  Attributes:
+    time_zone (datetime.tzinfo): time zone.
+  """
+
+  # The number of days between 0001-01-01 and 1970-01-01.
+  _DAYS_TO_POSIX_EPOCH = 719162
+
+  _POSIX_EPOCH = datetime.datetime(1970, 1, 1)
+
+  def __init__(self, time_zone):
+    """Initializes a timestamp formatting helper.
+
+    Args:
+      time_zone (datetime.tzinfo): time zone.
+    """
+    super(TimestampFormattingHelper, self).__init__()
+    self._cached_date_string = None
+    self._cached_day = None
+    self._cached_iso8601_string = None
+    self._cached_time_zone_offset = None
+    self._cached_time_zone_offset_range = None
+    self._cached_time_zone_offset_string = None
+    self._cached_timestamp = None
+    self._transition_offsets = []
+    self._transition_times = []
+
+    self.time_zone = time_zone
+
+    self._ReadTimeZoneOffsetTransitions()
+
+  def _GetTimeZoneOffset(self, posix_time):
+    """Retrieves the time zone offset of a POSIX timestamp.
+
+    Args:
+      posix_time (int): POSIX timestamp in number of seconds since
+          1970-01-01 00:00:00 UTC.
+
+    Returns:
+      int: time zone offset in number of seconds.
+    """
+    if self._cached_time_zone_offset_range:
+      range_start, range_end = self._cached_time_zone_offset_range
+      if range_start <= posix_time < range_end:
+        return self._cached_time_zone_offset
+
+    if not self._transition_times:
+      datetime_object = datetime.datetime.fromtimestamp(
+          posix_time, tz=self.time_zone)
+      return int(datetime_object.utcoffset().total_seconds())
+
+    index = bisect.bisect_right(self._transition_times, posix_time) - 1
+    index = max(index, 0)
+
+    range_start = self._transition_times[index]
+    if index + 1 < len(self._transition_times):
+      range_end = self._transition_times[index + 1]
+    else:
+      range_end = float('inf')
+
+    time_zone_offset = self._transition_offsets[index]
+
+    self._cached_time_zone_offset = time_zone_offset
+    self._cached_time_zone_offset_range = (range_start, range_end)
+
+    hours, minutes = divmod(abs(time_zone_offset) // 60, 60)
+    self._cached_time_zone_offset_string = '{0:s}{1:02d}:{2:02d}'.format(
+        '-' if time_zone_offset < 0 else '+', hours, minutes)
+
+    return time_zone_offset
+
+  def _ReadTimeZoneOffsetTransitions(self):
+    """Reads the time zone offset transitions from the time zone."""
+    # pylint: disable=protected-access
+    utc_transition_times = getattr(self.time_zone, '_utc_transition_times', [])
+    transition_info = getattr(self.time_zone, '_transition_info', [])
+
+    if utc_transition_times and transition_info:
+      for utc_transition_time, (utc_offset, _, _) in zip(
+          utc_transition_times, transition_info):
+        posix_time = int((
+            utc_transition_time - self._POSIX_EPOCH).total_seconds())
+        self._transition_offsets.append(int(utc_offset.total_seconds()))
+        self._transition_times.append(posix_time)
+
+    else:
+      utc_offset = self.time_zone.utcoffset(None)
+      if utc_offset is not None:
+        self._transition_offsets.append(int(utc_offset.total_seconds()))
+        self._transition_times.append(float('-inf'))
+
+  def CopyToISO8601String(self, timestamp):
+    """Copies a timestamp to an ISO 8601 date and time string.
+
+    Args:
+      timestamp (int): timestamp in number of microseconds since
+          1970-01-01 00:00:00 UTC.
+
+    Returns:
+      str: ISO 8601 date and time string in the time zone, formatted as
+          "YYYY-MM-DDThh:mm:ss.######[+-]##:##".
+
+    Raises:
+      OSError: if the timestamp is out of bounds.
+      OverflowError: if the timestamp is out of bounds.
+      ValueError: if the timestamp is out of bounds.
+    """
+    if timestamp == self._cached_timestamp:
+      return self._cached_iso8601_string
+
+    posix_time, microseconds = divmod(timestamp, 1000000)
+
+    time_zone_offset = self._GetTimeZoneOffset(posix_time)
+    if self._transition_times:
+      time_zone_offset_string = self._cached_time_zone_offset_string
+    else:
+      hours, minutes = divmod(abs(time_zone_offset) // 60, 60)
+      time_zone_offset_string = '{0:s}{1:02d}:{2:02d}'.format(
+          '-' if time_zone_offset < 0 else '+', hours, minutes)
+
+    days, seconds = divmod(posix_time + time_zone_offset, 86400)
+    if days != self._cached_day:
+      date_object = datetime.date.fromordinal(
+          days + self._DAYS_TO_POSIX_EPOCH + 1)
+      self._cached_date_string = date_object.isoformat()
+      self._cached_day = days
+
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+
+    iso8601_string = '{0:s}T{1:02d}:{2:02d}:{3:02d}.{4:06d}{5:s}'.format(
+        self._cached_date_string, hours, minutes, seconds, microseconds,
+        time_zone_offset_string)
+
+    self._cached_iso8601_string = iso8601_string
+    self._cached_timestamp = timestamp
+
+    return iso8601_string
+
+
 class FieldFormattingHelper(object):
   """Output module field formatting helper."""
 
@@ -51,6 +200,7 @@ class FieldFormattingHelper(object):
     self._callback_functions = {}
     self._event_data_stream_field_names = event_data_stream.GetAttributeNames()
     self._event_tag_field_names = []
+    self._timestamp_formatting_helper = None
 
     for field_name, callback_name in self._FIELD_FORMAT_CALLBACKS.items():
       if callback_name == '_FormatTag':
@@ -102,18 +252,13 @@ class FieldFormattingHelper(object):
       if output_mediator.time_zone != pytz.UTC or date_time.time_zone_offset:
         # For output in a specific time zone overwrite the date, time in
         # seconds and time zone offset in the UTC ISO8601 string.
-        year, month, day_of_month, hours, minutes, seconds = (
-            date_time.GetDateWithTimeOfDay())
+        timestamp_formatting_helper = self._GetTimestampFormattingHelper(
+            output_mediator)
 
         try:
-          datetime_object = datetime.datetime(
-              year, month, day_of_month, hours, minutes, seconds,
-              tzinfo=pytz.UTC)
-
-          datetime_object = datetime_object.astimezone(
-              output_mediator.time_zone)
-
-          isoformat_string = datetime_object.isoformat()
+          posix_timestamp = date_time.CopyToPosixTimestamp()
+          isoformat_string = timestamp_formatting_helper.CopyToISO8601String(
+              posix_timestamp * 1000000)
           iso8601_string = ''.join([
               isoformat_string[:19], iso8601_string[19:-6],
               isoformat_string[-6:]])
@@ -142,16 +287,12 @@ class FieldFormattingHelper(object):
       if not timestamp:
         return '0000-00-00T00:00:00.000000+00:00'
 
-      try:
-        datetime_object = datetime.datetime(1970, 1, 1) + datetime.timedelta(
-            microseconds=timestamp)
-
-        datetime_object = datetime_object.astimezone(output_mediator.time_zone)
+      timestamp_formatting_helper = self._GetTimestampFormattingHelper(
+          output_mediator)
 
-        iso8601_string = datetime_object.isoformat()
-        iso8601_string = '{0:s}.{1:06d}{2:s}'.format(
-            iso8601_string[:19], datetime_object.microsecond,
-            iso8601_string[-6:])
+      try:
+        iso8601_string = timestamp_formatting_helper.CopyToISO8601String(
+            timestamp)
 
       except (OSError, OverflowError, TypeError, ValueError) as exception:
         iso8601_string = '0000-00-00T00:00:00.000000+00:00'
@@ -544,6 +685,23 @@ class FieldFormattingHelper(object):
 
   # pylint: enable=unused-argument
 
+  def _GetTimestampFormattingHelper(self, output_mediator):
+    """Retrieves the timestamp formatting helper of the output time zone.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+
+    Returns:
+      TimestampFormattingHelper: timestamp formatting helper.
+    """
+    time_zone = output_mediator.time_zone
+    if (not self._timestamp_formatting_helper or
+        self._timestamp_formatting_helper.time_zone != time_zone):
+      self._timestamp_formatting_helper = TimestampFormattingHelper(time_zone)
+
+    return self._timestamp_formatting_helper
+
   def _ReportEventError(self, event, event_data, error_message):
     """Reports an event related error.
 
@@ -72,6 +72,42 @@ class OutputModule(object):
     """Closes the output."""
     return
 
+  def GetFieldValues(
+      self, output_mediator, event, event_data, event_data_stream, event_tag):
+    """Retrieves the output field values.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+      event_tag (EventTag): event tag.
+
+    Returns:
+      dict[str, str]: output field values per name.
+    """
+    return self._GetFieldValues(
+        output_mediator, event, event_data, event_data_stream, event_tag)
+
+  def GetFieldValuesOfMACBGroup(self, output_mediator, macb_group):
+    """Retrieves the output field values of a MACB group.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      macb_group (list[tuple[event, event_data, event_data_stream, event_tag]]):
+          group of event, event_data, event_data_stream and event_tag objects
+          with identical timestamps, attributes and values.
+
+    Returns:
+      list[dict[str, str]]: output field values per name of the MACB group.
+    """
+    return [
+        self._GetFieldValues(
+            output_mediator, event, event_data, event_data_stream, event_tag)
+        for event, event_data, event_data_stream, event_tag in macb_group]
+
   def GetMissingArguments(self):
     """Retrieves arguments required by the module that have not been specified.
 
@@ -97,10 +133,10 @@ class OutputModule(object):
       event_data_stream (EventDataStream): event data stream.
       event_tag (EventTag): event tag.
     """
-    field_values = self._GetFieldValues(
+    field_values = self.GetFieldValues(
         output_mediator, event, event_data, event_data_stream, event_tag)
 
-    self._WriteFieldValues(output_mediator, field_values)
+    self.WriteFormattedFieldValues(output_mediator, event, field_values)
 
   def WriteFieldValuesOfMACBGroup(self, output_mediator, macb_group):
     """Writes field values of a MACB group to the output.
@@ -112,9 +148,38 @@ class OutputModule(object):
           group of event, event_data, event_data_stream and event_tag objects
           with identical timestamps, attributes and values.
     """
-    for event, event_data, event_data_stream, event_tag in macb_group:
-      self.WriteFieldValues(
-          output_mediator, event, event_data, event_data_stream, event_tag)
+    field_values_list = self.GetFieldValuesOfMACBGroup(
+        output_mediator, macb_group)
+
+    self.WriteFormattedFieldValuesOfMACBGroup(
+        output_mediator, macb_group, field_values_list)
+
+  def WriteFormattedFieldValues(self, output_mediator, event, field_values):
+    """Writes field values, that were already formatted, to the output.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      event (EventObject): event.
+      field_values (dict[str, str]): output field values per name.
+    """
+    self._WriteFieldValues(output_mediator, field_values)
+
+  def WriteFormattedFieldValuesOfMACBGroup(
+      self, output_mediator, macb_group, field_values_list):
+    """Writes field values of a MACB group, that were already formatted.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      macb_group (list[tuple[event, event_data, event_data_stream, event_tag]]):
+          group of event, event_data, event_data_stream and event_tag objects
+          with identical timestamps, attributes and values.
+      field_values_list (list[dict[str, str]]): output field values per name
+          of the MACB group, as returned by GetFieldValuesOfMACBGroup.
+    """
+    for (event, _, _, _), field_values in zip(macb_group, field_values_list):
+      self.WriteFormattedFieldValues(output_mediator, event, field_values)
 
   def WriteFooter(self):
     """Writes the footer to the output.
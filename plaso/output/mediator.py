@@ -409,6 +409,14 @@ class OutputMediator(object):
     self._language_tag = language_tag
     self._lcid = lcid
 
+  def SetStorageReader(self, storage_reader):
+    """Sets the storage reader.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+    """
+    self._storage_reader = storage_reader
+
   def SetTimeZone(self, time_zone):
     """Sets the time zone.
 
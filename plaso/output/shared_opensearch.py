@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 """Shared functionality for OpenSearch output modules."""
 
+import collections
 import logging
 import os
+import time
+
+from concurrent import futures
 
 from acstore.containers import interface as containers_interface
 
@@ -198,6 +202,21 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
 
   _DEFAULT_FLUSH_INTERVAL = 1000
 
+  # Number of bulk requests that are sent to OpenSearch concurrently.
+  _DEFAULT_NUMBER_OF_BULK_REQUESTS = 4
+
+  # Maximum size of the body of a bulk request, where the size of a serialized
+  # event document is estimated by its number of characters.
+  _MAXIMUM_BULK_REQUEST_SIZE = 10 * 1024 * 1024
+
+  # Maximum number of times event documents that were rejected by OpenSearch
+  # with HTTP status 429 (too many requests) are resent.
+  _MAXIMUM_NUMBER_OF_RETRIES = 5
+
+  # Number of seconds to wait before rejected event documents are resent for
+  # the first time, which is doubled every subsequent time.
+  _RETRY_DELAY = 0.5
+
   # Number of seconds to wait before a request to OpenSearch is timed out.
   _DEFAULT_REQUEST_TIMEOUT = 300
 
@@ -214,6 +233,7 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
   def __init__(self):
     """Initializes an output module."""
     super(SharedOpenSearchOutputModule, self).__init__()
+    self._bulk_requests = set()
     self._client = None
     self._custom_fields = {}
     self._event_documents = []
@@ -224,8 +244,13 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
     self._index_name = None
     self._mappings = None
     self._number_of_buffered_events = 0
+    self._number_of_bulk_requests = self._DEFAULT_NUMBER_OF_BULK_REQUESTS
+    self._number_of_inserted_events = 0
     self._password = None
     self._port = None
+    self._rejected_events_counter = collections.Counter()
+    self._serializer = opensearchpy.JSONSerializer() if opensearchpy else None
+    self._thread_pool_executor = None
     self._username = None
     self._use_ssl = None
     self._ca_certs = None
@@ -278,24 +303,23 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
               exception))
 
   def _FlushEvents(self):
-    """Inserts the buffered event documents into OpenSearch."""
-    try:
-      # pylint: disable=unexpected-keyword-arg
-      bulk_arguments = {
-          'body': self._event_documents,
-          'index': self._index_name,
-          'request_timeout': self._DEFAULT_REQUEST_TIMEOUT}
+    """Inserts the buffered event documents into OpenSearch.
 
-      self._client.bulk(**bulk_arguments)
+    The buffered event documents are split into bulk requests that are sent
+    to OpenSearch by a pool of worker threads. If the maximum number of bulk
+    requests is pending, this function waits for a bulk request to complete.
+    """
+    if self._event_documents and not self._thread_pool_executor:
+      self._thread_pool_executor = futures.ThreadPoolExecutor(
+          max_workers=self._number_of_bulk_requests)
 
-    except (ValueError,
-            opensearchpy.exceptions.OpenSearchException) as exception:
-      # Ignore problematic events
-      logger.warning('Unable to bulk insert with error: {0!s}'.format(
-          exception))
+    for event_documents in self._SerializeEventDocuments():
+      if len(self._bulk_requests) >= self._number_of_bulk_requests:
+        self._WaitForBulkRequests(return_when=futures.FIRST_COMPLETED)
 
-    logger.debug('Inserted {0:d} events into OpenSearch'.format(
-        self._number_of_buffered_events))
+      bulk_request = self._thread_pool_executor.submit(
+          self._SendBulkRequest, event_documents)
+      self._bulk_requests.add(bulk_request)
 
     self._event_documents = []
     self._number_of_buffered_events = 0
@@ -321,13 +345,168 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
 
     return field
 
+  def _SendBulkRequest(self, event_documents):
+    """Sends a bulk request to OpenSearch.
+
+    Event documents that were rejected by OpenSearch with HTTP status 429
+    (too many requests) are resent with an exponential backoff.
+
+    Args:
+      event_documents (list[tuple[str, str]]): serialized action and source
+          of the event documents.
+
+    Returns:
+      tuple[int, collections.Counter]: number of inserted event documents and
+          number of rejected event documents per error type.
+    """
+    number_of_inserted_documents = 0
+    rejected_documents_counter = collections.Counter()
+
+    number_of_retries = 0
+    retry_delay = self._RETRY_DELAY
+
+    while event_documents:
+      if number_of_retries > self._MAXIMUM_NUMBER_OF_RETRIES:
+        rejected_documents_counter['too_many_requests'] += len(
+            event_documents)
+        break
+
+      if number_of_retries:
+        time.sleep(retry_delay)
+        retry_delay *= 2
+
+      number_of_retries += 1
+
+      body = '\n'.join([
+          line for event_document in event_documents
+          for line in event_document])
+
+      try:
+        # pylint: disable=unexpected-keyword-arg
+        response = self._client.bulk(
+            body=body, index=self._index_name,
+            request_timeout=self._DEFAULT_REQUEST_TIMEOUT)
+
+      except (ValueError,
+              opensearchpy.exceptions.OpenSearchException) as exception:
+        if getattr(exception, 'status_code', None) == 429:
+          continue
+
+        # Ignore problematic events
+        logger.warning('Unable to bulk insert with error: {0!s}'.format(
+            exception))
+        rejected_documents_counter[type(exception).__name__] += len(
+            event_documents)
+        break
+
+      if not response.get('errors', False):
+        number_of_inserted_documents += len(event_documents)
+        break
+
+      retry_event_documents = []
+      for event_document, item in zip(
+          event_documents, response.get('items', [])):
+        # An item contains the result of the action, such as "index".
+        result = next(iter(item.values()), {})
+        status = result.get('status', 500)
+
+        if status == 429:
+          retry_event_documents.append(event_document)
+
+        elif status >= 300:
+          error = result.get('error', None)
+          if isinstance(error, dict):
+            error = error.get('type', None)
+          rejected_documents_counter[error or 'unknown'] += 1
+
+        else:
+          number_of_inserted_documents += 1
+
+      event_documents = retry_event_documents
+
+    return number_of_inserted_documents, rejected_documents_counter
+
+  def _SerializeEventDocuments(self):
+    """Serializes the buffered event documents.
+
+    Yields:
+      list[tuple[str, str]]: serialized action and source of the event
+          documents of a bulk request.
+    """
+    bulk_request_size = 0
+    event_documents = []
+
+    for index in range(0, len(self._event_documents), 2):
+      action, source = self._event_documents[index:index + 2]
+      try:
+        event_document = (
+            self._serializer.dumps(action), self._serializer.dumps(source))
+
+      except (TypeError, ValueError,
+              opensearchpy.exceptions.SerializationError) as exception:
+        logger.warning('Unable to serialize event with error: {0!s}'.format(
+            exception))
+        self._rejected_events_counter['serialization_error'] += 1
+        continue
+
+      event_document_size = len(event_document[0]) + len(event_document[1]) + 2
+
+      if (event_documents and bulk_request_size + event_document_size >
+          self._MAXIMUM_BULK_REQUEST_SIZE):
+        yield event_documents
+
+        bulk_request_size = 0
+        event_documents = []
+
+      bulk_request_size += event_document_size
+      event_documents.append(event_document)
+
+    if event_documents:
+      yield event_documents
+
+  def _WaitForBulkRequests(self, return_when=futures.ALL_COMPLETED):
+    """Waits for pending bulk requests to complete.
+
+    Args:
+      return_when (Optional[str]): condition when to stop waiting, such as
+          when all or the first of the bulk requests has completed.
+    """
+    completed_bulk_requests, self._bulk_requests = futures.wait(
+        self._bulk_requests, return_when=return_when)
+
+    for bulk_request in completed_bulk_requests:
+      number_of_inserted_documents, rejected_documents_counter = (
+          bulk_request.result())
+
+      self._number_of_inserted_events += number_of_inserted_documents
+      self._rejected_events_counter.update(rejected_documents_counter)
+
+      logger.debug('Inserted {0:d} events into OpenSearch'.format(
+          number_of_inserted_documents))
+
   def Close(self):
     """Closes connection to OpenSearch.
 
-    Inserts any remaining buffered event documents.
+    Inserts any remaining buffered event documents and waits for pending
+    bulk requests to complete.
     """
     self._FlushEvents()
 
+    if self._thread_pool_executor:
+      self._WaitForBulkRequests()
+
+      self._thread_pool_executor.shutdown(wait=True)
+      self._thread_pool_executor = None
+
+    logger.debug('Inserted {0:d} events into OpenSearch in total'.format(
+        self._number_of_inserted_events))
+
+    for error_type, number_of_events in sorted(
+        self._rejected_events_counter.items()):
+      logger.warning((
+          'OpenSearch rejected {0:d} events with error: {1:s}').format(
+              number_of_events, error_type))
+
     self._client = None
 
   def _GetFieldValues(
@@ -441,6 +620,17 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
     """
     self._mappings = mappings
 
+  def SetNumberOfBulkRequests(self, number_of_bulk_requests):
+    """Sets the number of bulk requests that are sent concurrently.
+
+    Args:
+      number_of_bulk_requests (int): number of bulk requests that are sent to
+          OpenSearch concurrently.
+    """
+    self._number_of_bulk_requests = number_of_bulk_requests
+    logger.debug('OpenSearch number of bulk requests: {0:d}'.format(
+        number_of_bulk_requests))
+
   def SetPassword(self, password):
     """Sets the password.
 
@@ -5,11 +5,18 @@ import abc
 import heapq
 import os
 
+from plaso.lib import bufferlib
 from plaso.output import interface
 
 
 class SortedStringHeap(object):
-  """Heap to sort output strings."""
+  """Heap to sort output strings.
+
+  If the number of strings on the heap exceeds the maximum, the heap is
+  written as a sorted run to a temporary file. The runs are merged with
+  the strings on the heap when the strings are popped, hence the strings
+  are sorted in their entirety with a bounded number of strings in memory.
+  """
 
   _MAXIMUM_NUMBER_OF_STRINGS = 100000
 
@@ -17,14 +24,24 @@ class SortedStringHeap(object):
     """Initializes a heap."""
     super(SortedStringHeap, self).__init__()
     self._heap = []
+    self._merged_strings = None
+    self._sorted_runs = bufferlib.SortedRunsBuffer()
 
-  def IsFull(self):
-    """Determines if the heap is full.
+  @property
+  def number_of_strings(self):
+    """int: number of strings on the heap, including the sorted runs."""
+    return len(self._heap) + self._sorted_runs.number_of_items
 
-    Returns:
-      bool: True if the heap is full.
+  def _MergeStrings(self):
+    """Merges the strings on the heap with the sorted runs.
+
+    Yields:
+      tuple[str, str]: sort key and string.
     """
-    return len(self._heap) >= self._MAXIMUM_NUMBER_OF_STRINGS
+    heap = sorted(self._heap)
+    self._heap = []
+
+    yield from self._sorted_runs.Merge(heap)
 
   def PopString(self):
     """Pops a string from the heap.
@@ -32,6 +49,18 @@ class SortedStringHeap(object):
     Returns:
       str: string.
     """
+    if self._sorted_runs.number_of_runs and not self._merged_strings:
+      self._merged_strings = self._MergeStrings()
+
+    if self._merged_strings:
+      try:
+        _, string = next(self._merged_strings)
+      except StopIteration:
+        self._merged_strings = None
+        return None
+
+      return string
+
     try:
       _, string = heapq.heappop(self._heap)
     except IndexError:
@@ -59,6 +88,10 @@ class SortedStringHeap(object):
     """
     heapq.heappush(self._heap, (sort_key, string))
 
+    if len(self._heap) >= self._MAXIMUM_NUMBER_OF_STRINGS:
+      self._sorted_runs.WriteRun(sorted(self._heap))
+      self._heap = []
+
 
 class TextFileOutputModule(interface.OutputModule):
   """Shared functionality of an output module that writes to a text file."""
@@ -212,27 +245,24 @@ class SortedTextFileOutputModule(TextFileOutputModule):
           for field_name in self._SORT_KEY_FIELD_NAMES])
       self._sorted_strings_heap.PushString(sort_key, output_text)
 
-  def WriteFieldValues(
-      self, output_mediator, event, event_data, event_data_stream, event_tag):
-    """Writes field values to the output.
+  def WriteFormattedFieldValues(self, output_mediator, event, field_values):
+    """Writes field values, that were already formatted, to the output.
 
     Args:
       output_mediator (OutputMediator): mediates interactions between output
           modules and other components, such as storage and dfVFS.
       event (EventObject): event.
-      event_data (EventData): event data.
-      event_data_stream (EventDataStream): event data stream.
-      event_tag (EventTag): event tag.
+      field_values (dict[str, str]): output field values per name.
     """
     sort_key = event.timestamp
     if self._last_sort_key is None:
       self._last_sort_key = sort_key
 
-    if sort_key != self._last_sort_key or self._sorted_strings_heap.IsFull():
+    if sort_key != self._last_sort_key:
       self._FlushSortedStringsHeap()
 
-    super(SortedTextFileOutputModule, self).WriteFieldValues(
-        output_mediator, event, event_data, event_data_stream, event_tag)
+    super(SortedTextFileOutputModule, self).WriteFormattedFieldValues(
+        output_mediator, event, field_values)
 
   def WriteFooter(self):
     """Writes the footer to the output.
@@ -39,6 +39,8 @@ class AndroidAppUsageParser(interface.FileObjectParser):
   NAME = 'android_app_usage'
   DATA_FORMAT = 'Android usage history (usage-history.xml) file'
 
+  TEXT_BASED_FORMAT = True
+
   _HEADER_READ_SIZE = 128
 
   def ParseFileObject(self, parser_mediator, file_object):
@@ -74,6 +74,8 @@ class BodyfileParser(interface.FileObjectParser):
   NAME = 'bodyfile'
   DATA_FORMAT = 'SleuthKit version 3 bodyfile'
 
+  TEXT_BASED_FORMAT = True
+
   _INITIAL_FILE_OFFSET = 0
 
   _UINT32_MAX = (1 << 32) - 1
@@ -87,6 +87,8 @@ class ChromePreferencesParser(interface.FileObjectParser):
 
   DATA_FORMAT = 'Google Chrome Preferences file'
 
+  TEXT_BASED_FORMAT = True
+
   REQUIRED_KEYS = frozenset(['browser', 'extensions'])
 
   _ENCODING = 'utf-8'
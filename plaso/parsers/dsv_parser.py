@@ -15,6 +15,8 @@ from plaso.parsers import interface
 class DSVParser(interface.FileObjectParser):
   """Delimiter separated values (DSV) parser interface."""
 
+  TEXT_BASED_FORMAT = True
+
   # A list that contains the names of all the fields in the log file. This
   # needs to be defined by each DSV parser.
   COLUMNS = []
@@ -40,6 +40,8 @@ class FishHistoryParser(interface.FileObjectParser):
   NAME = 'fish_history'
   DATA_FORMAT = 'Fish history file'
 
+  TEXT_BASED_FORMAT = True
+
   _ENCODING = 'utf-8'
 
   # 50 MiB is the maximum supported fish history file size.
@@ -284,6 +284,30 @@ class FileObjectParser(BaseParser):
   # file size check needs to be performed.
   _MINIMUM_FILE_SIZE = None
 
+  # Value to indicate the parser supports a text-based format. The extraction
+  # skips text-based parsers, without probing them, for data streams that
+  # contain binary data.
+  TEXT_BASED_FORMAT = False
+
+  def CheckFileSize(self, file_size):
+    """Determines if the file size is supported by the parser.
+
+    Args:
+      file_size (int): file size.
+
+    Returns:
+      bool: True if the file size is supported.
+    """
+    if (self._MINIMUM_FILE_SIZE is not None and
+        file_size < self._MINIMUM_FILE_SIZE):
+      return False
+
+    if (self._MAXIMUM_FILE_SIZE is not None and
+        file_size > self._MAXIMUM_FILE_SIZE):
+      return False
+
+    return True
+
   def Parse(self, parser_mediator, file_object):
     """Parses a single file-like object.
 
@@ -302,17 +326,11 @@ class FileObjectParser(BaseParser):
     if file_size == 0:
       return
 
-    if (self._MINIMUM_FILE_SIZE is not None and
-        file_size < self._MINIMUM_FILE_SIZE):
-      raise errors.WrongParser(
-          'File size: {0:d} too small, minimum: {1:d}.'.format(
-              file_size, self._MINIMUM_FILE_SIZE))
-
-    if (self._MAXIMUM_FILE_SIZE is not None and
-        file_size > self._MAXIMUM_FILE_SIZE):
-      raise errors.WrongParser(
-          'File size: {0:d} too large, maximum: {1:d}.'.format(
-              file_size, self._MAXIMUM_FILE_SIZE))
+    if not self.CheckFileSize(file_size):
+      raise errors.WrongParser((
+          'Unsupported file size: {0:d}, minimum: {1!s}, maximum: '
+          '{2!s}.').format(
+              file_size, self._MINIMUM_FILE_SIZE, self._MAXIMUM_FILE_SIZE))
 
     if self._INITIAL_FILE_OFFSET is not None:
       file_object.seek(self._INITIAL_FILE_OFFSET, os.SEEK_SET)
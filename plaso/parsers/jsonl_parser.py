@@ -18,6 +18,8 @@ class JSONLParser(interface.FileObjectParser):
   NAME = 'jsonl'
   DATA_FORMAT = 'JSON-L log file'
 
+  TEXT_BASED_FORMAT = True
+
   _ENCODING = 'utf-8'
 
   _MAXIMUM_LINE_LENGTH = 64 * 1024
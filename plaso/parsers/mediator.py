@@ -5,13 +5,17 @@ import collections
 import datetime
 import time
 
+from dfvfs.lib import definitions as dfvfs_definitions
+
 from plaso.containers import artifacts
+from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import warnings
 from plaso.engine import path_helper
 from plaso.engine import profilers
 from plaso.helpers import language_tags
 from plaso.helpers.windows import languages
+from plaso.serializer import json_serializer
 
 
 class ParserMediator(object):
@@ -56,6 +60,7 @@ class ParserMediator(object):
     self._environment_variables_per_path_spec = None
     self._event_data_stream = None
     self._event_data_stream_identifier = None
+    self._event_data_stream_values_digest = None
     self._extract_winevt_resources = True
     self._extract_winreg_binary_values = False
     self._file_entry = None
@@ -69,11 +74,14 @@ class ParserMediator(object):
     self._number_of_extraction_warnings = 0
     self._number_of_recovery_warnings = 0
     self._parser_chain_components = []
+    self._parser_probes_profiler = None
     self._parsers_cpu_time_profiler = None
     self._parsers_memory_profiler = None
     self._preferred_code_page = None
     self._process_information = None
+    self._record_range = None
     self._resolver_context = resolver_context
+    self._split_record_ranges = False
     self._storage_writer = None
     self._temporary_directory = None
     self._windows_event_log_providers_per_path = None
@@ -325,6 +333,59 @@ class ParserMediator(object):
       self._cached_parser_chain = '/'.join(self._parser_chain_components)
     return self._cached_parser_chain
 
+  def GetRecordIndexRange(self, number_of_records, record_range_size):
+    """Retrieves the indexes of the records the parser should parse.
+
+    Parsers of large record-oriented formats use this function to split
+    the records of a file into ranges that can be parsed by different tasks.
+    If a record range was set only the indexes of that range are returned.
+    Otherwise if splitting record ranges is enabled and the file contains
+    more records than the record range size, an event source is produced for
+    every record range except the first, and the indexes of the first record
+    range are returned. The event sources contain the serialized event data
+    stream, with attribute values such as the digest hashes, so that the data
+    stream is only analyzed once.
+
+    Args:
+      number_of_records (int): number of records in the file.
+      record_range_size (int): maximum number of records per record range.
+
+    Returns:
+      range: indexes of the records to parse.
+    """
+    if self._record_range:
+      first_record_index, number_of_range_records = self._record_range
+      last_record_index = min(
+          first_record_index + number_of_range_records, number_of_records)
+      return range(first_record_index, last_record_index)
+
+    if (not self._split_record_ranges or not self._parser_chain_components or
+        number_of_records <= record_range_size):
+      return range(0, number_of_records)
+
+    event_data_stream_values = None
+    if self._event_data_stream:
+      path_spec = self._event_data_stream.path_spec
+      event_data_stream_values = (
+          json_serializer.JSONAttributeContainerSerializer.WriteSerialized(
+              self._event_data_stream))
+    else:
+      path_spec = self._file_entry.path_spec
+
+    for first_record_index in range(
+        record_range_size, number_of_records, record_range_size):
+      event_source = event_sources.FileEntryEventSource(
+          file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+          path_spec=path_spec)
+      event_source.event_data_stream_values = event_data_stream_values
+      event_source.first_record_index = first_record_index
+      event_source.number_of_records = record_range_size
+      event_source.parser_name = self._parser_chain_components[0]
+
+      self.ProduceEventSource(event_source)
+
+    return range(0, record_range_size)
+
   def GetRelativePath(self):
     """Retrieves the relative path of the current file entry.
 
@@ -440,7 +501,8 @@ class ParserMediator(object):
           self._event_data_stream_identifier)
 
     event_values_hash = events.CalculateEventValuesHash(
-        event_data, self._event_data_stream)
+        event_data, self._event_data_stream,
+        event_data_stream_values_digest=self._event_data_stream_values_digest)
     setattr(event_data, '_event_values_hash', event_values_hash)
 
     self._storage_writer.AddAttributeContainer(event_data)
@@ -464,6 +526,7 @@ class ParserMediator(object):
     if not event_data_stream:
       self._event_data_stream = None
       self._event_data_stream_identifier = None
+      self._event_data_stream_values_digest = None
     else:
       if not event_data_stream.path_spec:
         event_data_stream.path_spec = getattr(
@@ -473,6 +536,8 @@ class ParserMediator(object):
 
       self._event_data_stream = event_data_stream
       self._event_data_stream_identifier = event_data_stream.GetIdentifier()
+      self._event_data_stream_values_digest = (
+          events.CalculateEventDataStreamValuesDigest(event_data_stream))
 
     self.last_activity_timestamp = time.time()
 
@@ -549,6 +614,10 @@ class ParserMediator(object):
     """Resets the active file entry."""
     self._file_entry = None
 
+  def ResetRecordRange(self):
+    """Resets the active record range."""
+    self._record_range = None
+
   def SampleFormatCheckStartTiming(self, parser_name):
     """Starts timing a CPU time sample for profiling.
 
@@ -577,6 +646,17 @@ class ParserMediator(object):
       used_memory = self._process_information.GetUsedMemory() or 0
       self._parsers_memory_profiler.Sample(parser_name, used_memory)
 
+  def SampleParserProbe(self, parser_name, result):
+    """Takes a sample of the result of probing a data stream for profiling.
+
+    Args:
+      parser_name (str): name of the parser.
+      result (str): result of the probe, which is "prefiltered", "unsupported",
+          "failure" or "success".
+    """
+    if self._parser_probes_profiler:
+      self._parser_probes_profiler.Sample(parser_name, result)
+
   def SampleStartTiming(self, parser_name):
     """Starts timing a CPU time sample for profiling.
 
@@ -621,6 +701,7 @@ class ParserMediator(object):
     """
     self._event_data_stream = None
     self._event_data_stream_identifier = None
+    self._event_data_stream_values_digest = None
     self._file_entry = file_entry
 
   def SetPreferredCodepage(self, code_page):
@@ -657,6 +738,25 @@ class ParserMediator(object):
     self._language_tag = language_tag
     self._lcid = lcid
 
+  def SetRecordRange(self, first_record_index, number_of_records):
+    """Sets the active record range.
+
+    Args:
+      first_record_index (int): index of the first record to parse.
+      number_of_records (int): number of records to parse.
+    """
+    self._record_range = (first_record_index, number_of_records)
+
+  def SetSplitRecordRanges(self, split_record_ranges):
+    """Sets value to split large files into record ranges.
+
+    Args:
+      split_record_ranges (bool): True if parsers of large record-oriented
+          formats should split the records of a file into ranges that are
+          parsed by different tasks.
+    """
+    self._split_record_ranges = split_record_ranges
+
   def SetStorageWriter(self, storage_writer):
     """Sets the storage writer.
 
@@ -700,6 +800,11 @@ class ParserMediator(object):
           identifier, configuration)
       self._format_checks_cpu_time_profiler.Start()
 
+    if configuration.HaveProfileParserProbes():
+      self._parser_probes_profiler = profilers.ParserProbesProfiler(
+          identifier, configuration)
+      self._parser_probes_profiler.Start()
+
     if configuration.HaveProfileParsers():
       identifier = '{0:s}-parsers'.format(identifier)
 
@@ -719,6 +824,10 @@ class ParserMediator(object):
       self._format_checks_cpu_time_profiler.Stop()
       self._format_checks_cpu_time_profiler = None
 
+    if self._parser_probes_profiler:
+      self._parser_probes_profiler.Stop()
+      self._parser_probes_profiler = None
+
     if self._parsers_cpu_time_profiler:
       self._parsers_cpu_time_profiler.Stop()
       self._parsers_cpu_time_profiler = None
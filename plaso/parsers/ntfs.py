@@ -114,6 +114,9 @@ class NTFSMFTParser(interface.FileObjectParser):
 
   _NAMESPACE_DOS = 2
 
+  # Maximum number of MFT entries that are parsed by a single task.
+  _RECORD_RANGE_SIZE = 262144
+
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification.
@@ -341,7 +344,10 @@ class NTFSMFTParser(interface.FileObjectParser):
           'unable to open $MFT file with error: {0!s}'.format(exception))
       return
 
-    for entry_index in range(0, mft_metadata_file.number_of_file_entries):
+    entry_indexes = parser_mediator.GetRecordIndexRange(
+        mft_metadata_file.number_of_file_entries, self._RECORD_RANGE_SIZE)
+
+    for entry_index in entry_indexes:
       try:
         mft_entry = mft_metadata_file.get_file_entry(entry_index)
         if (not mft_entry.is_empty() and
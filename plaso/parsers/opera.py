@@ -70,6 +70,8 @@ class OperaTypedHistoryParser(interface.FileObjectParser):
   NAME = 'opera_typed_history'
   DATA_FORMAT = 'Opera typed history (typed_history.xml) file'
 
+  TEXT_BASED_FORMAT = True
+
   _HEADER_READ_SIZE = 128
 
   def ParseFileObject(self, parser_mediator, file_object):
@@ -134,6 +136,8 @@ class OperaGlobalHistoryParser(interface.FileObjectParser):
   NAME = 'opera_global'
   DATA_FORMAT = 'Opera global history (global_history.dat) file'
 
+  TEXT_BASED_FORMAT = True
+
   _ENCODING = 'utf-8'
 
   _MAXIMUM_LINE_SIZE = 512
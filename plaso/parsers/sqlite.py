@@ -18,10 +18,15 @@ from plaso.parsers import plugins
 class SQLiteCache(plugins.BasePluginCache):
   """Cache for storing results of SQL queries."""
 
-  def __init__(self):
-    """Initializes a SQLite cache."""
+  def __init__(self, row_caches=None):
+    """Initializes a SQLite cache.
+
+    Args:
+      row_caches (Optional[dict[int, set[int]]]): row caches per query hash,
+          where None represents new row caches.
+    """
     super(SQLiteCache, self).__init__()
-    self._row_caches = {}
+    self._row_caches = row_caches if row_caches is not None else {}
 
   def CacheQueryResults(
       self, sql_results, attribute_name, key_name, column_names):
@@ -86,6 +91,19 @@ class SQLiteCache(plugins.BasePluginCache):
 
     setattr(self, attribute_name, attribute_value)
 
+  def CreateDeltaCache(self):
+    """Creates a cache that shares the row caches of this cache.
+
+    The delta cache is used to parse a database with its WAL file committed
+    after the database itself was parsed, so that only rows that were added or
+    changed by the WAL file are parsed again. The results of SQL queries are
+    not shared, since these can differ once the WAL file is committed.
+
+    Returns:
+      SQLiteCache: delta cache.
+    """
+    return SQLiteCache(row_caches=self._row_caches)
+
   def GetRowCache(self, query):
     """Retrieves the row cache for a specific query.
 
@@ -115,6 +133,14 @@ class SQLiteDatabase(object):
 
   _READ_BUFFER_SIZE = 65536
 
+  # The maximum size of a database that is opened in memory instead of being
+  # copied to a temporary file.
+  _MAXIMUM_IN_MEMORY_DATABASE_SIZE = 64 * 1024 * 1024
+
+  # Opening a database in memory requires sqlite3 deserialize support, which
+  # is available in Python 3.11 or later.
+  _SUPPORTS_IN_MEMORY_DATABASE = hasattr(sqlite3.Connection, 'deserialize')
+
   SCHEMA_QUERY = (
       'SELECT tbl_name, sql '
       'FROM sqlite_master '
@@ -157,10 +183,54 @@ class SQLiteDatabase(object):
       temporary_file.write(data)
       data = file_object.read(self._READ_BUFFER_SIZE)
 
+  def _GetFileObjectSize(self, file_object):
+    """Retrieves the size of a file-like object.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+    """
+    file_object.seek(0, os.SEEK_END)
+    return file_object.tell()
+
+  def _OpenInMemoryDatabase(self, file_object):
+    """Opens a SQLite database from the data of a file-like object in memory.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object.
+
+    Returns:
+      sqlite3.Connection: database connection.
+
+    Raises:
+      sqlite3.DatabaseError: if the database cannot be opened.
+    """
+    file_object.seek(0, os.SEEK_SET)
+    data = file_object.read()
+
+    # An in-memory database does not support WAL, so the file format
+    # versions in the header are changed from WAL (2) to legacy (1).
+    if data[18:20] == b'\x02\x02':
+      data = b''.join([data[:18], b'\x01\x01', data[20:]])
+
+    database = sqlite3.connect(':memory:')
+    try:
+      database.deserialize(data)
+    except sqlite3.DatabaseError:
+      database.close()
+      raise
+
+    return database
+
   def Close(self):
     """Closes the database connection and cleans up the temporary file."""
     self.schema = {}
-    self._database = None
+
+    if self._database:
+      self._database.close()
+      self._database = None
 
     if os.path.exists(self._temp_db_file_path):
       try:
@@ -187,10 +257,11 @@ class SQLiteDatabase(object):
   def Open(self, file_object, wal_file_object=None):
     """Opens a SQLite database file.
 
-    Since pysqlite cannot read directly from a file-like object a temporary
-    copy of the file is made. After creating a copy the database file this
-    function sets up a connection with the database and determines the names
-    of the tables.
+    Since pysqlite cannot read directly from a file-like object, a database
+    without a Write-Ahead Log (WAL) file of up to 64 MiB is opened in memory.
+    Otherwise a temporary copy of the database and WAL file is made. After
+    opening the database this function determines the names of the tables
+    and their columns.
 
     Args:
       file_object (dfvfs.FileIO): file-like object.
@@ -206,28 +277,27 @@ class SQLiteDatabase(object):
     if not file_object:
       raise ValueError('Missing file object.')
 
-    # TODO: Current design copies the entire file into a buffer
-    # that is parsed by each SQLite parser. This is not very efficient,
-    # especially when many SQLite parsers are ran against a relatively
-    # large SQLite database. This temporary file that is created should
-    # be usable by all SQLite parsers so the file should only be read
-    # once in memory and then deleted when all SQLite parsers have completed.
-
     # TODO: Change this into a proper implementation using APSW
     # and virtual filesystems when that will be available.
     # Info: http://apidoc.apsw.googlecode.com/hg/vfs.html#vfs and
     # http://apidoc.apsw.googlecode.com/hg/example.html#example-vfs
-    # Until then, just copy the file into a tempfile and parse it.
+    # Until then, open the database in memory or copy it into a tempfile.
 
-    with tempfile.NamedTemporaryFile(
-        delete=False, dir=self._temporary_directory) as temporary_file:
-      try:
-        self._CopyFileObjectToTemporaryFile(file_object, temporary_file)
-        self._temp_db_file_path = temporary_file.name
+    open_in_memory = bool(
+        not wal_file_object and self._SUPPORTS_IN_MEMORY_DATABASE and
+        self._GetFileObjectSize(file_object) <=
+        self._MAXIMUM_IN_MEMORY_DATABASE_SIZE)
 
-      except IOError:
-        os.remove(temporary_file.name)
-        raise
+    if not open_in_memory:
+      with tempfile.NamedTemporaryFile(
+          delete=False, dir=self._temporary_directory) as temporary_file:
+        try:
+          self._CopyFileObjectToTemporaryFile(file_object, temporary_file)
+          self._temp_db_file_path = temporary_file.name
+
+        except IOError:
+          os.remove(temporary_file.name)
+          raise
 
     if wal_file_object:
       # Create WAL file using same filename so it is available for
@@ -243,8 +313,12 @@ class SQLiteDatabase(object):
           os.remove(temporary_filename)
           raise
 
-    self._database = sqlite3.connect(self._temp_db_file_path)
     try:
+      if open_in_memory:
+        self._database = self._OpenInMemoryDatabase(file_object)
+      else:
+        self._database = sqlite3.connect(self._temp_db_file_path)
+
       self._database.row_factory = sqlite3.Row
       cursor = self._database.cursor()
 
@@ -266,11 +340,13 @@ class SQLiteDatabase(object):
           self.columns_per_table[table_name].append(pragma_result['name'])
 
     except sqlite3.DatabaseError as exception:
-      self._database.close()
-      self._database = None
+      if self._database:
+        self._database.close()
+        self._database = None
 
-      os.remove(self._temp_db_file_path)
-      self._temp_db_file_path = ''
+      if self._temp_db_file_path:
+        os.remove(self._temp_db_file_path)
+        self._temp_db_file_path = ''
       if self._temp_wal_file_path:
         os.remove(self._temp_wal_file_path)
         self._temp_wal_file_path = ''
@@ -305,6 +381,29 @@ class SQLiteParser(interface.FileEntryParser):
 
   _plugin_classes = {}
 
+  def __init__(self):
+    """Initializes a parser."""
+    self._plugins_per_table_name = {}
+    super(SQLiteParser, self).__init__()
+
+  def _GetPluginsForDatabase(self, database):
+    """Retrieves the plugins that could match the tables of a database.
+
+    Args:
+      database (SQLiteDatabase): database.
+
+    Returns:
+      list[SQLitePlugin]: plugins of which the indexed required table is
+          present in the database, in the order the plugins were enabled.
+    """
+    plugin_names = set()
+    for table_name in database.tables:
+      plugin_names.update(self._plugins_per_table_name.get(table_name, []))
+
+    return [
+        plugin for plugin_name, plugin in self._plugins_per_name.items()
+        if plugin_name in plugin_names]
+
   def _OpenDatabaseWithWAL(
       self, parser_mediator, database_file_entry, database_file_object,
       filename):
@@ -404,6 +503,33 @@ class SQLiteParser(interface.FileEntryParser):
     finally:
       parser_mediator.SampleStopTiming(profiling_name)
 
+  def EnablePlugins(self, plugin_includes):
+    """Enables parser plugins.
+
+    Every plugin is indexed by one of its required tables, so that only the
+    plugins of which that table is present in a database need to check the
+    rest of their required tables and columns.
+
+    Args:
+      plugin_includes (set[str]): names of the plugins to enable, where
+          set(['*']) represents all plugins. Note the default plugin, if
+          it exists, is always enabled and cannot be disabled.
+    """
+    super(SQLiteParser, self).EnablePlugins(plugin_includes)
+
+    self._plugins_per_table_name = {}
+
+    for plugin_name, plugin_object in self._plugins_per_name.items():
+      # Plugins without required structure never match a database.
+      if not plugin_object.REQUIRED_STRUCTURE:
+        continue
+
+      table_name = min(plugin_object.REQUIRED_STRUCTURE.keys())
+      if table_name not in self._plugins_per_table_name:
+        self._plugins_per_table_name[table_name] = []
+
+      self._plugins_per_table_name[table_name].append(plugin_name)
+
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification.
@@ -441,7 +567,7 @@ class SQLiteParser(interface.FileEntryParser):
     display_name = parser_mediator.GetDisplayName(file_entry=file_entry)
 
     try:
-      for plugin in self._plugins_per_name.values():
+      for plugin in self._GetPluginsForDatabase(database):
         self._ParseFileEntryWithPlugin(
             parser_mediator, plugin, database, display_name, cache)
     finally:
@@ -462,13 +588,13 @@ class SQLiteParser(interface.FileEntryParser):
 
     parser_mediator.ProduceEventDataStream(event_data_stream)
 
-    # Create a cache in which the resulting tables are cached.
-    cache = SQLiteCache()
+    # Only parse the rows that were added or changed by the WAL file.
+    cache = cache.CreateDeltaCache()
 
     display_name = parser_mediator.GetDisplayName(file_entry=wal_file_entry)
 
     try:
-      for plugin in self._plugins_per_name.values():
+      for plugin in self._GetPluginsForDatabase(database_wal):
         self._ParseFileEntryWithPlugin(
             parser_mediator, plugin, database_wal, display_name, cache)
     finally:
@@ -121,6 +121,8 @@ class TextLogParser(interface.FileObjectParser):
   NAME = 'text'
   DATA_FORMAT = 'text-based log file'
 
+  TEXT_BASED_FORMAT = True
+
   _NON_TEXT_CHARACTERS = frozenset([
       '\x00', '\x01', '\x02', '\x03', '\x04', '\x05', '\x06', '\x0b', '\x0e',
       '\x0f', '\x10', '\x11', '\x12', '\x13', '\x14', '\x15', '\x16', '\x17',
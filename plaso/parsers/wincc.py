@@ -61,6 +61,8 @@ class SIMATICLogParser(interface.FileObjectParser):
   NAME = 'simatic_s7'
   DATA_FORMAT = 'SIMATIC S7 Log file'
 
+  TEXT_BASED_FORMAT = True
+
   DELIMITER = ','
   ENCODING = 'ascii'
   END_OF_LINE = '\r\n'
@@ -168,6 +170,8 @@ class WinCCSysLogParser(interface.FileObjectParser):
   NAME = 'wincc_sys'
   DATA_FORMAT = 'WinCC Sys Log file'
 
+  TEXT_BASED_FORMAT = True
+
   DELIMITER = ','
   ENCODING = 'utf-16-le'
 
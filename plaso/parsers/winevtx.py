@@ -65,6 +65,9 @@ class WinEvtxParser(interface.FileObjectParser):
   NAME = 'winevtx'
   DATA_FORMAT = 'Windows XML EventLog (EVTX) file'
 
+  # Maximum number of event records that are parsed by a single task.
+  _RECORD_RANGE_SIZE = 262144
+
   def _GetEventDataFromRecord(
       self, parser_mediator, record_index, evtx_record, recovered=False):
     """Extract data from a Windows XML EventLog (EVTX) record.
@@ -209,7 +212,10 @@ class WinEvtxParser(interface.FileObjectParser):
     # The call to evt_file.get_record() and access to members of evt_record
     # should be called within a try-except.
 
-    for record_index in range(evtx_file.number_of_records):
+    record_indexes = parser_mediator.GetRecordIndexRange(
+        evtx_file.number_of_records, self._RECORD_RANGE_SIZE)
+
+    for record_index in record_indexes:
       if parser_mediator.abort:
         break
 
@@ -222,6 +228,10 @@ class WinEvtxParser(interface.FileObjectParser):
             'unable to parse event record: {0:d} with error: {1!s}'.format(
                 record_index, exception))
 
+    # The recovered records are only parsed with the first record range.
+    if record_indexes.start > 0:
+      return
+
     for record_index in range(evtx_file.number_of_recovered_records):
       if parser_mediator.abort:
         break
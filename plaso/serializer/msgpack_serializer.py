@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+"""MessagePack attribute container serializer."""
+
+import collections
+
+import msgpack
+
+from acstore.containers import interface as containers_interface
+from acstore.containers import manager as containers_manager
+
+from dfdatetime import interface as dfdatetime_interface
+from dfdatetime import serializer as dfdatetime_serializer
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import path_spec as dfvfs_path_spec
+from dfvfs.path import factory as dfvfs_path_spec_factory
+
+# The following import is needed to make sure TSKTime is registered with
+# the dfDateTime factory.
+from dfvfs.vfs import tsk_file_entry  # pylint: disable=unused-import
+
+from plaso.serializer import logger
+
+
+class MessagePackAttributeContainerSerializer(object):
+  """MessagePack attribute container serializer.
+
+  Values that are not natively supported by MessagePack, such as date and time
+  values and path specifications, are stored as MessagePack extension types.
+
+  If interning callbacks are provided, the parents of path specifications are
+  interned, so that a parent path specification that is shared by many path
+  specifications, such as that of a volume or storage media image, is stored
+  only once and referenced by its identifier.
+  """
+
+  _EXTENSION_TYPE_ATTRIBUTE_CONTAINER = 1
+  _EXTENSION_TYPE_COLLECTIONS_COUNTER = 2
+  _EXTENSION_TYPE_DATE_TIME_VALUES = 3
+  _EXTENSION_TYPE_PATH_SPEC = 4
+  _EXTENSION_TYPE_TUPLE = 5
+
+  def __init__(self, intern_callback=None, lookup_callback=None):
+    """Initializes a MessagePack attribute container serializer.
+
+    Args:
+      intern_callback (Optional[function]): function to intern a serialized
+          parent path specification, that takes the serialized path
+          specification as bytes and returns its identifier as an integer.
+      lookup_callback (Optional[function]): function to look up a serialized
+          parent path specification, that takes the identifier of the path
+          specification as an integer and returns the serialized path
+          specification as bytes.
+    """
+    super(MessagePackAttributeContainerSerializer, self).__init__()
+    self._intern_callback = intern_callback
+    self._interned_path_spec_identifiers = {}
+    self._interned_path_specs = {}
+    self._lookup_callback = lookup_callback
+
+  def _ConvertExtensionTypeToValue(self, code, data):
+    """Converts a MessagePack extension type into a value.
+
+    Args:
+      code (int): extension type code.
+      data (bytes): extension type data.
+
+    Returns:
+      object: value.
+
+    Raises:
+      ValueError: if the extension type is not supported.
+    """
+    value = self._Unpack(data)
+
+    if code == self._EXTENSION_TYPE_ATTRIBUTE_CONTAINER:
+      return self.ReadSerializedDict(value)
+
+    if code == self._EXTENSION_TYPE_COLLECTIONS_COUNTER:
+      return collections.Counter(value)
+
+    if code == self._EXTENSION_TYPE_DATE_TIME_VALUES:
+      return dfdatetime_serializer.Serializer.ConvertDictToDateTimeValues(value)
+
+    if code == self._EXTENSION_TYPE_PATH_SPEC:
+      return self._ConvertListToPathSpec(value)
+
+    if code == self._EXTENSION_TYPE_TUPLE:
+      return tuple(value)
+
+    raise ValueError('Unsupported extension type: {0:d}'.format(code))
+
+  def _ConvertListToPathSpec(self, path_spec_list):
+    """Converts a list into a path specification.
+
+    Args:
+      path_spec_list (list[object]): type indicator, properties and parent
+          of the path specification, where the parent is either a path
+          specification, the identifier of an interned path specification or
+          None.
+
+    Returns:
+      dfvfs.PathSpec: path specification.
+
+    Raises:
+      ValueError: if an interned path specification cannot be looked up.
+    """
+    type_indicator, properties, parent = path_spec_list
+
+    if isinstance(parent, int):
+      parent = self._GetInternedPathSpec(parent)
+
+    if parent:
+      properties['parent'] = parent
+
+    path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+        type_indicator, **properties)
+
+    if type_indicator == dfvfs_definitions.TYPE_INDICATOR_OS:
+      # dfvfs.OSPathSpec() will change the location to an absolute path
+      # here we want to preserve the original location.
+      path_spec.location = properties.get('location', None)
+
+    return path_spec
+
+  def _ConvertPathSpecToList(self, path_spec):
+    """Converts a path specification into a list.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      list[object]: type indicator, properties and parent of the path
+          specification.
+    """
+    properties = {}
+    for property_name in dfvfs_path_spec_factory.Factory.PROPERTY_NAMES:
+      property_value = getattr(path_spec, property_name, None)
+      if property_value is not None:
+        properties[property_name] = property_value
+
+    parent = None
+    if path_spec.HasParent():
+      if self._intern_callback:
+        parent = self._InternPathSpec(path_spec.parent)
+      else:
+        parent = path_spec.parent
+
+    return [path_spec.type_indicator, properties, parent]
+
+  def _ConvertValueToExtensionType(self, value):
+    """Converts a value not natively supported by MessagePack.
+
+    Args:
+      value (object): value.
+
+    Returns:
+      object: MessagePack extension type or value supported by MessagePack.
+
+    Raises:
+      TypeError: if the value type is not supported.
+    """
+    if isinstance(value, collections.Counter):
+      return msgpack.ExtType(
+          self._EXTENSION_TYPE_COLLECTIONS_COUNTER, self._Pack(dict(value)))
+
+    if isinstance(value, tuple):
+      return msgpack.ExtType(self._EXTENSION_TYPE_TUPLE, self._Pack(
+          list(value)))
+
+    if isinstance(value, dfdatetime_interface.DateTimeValues):
+      date_time_dict = (
+          dfdatetime_serializer.Serializer.ConvertDateTimeValuesToDict(value))
+      return msgpack.ExtType(
+          self._EXTENSION_TYPE_DATE_TIME_VALUES, self._Pack(date_time_dict))
+
+    if isinstance(value, dfvfs_path_spec.PathSpec):
+      return msgpack.ExtType(
+          self._EXTENSION_TYPE_PATH_SPEC,
+          self._Pack(self._ConvertPathSpecToList(value)))
+
+    if isinstance(value, containers_interface.AttributeContainer):
+      return msgpack.ExtType(
+          self._EXTENSION_TYPE_ATTRIBUTE_CONTAINER,
+          self._Pack(self.WriteSerializedDict(value)))
+
+    # Subclasses of natively supported types are passed here since strict
+    # types are used to distinguish tuples and collections.Counter.
+    if isinstance(value, dict):
+      return dict(value)
+
+    # MessagePack does not support sets, therefore these are stored as lists.
+    if isinstance(value, (frozenset, list, set)):
+      return list(value)
+
+    if isinstance(value, str):
+      return str(value)
+
+    if isinstance(value, int):
+      return int(value)
+
+    raise TypeError('Unsupported value type: {0!s}'.format(type(value)))
+
+  def _GetInternedPathSpec(self, identifier):
+    """Retrieves an interned path specification.
+
+    Args:
+      identifier (int): identifier of the interned path specification.
+
+    Returns:
+      dfvfs.PathSpec: path specification.
+
+    Raises:
+      ValueError: if the interned path specification cannot be looked up.
+    """
+    path_spec = self._interned_path_specs.get(identifier, None)
+    if not path_spec:
+      data = None
+      if self._lookup_callback:
+        data = self._lookup_callback(identifier)
+
+      if not data:
+        raise ValueError('Missing interned path specification: {0:d}'.format(
+            identifier))
+
+      path_spec = self._ConvertListToPathSpec(self._Unpack(data))
+
+      self._interned_path_specs[identifier] = path_spec
+      self._interned_path_spec_identifiers[path_spec] = identifier
+
+    return path_spec
+
+  def _InternPathSpec(self, path_spec):
+    """Interns a path specification.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      int: identifier of the interned path specification.
+    """
+    identifier = self._interned_path_spec_identifiers.get(path_spec, None)
+    if identifier is None:
+      data = self._Pack(self._ConvertPathSpecToList(path_spec))
+      identifier = self._intern_callback(data)
+
+      self._interned_path_spec_identifiers[path_spec] = identifier
+      self._interned_path_specs[identifier] = path_spec
+
+    return identifier
+
+  def _Pack(self, value):
+    """Packs a value with MessagePack.
+
+    Args:
+      value (object): value.
+
+    Returns:
+      bytes: MessagePack serialized value.
+    """
+    return msgpack.packb(
+        value, default=self._ConvertValueToExtensionType, strict_types=True,
+        use_bin_type=True)
+
+  def _Unpack(self, data):
+    """Unpacks a value with MessagePack.
+
+    Args:
+      data (bytes): MessagePack serialized value.
+
+    Returns:
+      object: value.
+    """
+    return msgpack.unpackb(
+        data, ext_hook=self._ConvertExtensionTypeToValue, raw=False,
+        strict_map_key=False)
+
+  def ReadSerialized(self, data):
+    """Reads an attribute container from serialized form.
+
+    Args:
+      data (bytes): MessagePack serialized attribute container.
+
+    Returns:
+      AttributeContainer: attribute container or None.
+    """
+    if data:
+      return self.ReadSerializedDict(self._Unpack(data))
+
+    return None
+
+  def ReadSerializedDict(self, values):
+    """Reads an attribute container from serialized dictionary form.
+
+    Args:
+      values (dict[str, object]): attribute values and the attribute
+          container type as '__container_type__'.
+
+    Returns:
+      AttributeContainer: attribute container or None.
+
+    Raises:
+      ValueError: if the container type or attribute type of an event data
+          attribute container is not supported.
+    """
+    if not values:
+      return None
+
+    container_type = values.pop('__container_type__', None)
+
+    attribute_container = (
+        containers_manager.AttributeContainersManager.CreateAttributeContainer(
+            container_type))
+
+    supported_attribute_names = attribute_container.GetAttributeNames()
+    for attribute_name, attribute_value in values.items():
+      # Be strict about which attributes to set in non event data attribute
+      # containers.
+      if (container_type != 'event_data' and
+          attribute_name not in supported_attribute_names):
+        logger.debug((
+            '[ReadSerializedDict] unsupported attribute name: '
+            '{0:s}.{1:s}').format(container_type, attribute_name))
+        continue
+
+      if container_type == 'event_data':
+        if isinstance(attribute_value, bytes):
+          raise ValueError((
+              'Event data attribute value: {0:s} of type bytes is not '
+              'supported.').format(attribute_name))
+
+        if isinstance(attribute_value, dict):
+          raise ValueError((
+              'Event data attribute value: {0:s} of type dict is not '
+              'supported.').format(attribute_name))
+
+      setattr(attribute_container, attribute_name, attribute_value)
+
+    return attribute_container
+
+  def ReadSerializedValue(self, data):
+    """Reads a value from serialized form.
+
+    Args:
+      data (bytes): MessagePack serialized value.
+
+    Returns:
+      object: value.
+    """
+    return self._Unpack(data)
+
+  def WriteSerialized(self, attribute_container):
+    """Writes an attribute container to serialized form.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+
+    Returns:
+      bytes: MessagePack serialized attribute container.
+    """
+    return self._Pack(self.WriteSerializedDict(attribute_container))
+
+  def WriteSerializedDict(self, attribute_container):
+    """Writes an attribute container to serialized dictionary form.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+
+    Returns:
+      dict[str, object]: attribute values and the attribute container type
+          as '__container_type__'.
+    """
+    values = dict(attribute_container.GetAttributes())
+    values['__container_type__'] = attribute_container.CONTAINER_TYPE
+    return values
+
+  def WriteSerializedValue(self, value):
+    """Writes a value to serialized form.
+
+    Args:
+      value (object): value.
+
+    Returns:
+      bytes: MessagePack serialized value.
+    """
+    return self._Pack(value)
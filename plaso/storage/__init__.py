@@ -11,5 +11,7 @@ schema_helper.SchemaHelper.RegisterDataTypes({
         'json': serializers.JSONDateTimeAttributeSerializer()},
     'dfvfs.PathSpec': {
         'json': serializers.JSONPathSpecAttributeSerializer()},
+    'List[dfvfs.PathSpec]': {
+        'json': serializers.JSONPathSpecsListAttributeSerializer()},
     'List[str]': {
         'json': serializers.JSONStringsListAttributeSerializer()}})
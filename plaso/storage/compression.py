@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""This file contains the attribute container store compression codecs."""
+
+import abc
+import zlib
+
+import lz4.block
+
+try:
+  import zstandard
+except ModuleNotFoundError:
+  zstandard = None
+
+from plaso.lib import definitions
+
+
+class CompressionCodec(abc.ABC):
+  """Compression codec interface.
+
+  Attributes:
+    dictionary (bytes): compression dictionary or None if not set.
+  """
+
+  COMPRESSION_FORMAT = ''
+
+  # Value to indicate the codec supports compression dictionaries.
+  SUPPORTS_DICTIONARY = False
+
+  def __init__(self):
+    """Initializes a compression codec."""
+    super(CompressionCodec, self).__init__()
+    self.dictionary = None
+
+  @abc.abstractmethod
+  def Compress(self, data):
+    """Compresses data.
+
+    Args:
+      data (bytes): uncompressed data.
+
+    Returns:
+      bytes: compressed data.
+    """
+
+  @abc.abstractmethod
+  def Decompress(self, data):
+    """Decompresses data.
+
+    Args:
+      data (bytes): compressed data.
+
+    Returns:
+      bytes: uncompressed data.
+
+    Raises:
+      IOError: if the data cannot be decompressed.
+      OSError: if the data cannot be decompressed.
+    """
+
+  def SetDictionary(self, dictionary):
+    """Sets the compression dictionary.
+
+    Args:
+      dictionary (bytes): compression dictionary.
+
+    Raises:
+      ValueError: if the codec does not support compression dictionaries.
+    """
+    raise ValueError('Compression dictionaries not supported by: {0:s}'.format(
+        self.COMPRESSION_FORMAT))
+
+  def TrainDictionary(self, samples):  # pylint: disable=unused-argument
+    """Trains a compression dictionary.
+
+    Args:
+      samples (list[bytes]): uncompressed data samples.
+
+    Returns:
+      bytes: compression dictionary or None if the codec does not support
+          compression dictionaries or no dictionary could be trained.
+    """
+    return None
+
+
+class LZ4CompressionCodec(CompressionCodec):
+  """LZ4 block compression codec."""
+
+  COMPRESSION_FORMAT = definitions.COMPRESSION_FORMAT_LZ4
+
+  def Compress(self, data):
+    """Compresses data.
+
+    Args:
+      data (bytes): uncompressed data.
+
+    Returns:
+      bytes: compressed data.
+    """
+    return lz4.block.compress(data, store_size=True)
+
+  def Decompress(self, data):
+    """Decompresses data.
+
+    Args:
+      data (bytes): compressed data.
+
+    Returns:
+      bytes: uncompressed data.
+
+    Raises:
+      IOError: if the data cannot be decompressed.
+      OSError: if the data cannot be decompressed.
+    """
+    try:
+      return lz4.block.decompress(data)
+    except (ValueError, lz4.block.LZ4BlockError) as exception:
+      raise IOError('Unable to decompress LZ4 data with error: {0!s}'.format(
+          exception))
+
+
+class ZlibCompressionCodec(CompressionCodec):
+  """zlib compression codec."""
+
+  COMPRESSION_FORMAT = definitions.COMPRESSION_FORMAT_ZLIB
+
+  def Compress(self, data):
+    """Compresses data.
+
+    Args:
+      data (bytes): uncompressed data.
+
+    Returns:
+      bytes: compressed data.
+    """
+    return zlib.compress(data)
+
+  def Decompress(self, data):
+    """Decompresses data.
+
+    Args:
+      data (bytes): compressed data.
+
+    Returns:
+      bytes: uncompressed data.
+
+    Raises:
+      IOError: if the data cannot be decompressed.
+      OSError: if the data cannot be decompressed.
+    """
+    try:
+      return zlib.decompress(data)
+    except zlib.error as exception:
+      raise IOError('Unable to decompress zlib data with error: {0!s}'.format(
+          exception))
+
+
+class ZstdCompressionCodec(CompressionCodec):
+  """Zstandard compression codec.
+
+  Data compressed with a dictionary is stored in frames that contain
+  the identifier of the dictionary, which allows data compressed with
+  and without the dictionary to be decompressed by the same codec.
+  """
+
+  COMPRESSION_FORMAT = definitions.COMPRESSION_FORMAT_ZSTD
+
+  SUPPORTS_DICTIONARY = True
+
+  # The compression level, where 3 is the default of the zstd library.
+  _COMPRESSION_LEVEL = 3
+
+  # The maximum size of a trained compression dictionary.
+  _DICTIONARY_SIZE = 32 * 1024
+
+  def __init__(self):
+    """Initializes a Zstandard compression codec."""
+    super(ZstdCompressionCodec, self).__init__()
+    self._compressor = zstandard.ZstdCompressor(level=self._COMPRESSION_LEVEL)
+    self._decompressor = zstandard.ZstdDecompressor()
+    self._dictionary_compressor = None
+    self._dictionary_decompressor = None
+    self._dictionary_identifier = None
+
+  def Compress(self, data):
+    """Compresses data.
+
+    Args:
+      data (bytes): uncompressed data.
+
+    Returns:
+      bytes: compressed data.
+    """
+    if self._dictionary_compressor:
+      return self._dictionary_compressor.compress(data)
+
+    return self._compressor.compress(data)
+
+  def Decompress(self, data):
+    """Decompresses data.
+
+    Args:
+      data (bytes): compressed data.
+
+    Returns:
+      bytes: uncompressed data.
+
+    Raises:
+      IOError: if the data cannot be decompressed.
+      OSError: if the data cannot be decompressed.
+    """
+    try:
+      frame_parameters = zstandard.get_frame_parameters(data)
+      if not frame_parameters.dict_id:
+        return self._decompressor.decompress(data)
+
+      if frame_parameters.dict_id != self._dictionary_identifier:
+        raise IOError('Missing compression dictionary: {0:d}'.format(
+            frame_parameters.dict_id))
+
+      return self._dictionary_decompressor.decompress(data)
+
+    except zstandard.ZstdError as exception:
+      raise IOError('Unable to decompress zstd data with error: {0!s}'.format(
+          exception))
+
+  def SetDictionary(self, dictionary):
+    """Sets the compression dictionary.
+
+    Args:
+      dictionary (bytes): compression dictionary.
+    """
+    dictionary_data = zstandard.ZstdCompressionDict(dictionary)
+
+    self.dictionary = dictionary
+    self._dictionary_compressor = zstandard.ZstdCompressor(
+        dict_data=dictionary_data, level=self._COMPRESSION_LEVEL)
+    self._dictionary_decompressor = zstandard.ZstdDecompressor(
+        dict_data=dictionary_data)
+    self._dictionary_identifier = dictionary_data.dict_id()
+
+  def TrainDictionary(self, samples):
+    """Trains a compression dictionary.
+
+    Args:
+      samples (list[bytes]): uncompressed data samples.
+
+    Returns:
+      bytes: compression dictionary or None if no dictionary could be
+          trained, for example because there are too few samples.
+    """
+    try:
+      dictionary_data = zstandard.train_dictionary(
+          self._DICTIONARY_SIZE, samples)
+    except zstandard.ZstdError:
+      return None
+
+    return dictionary_data.as_bytes()
+
+
+class CompressionCodecsManager(object):
+  """Compression codecs manager."""
+
+  _codec_classes = {}
+
+  @classmethod
+  def DeregisterCodec(cls, codec_class):
+    """Deregisters a compression codec class.
+
+    Args:
+      codec_class (type): class of the compression codec.
+
+    Raises:
+      KeyError: if the compression codec class is not set for
+          the corresponding compression format.
+    """
+    compression_format = codec_class.COMPRESSION_FORMAT
+    if compression_format not in cls._codec_classes:
+      raise KeyError('Compression codec class not set for: {0:s}.'.format(
+          compression_format))
+
+    del cls._codec_classes[compression_format]
+
+  @classmethod
+  def GetCodec(cls, compression_format):
+    """Retrieves a new compression codec.
+
+    Args:
+      compression_format (str): compression format.
+
+    Returns:
+      CompressionCodec: compression codec or None if the compression format
+          is "none".
+
+    Raises:
+      ValueError: if the compression format is not supported.
+    """
+    if compression_format == definitions.COMPRESSION_FORMAT_NONE:
+      return None
+
+    codec_class = cls._codec_classes.get(compression_format, None)
+    if not codec_class:
+      raise ValueError('Unsupported compression format: {0!s}'.format(
+          compression_format))
+
+    return codec_class()
+
+  @classmethod
+  def GetCompressionFormats(cls):
+    """Retrieves the supported compression formats.
+
+    Returns:
+      list[str]: supported compression formats.
+    """
+    return sorted(
+        [definitions.COMPRESSION_FORMAT_NONE] + list(cls._codec_classes.keys()))
+
+  @classmethod
+  def RegisterCodec(cls, codec_class):
+    """Registers a compression codec class.
+
+    Args:
+      codec_class (type): class of the compression codec.
+
+    Raises:
+      KeyError: if compression codec class is already set for
+          the corresponding compression format.
+    """
+    compression_format = codec_class.COMPRESSION_FORMAT
+    if compression_format in cls._codec_classes:
+      raise KeyError('Compression codec class already set for: {0:s}.'.format(
+          compression_format))
+
+    cls._codec_classes[compression_format] = codec_class
+
+
+CompressionCodecsManager.RegisterCodec(LZ4CompressionCodec)
+CompressionCodecsManager.RegisterCodec(ZlibCompressionCodec)
+
+if zstandard:
+  CompressionCodecsManager.RegisterCodec(ZstdCompressionCodec)
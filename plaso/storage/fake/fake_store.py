@@ -15,6 +15,8 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
   """
 
   _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
   def __init__(self):
@@ -55,6 +57,51 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
 
     return iter(sorted_events.PopEvents())
 
+  def GetSortedEventsWithData(self, time_range=None, event_filter=None):
+    """Retrieves the events in increasing chronological order with their data.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+      event_filter (Optional[EventObjectFilter]): event filter used to
+          select events, which is not used by the fake store.
+
+    Yields:
+      tuple: containing:
+        EventObject: event.
+        EventData: event data.
+        EventDataStream: event data stream or None if not available.
+        EventTag: event tag or None if not available.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    event_tags = {}
+    for event_tag in self.GetAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_TAG):
+      event_identifier = event_tag.GetEventIdentifier()
+      lookup_key = event_identifier.CopyToString()
+      event_tags[lookup_key] = event_tag
+
+    for event in self.GetSortedEvents(time_range=time_range):
+      event_data_identifier = event.GetEventDataIdentifier()
+      event_data = self.GetAttributeContainerByIdentifier(
+          self._CONTAINER_TYPE_EVENT_DATA, event_data_identifier)
+
+      event_data_stream = None
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream = self.GetAttributeContainerByIdentifier(
+            self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+            event_data_stream_identifier)
+
+      event_identifier = event.GetIdentifier()
+      lookup_key = event_identifier.CopyToString()
+      event_tag = event_tags.get(lookup_key, None)
+
+      yield event, event_data, event_data_stream, event_tag
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
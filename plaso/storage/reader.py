@@ -96,6 +96,15 @@ class StorageReader(object):
 
     return event_tags[0]
 
+  def GetCompressionFormat(self):
+    """Retrieves the compression format of the underlying storage file.
+
+    Returns:
+      str: the compression format or None if not supported by the storage
+          file.
+    """
+    return getattr(self._store, 'compression_format', None)
+
   def GetFormatVersion(self):
     """Retrieves the format version of the underlying storage file.
 
@@ -146,6 +155,28 @@ class StorageReader(object):
     """
     return self._store.GetSortedEvents(time_range=time_range)
 
+  def GetSortedEventsWithData(self, time_range=None, event_filter=None):
+    """Retrieves the events in increasing chronological order with their data.
+
+    The event filter allows the store to skip events that cannot match
+    the filter, however the events returned still need to be matched against
+    the event filter.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+      event_filter (Optional[EventObjectFilter]): event filter used to
+          select events.
+
+    Returns:
+      generator(tuple[EventObject, EventData, EventDataStream, EventTag]):
+          generator of the event, its event data, event data stream and event
+          tag, where the event data stream and event tag are None if not
+          available.
+    """
+    return self._store.GetSortedEventsWithData(
+        time_range=time_range, event_filter=event_filter)
+
   def HasAttributeContainers(self, container_type):
     """Determines if a store contains a specific type of attribute container.
 
@@ -23,6 +23,11 @@ class RedisStore(interface.AttributeContainerStore):
   Attribute containers are stored as Redis Hashes.
   All keys are prefixed with the session identifier to avoid collisions.
   Event identifiers are also stored in an index to enable sorting.
+
+  Attributes:
+    read_batch_size (int): maximum number of attribute containers that are
+        read from Redis in a single round trip.
+    serialization_format (str): serialization format.
   """
 
   _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
@@ -34,6 +39,8 @@ class RedisStore(interface.AttributeContainerStore):
 
   DEFAULT_REDIS_URL = 'redis://127.0.0.1/0'
 
+  DEFAULT_READ_BATCH_SIZE = 1000
+
   def __init__(self):
     """Initializes a Redis store."""
     super(RedisStore, self).__init__()
@@ -43,8 +50,41 @@ class RedisStore(interface.AttributeContainerStore):
     self._serializers_profiler = None
     self._task_identifier = None
 
+    self.read_batch_size = self.DEFAULT_READ_BATCH_SIZE
     self.serialization_format = definitions.SERIALIZER_FORMAT_JSON
 
+  def _CreateAttributeContainer(
+      self, container_type, redis_key, serialized_data):
+    """Creates an attribute container from its serialized data.
+
+    Args:
+      container_type (str): attribute container type.
+      redis_key (bytes): Redis key of the attribute container.
+      serialized_data (bytes): serialized attribute container data.
+
+    Returns:
+      AttributeContainer: attribute container or None.
+
+    Raises:
+      IOError: if the serialized data cannot be decoded.
+      OSError: if the serialized data cannot be decoded.
+    """
+    attribute_container = self._DeserializeAttributeContainer(
+        container_type, serialized_data)
+    if not attribute_container:
+      return None
+
+    redis_key = redis_key.decode('utf-8')
+    _, sequence_number = redis_key.split('.')
+    sequence_number = int(sequence_number, 10)
+    identifier = containers_interface.AttributeContainerIdentifier(
+        name=container_type, sequence_number=sequence_number)
+    attribute_container.SetIdentifier(identifier)
+
+    self._UpdateAttributeContainerAfterDeserialize(attribute_container)
+
+    return attribute_container
+
   def _DeserializeAttributeContainer(self, container_type, serialized_data):
     """Deserializes an attribute container.
 
@@ -359,19 +399,9 @@ class RedisStore(interface.AttributeContainerStore):
     """
     redis_hash_name = self._GetRedisHashName(container_type)
     for redis_key, serialized_data in self._redis_client.hscan_iter(
-        redis_hash_name):
-      redis_key = redis_key.decode('utf-8')
-
-      attribute_container = self._DeserializeAttributeContainer(
-          container_type, serialized_data)
-
-      _, sequence_number = redis_key.split('.')
-      sequence_number = int(sequence_number, 10)
-      identifier = containers_interface.AttributeContainerIdentifier(
-          name=container_type, sequence_number=sequence_number)
-      attribute_container.SetIdentifier(identifier)
-
-      self._UpdateAttributeContainerAfterDeserialize(attribute_container)
+        redis_hash_name, count=self.read_batch_size):
+      attribute_container = self._CreateAttributeContainer(
+          container_type, redis_key, serialized_data)
 
       # TODO: map filter expression to Redis native filter.
       if attribute_container.MatchesExpression(filter_expression):
@@ -416,6 +446,10 @@ class RedisStore(interface.AttributeContainerStore):
   def GetSortedEvents(self, time_range=None):
     """Retrieves the events in increasing chronological order.
 
+    The events are read in batches, where the keys of the next batch are read
+    from the event index in the same round trip as the events of the current
+    batch.
+
     Args:
       time_range (Optional[TimeRange]): This argument is not supported by the
           Redis store.
@@ -430,15 +464,27 @@ class RedisStore(interface.AttributeContainerStore):
     if time_range:
       raise RuntimeError('Not supported')
 
-    for redis_key, _ in self._redis_client.zscan_iter(event_index_name):
-      redis_key = redis_key.decode('utf-8')
+    redis_hash_name = self._GetRedisHashName(self._CONTAINER_TYPE_EVENT)
+
+    redis_keys = self._redis_client.zrange(
+        event_index_name, 0, self.read_batch_size - 1)
+    next_index = len(redis_keys)
+
+    while redis_keys:
+      pipeline = self._redis_client.pipeline(transaction=False)
+      pipeline.hmget(redis_hash_name, redis_keys)
+      pipeline.zrange(
+          event_index_name, next_index, next_index + self.read_batch_size - 1)
+      serialized_values, next_redis_keys = pipeline.execute()
+
+      for redis_key, serialized_data in zip(redis_keys, serialized_values):
+        event = self._CreateAttributeContainer(
+            self._CONTAINER_TYPE_EVENT, redis_key, serialized_data)
+        if event:
+          yield event
 
-      container_type, sequence_number = redis_key.split('.')
-      sequence_number = int(sequence_number, 10)
-      identifier = containers_interface.AttributeContainerIdentifier(
-          name=container_type, sequence_number=sequence_number)
-      yield self.GetAttributeContainerByIdentifier(
-          self._CONTAINER_TYPE_EVENT, identifier)
+      redis_keys = next_redis_keys
+      next_index += len(redis_keys)
 
   def HasAttributeContainers(self, container_type):
     """Determines if the store contains a specific type of attribute container.
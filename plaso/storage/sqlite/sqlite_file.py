@@ -3,15 +3,108 @@
 
 import ast
 import json
+import re
 import sqlite3
-import zlib
-
 from acstore import sqlite_store
 from acstore.containers import interface as containers_interface
+from acstore.helpers import schema as schema_helper
 
 from plaso.containers import events
 from plaso.lib import definitions
 from plaso.serializer import json_serializer
+from plaso.storage import compression
+
+try:
+  from plaso.serializer import msgpack_serializer
+except ModuleNotFoundError:
+  msgpack_serializer = None
+
+
+class MessagePackSQLiteSchemaHelper(sqlite_store.SQLiteSchemaHelper):
+  """SQLite schema helper that serializes values with MessagePack.
+
+  Values of data types that do not map to a SQLite data type, such as path
+  specifications, are stored as MessagePack serialized BLOBs.
+  """
+
+  def __init__(self, serializer):
+    """Initializes a SQLite schema helper.
+
+    Args:
+      serializer (MessagePackAttributeContainerSerializer): MessagePack
+          serializer.
+    """
+    super(MessagePackSQLiteSchemaHelper, self).__init__()
+    self._serializer = serializer
+
+  def DeserializeValue(self, data_type, value):
+    """Deserializes a value.
+
+    Args:
+      data_type (str): schema data type.
+      value (object): serialized value.
+
+    Returns:
+      object: runtime value.
+
+    Raises:
+      IOError: if the schema data type is not supported.
+      OSError: if the schema data type is not supported.
+    """
+    if (value is None or data_type in self._MAPPINGS or
+        data_type == 'AttributeContainerIdentifier'):
+      return super(MessagePackSQLiteSchemaHelper, self).DeserializeValue(
+          data_type, value)
+
+    if not schema_helper.SchemaHelper.HasDataType(data_type):
+      raise IOError('Unsupported data type: {0:s}'.format(data_type))
+
+    try:
+      return self._serializer.ReadSerializedValue(value)
+    except (TypeError, ValueError) as exception:
+      raise IOError('Unable to read serialized value: {0!s}'.format(
+          exception))
+
+  def GetStorageDataType(self, data_type):
+    """Retrieves the storage data type.
+
+    Args:
+      data_type (str): schema data type.
+
+    Returns:
+      str: corresponding SQLite data type.
+    """
+    if data_type == 'AttributeContainerIdentifier':
+      return 'TEXT'
+
+    return self._MAPPINGS.get(data_type, 'BLOB')
+
+  def SerializeValue(self, data_type, value):
+    """Serializes a value.
+
+    Args:
+      data_type (str): schema data type.
+      value (object): runtime value.
+
+    Returns:
+      object: serialized value.
+
+    Raises:
+      IOError: if the schema data type is not supported.
+      OSError: if the schema data type is not supported.
+    """
+    if (value is None or data_type in self._MAPPINGS or
+        data_type == 'AttributeContainerIdentifier'):
+      return super(MessagePackSQLiteSchemaHelper, self).SerializeValue(
+          data_type, value)
+
+    if not schema_helper.SchemaHelper.HasDataType(data_type):
+      raise IOError('Unsupported data type: {0:s}'.format(data_type))
+
+    try:
+      return self._serializer.WriteSerializedValue(value)
+    except (TypeError, ValueError) as exception:
+      raise IOError('Unable to serialize value: {0!s}'.format(exception))
 
 
 class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
@@ -19,13 +112,14 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
   Attributes:
     compression_format (str): compression format.
+    serialization_format (str): serialization format.
   """
 
-  _FORMAT_VERSION = 20230327
+  _FORMAT_VERSION = 20261016
 
   _APPEND_COMPATIBLE_FORMAT_VERSION = 20230327
 
-  _UPGRADE_COMPATIBLE_FORMAT_VERSION = 20230327
+  _UPGRADE_COMPATIBLE_FORMAT_VERSION = 20261016
 
   _READ_COMPATIBLE_FORMAT_VERSION = 20221023
 
@@ -33,13 +127,79 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       'hostname', 'operating_system', 'path', 'source_configuration',
       'time_zone', 'user_account'])
 
+  # Attributes that were added to the schema of an attribute container type
+  # and the format version they were introduced in. These attributes are not
+  # stored in storage files of an older format version.
+  _ADDED_SCHEMA_ATTRIBUTES = {
+      'event_source': [
+          ('event_data_stream_values', 20261016),
+          ('file_size', 20261016),
+          ('first_record_index', 20261016),
+          ('number_of_records', 20261016),
+          ('parser_name', 20261016)]}
+
   _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
+  # The event index contains the values of an event and its event data that
+  # are commonly used to select events, so that these can be selected without
+  # deserializing the event data. The event index is created together with
+  # the event table and is not available in storage files that contained
+  # events before the event index was introduced.
+  _EVENT_INDEX_TABLE_NAME = 'event_index'
+
+  _EVENT_INDEX_COLUMN_NAMES = [
+      '_event_identifier', 'timestamp', 'timestamp_desc', 'data_type',
+      'parser_chain', '_event_data_identifier']
+
+  _CREATE_EVENT_INDEX_QUERIES = [
+      ('CREATE TABLE event_index (_event_identifier INTEGER PRIMARY KEY, '
+       'timestamp INTEGER, timestamp_desc TEXT, data_type TEXT, '
+       'parser_chain TEXT, _event_data_identifier INTEGER)'),
+      ('CREATE INDEX event_index_per_timestamp '
+       'ON event_index (timestamp)')]
+
+  # The event index columns per event filter attribute name.
+  _EVENT_INDEX_FILTER_COLUMN_NAMES = {
+      '_parser_chain': 'event_index.parser_chain',
+      'data_type': 'event_index.data_type',
+      'timestamp': 'event_index.timestamp',
+      'timestamp_desc': 'event_index.timestamp_desc'}
+
+  # The compression dictionary table contains the compression dictionaries
+  # per attribute container type of compression formats that support them.
+  _COMPRESSION_DICTIONARY_TABLE_NAME = 'compression_dictionary'
+
+  _CREATE_COMPRESSION_DICTIONARY_TABLE_QUERY = (
+      'CREATE TABLE compression_dictionary (container_type TEXT PRIMARY KEY, '
+      '_data BLOB)')
+
+  # The number of serialized attribute containers of a specific type that are
+  # used to train a compression dictionary.
+  _COMPRESSION_DICTIONARY_NUMBER_OF_SAMPLES = 1000
+
+  # The interned path specification table contains the MessagePack serialized
+  # parent path specifications that are referenced by path specifications
+  # in storage files that use the MessagePack serialization format.
+  _INTERNED_PATH_SPEC_TABLE_NAME = 'interned_path_spec'
+
+  _CREATE_INTERNED_PATH_SPEC_TABLE_QUERY = (
+      'CREATE TABLE interned_path_spec (_identifier INTEGER PRIMARY KEY, '
+      '_data BLOB)')
+
+  # The maximum number of attribute containers that are cached before they
+  # are written in bulk.
+  _MAXIMUM_WRITE_CACHE_SIZE = 1000
+
   def __init__(self):
     """Initializes a SQLite-based storage file."""
     super(SQLiteStorageFile, self).__init__()
+    self._compression_codecs = {}
+    self._compression_dictionary_samples = {}
+    self._has_event_index = None
+    self._interned_path_spec_identifiers = None
     self._serializer = json_serializer.JSONAttributeContainerSerializer
     self._serializers_profiler = None
 
@@ -58,14 +218,85 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       IOError: if the format version or the serializer format is not supported.
       OSError: if the format version or the serializer format is not supported.
     """
+    serialization_format = metadata_values.get('serialization_format', None)
+    if serialization_format not in definitions.SERIALIZER_FORMATS:
+      raise IOError('Unsupported serialization format: {0!s}'.format(
+          serialization_format))
+
+    # The attribute container store only supports the JSON serialization
+    # format, which is therefore used to check the other metadata values.
+    store_metadata_values = dict(metadata_values)
+    store_metadata_values['serialization_format'] = (
+        definitions.SERIALIZER_FORMAT_JSON)
+
     super(SQLiteStorageFile, self)._CheckStorageMetadata(
-        metadata_values, check_readable_only=check_readable_only)
+        store_metadata_values, check_readable_only=check_readable_only)
+
+    metadata_values['format_version'] = store_metadata_values['format_version']
 
     compression_format = metadata_values.get('compression_format', None)
+    self._CheckCompressionFormat(compression_format)
+
+  def _CheckCompressionFormat(self, compression_format):
+    """Checks the compression format.
+
+    Args:
+      compression_format (str): compression format.
+
+    Raises:
+      IOError: if the compression format is not supported.
+      OSError: if the compression format is not supported.
+    """
     if compression_format not in definitions.COMPRESSION_FORMATS:
       raise IOError('Unsupported compression format: {0!s}'.format(
           compression_format))
 
+    supported_compression_formats = (
+        compression.CompressionCodecsManager.GetCompressionFormats())
+    if compression_format not in supported_compression_formats:
+      raise IOError('Missing compression format support for: {0:s}'.format(
+          compression_format))
+
+  def _CompressSerializedData(self, container_type, serialized_data):
+    """Compresses serialized attribute container data.
+
+    For compression formats that support compression dictionaries,
+    the first serialized attribute containers of a specific type are used
+    to train a dictionary for the remaining attribute containers of that type,
+    since these are highly redundant.
+
+    Args:
+      container_type (str): attribute container type.
+      serialized_data (bytes): serialized attribute container data.
+
+    Returns:
+      bytes: compressed serialized attribute container data.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    codec = self._GetCompressionCodec(container_type)
+    compressed_data = codec.Compress(serialized_data)
+
+    if codec.SUPPORTS_DICTIONARY and not codec.dictionary:
+      samples = self._compression_dictionary_samples.setdefault(
+          container_type, [])
+
+      # Note that samples is None if training a dictionary has failed.
+      if samples is not None:
+        samples.append(serialized_data)
+
+        if len(samples) >= self._COMPRESSION_DICTIONARY_NUMBER_OF_SAMPLES:
+          dictionary = codec.TrainDictionary(samples)
+          if dictionary:
+            self._WriteCompressionDictionary(container_type, dictionary)
+            codec.SetDictionary(dictionary)
+
+          self._compression_dictionary_samples[container_type] = None
+
+    return compressed_data
+
   def _CreateAttributeContainerFromRow(
       self, container_type, column_names, row, first_column_index):
     """Creates an attribute container of a row in the database.
@@ -89,9 +320,10 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       return super(SQLiteStorageFile, self)._CreateAttributeContainerFromRow(
           container_type, column_names, row, first_column_index)
 
-    if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+    if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
       compressed_data = row[first_column_index]
-      serialized_data = zlib.decompress(compressed_data)
+      codec = self._GetCompressionCodec(container_type)
+      serialized_data = codec.Decompress(compressed_data)
     else:
       compressed_data = b''
       serialized_data = row[first_column_index]
@@ -125,7 +357,8 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       super(SQLiteStorageFile, self)._CreateAttributeContainerTable(
           container_type)
     else:
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+      if (self.compression_format != definitions.COMPRESSION_FORMAT_NONE or
+          self.serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK):
         data_column_type = 'BLOB'
       else:
         data_column_type = 'TEXT'
@@ -149,6 +382,17 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
         raise IOError('Unable to query storage file with error: {0!s}'.format(
             exception))
 
+    elif (container_type == self._CONTAINER_TYPE_EVENT and
+          not self._HasTable(self._EVENT_INDEX_TABLE_NAME)):
+      try:
+        for query in self._CREATE_EVENT_INDEX_QUERIES:
+          self._cursor.execute(query)
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError('Unable to query storage file with error: {0!s}'.format(
+            exception))
+
+      self._has_event_index = True
+
   def _DeserializeAttributeContainer(self, container_type, serialized_data):
     """Deserializes an attribute container.
 
@@ -170,8 +414,11 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       self._serializers_profiler.StartTiming(container_type)
 
     try:
-      serialized_string = serialized_data.decode('utf-8')
-      container = self._serializer.ReadSerialized(serialized_string)
+      if self.serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK:
+        container = self._serializer.ReadSerialized(serialized_data)
+      else:
+        serialized_string = serialized_data.decode('utf-8')
+        container = self._serializer.ReadSerialized(serialized_string)
 
     except UnicodeDecodeError as exception:
       raise IOError('Unable to decode serialized data: {0!s}'.format(exception))
@@ -195,6 +442,232 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
     return container
 
+  def _FlushWriteCache(self, container_type, write_cache):
+    """Flushes attribute container values cached for writing.
+
+    The values are written with a single prepared statement that is executed
+    for every cached attribute container, which does not limit the number of
+    cached attribute containers by the maximum number of SQL variables.
+
+    Args:
+      container_type (str): attribute container type.
+      write_cache (list[tuple[str]]): cached attribute container values.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    column_names = write_cache.pop(0)
+
+    query = 'INSERT INTO {0:s} ({1:s}) VALUES ({2:s})'.format(
+        container_type, ', '.join(column_names),
+        ', '.join(['?'] * len(column_names)))
+
+    if self._storage_profiler:
+      self._storage_profiler.StartTiming('write_new')
+
+    try:
+      self._cursor.executemany(query, write_cache)
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    finally:
+      if self._storage_profiler:
+        self._storage_profiler.StopTiming('write_new')
+
+  def _GetAttributeContainerSchema(self, container_type):
+    """Retrieves the schema of an attribute container.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Returns:
+      dict[str, str]: attribute container schema or an empty dictionary if
+          no schema available.
+    """
+    schema = super(SQLiteStorageFile, self)._GetAttributeContainerSchema(
+        container_type)
+
+    added_attributes = self._ADDED_SCHEMA_ATTRIBUTES.get(container_type, None)
+    if schema and added_attributes and self.format_version:
+      unsupported_attribute_names = [
+          name for name, format_version in added_attributes
+          if self.format_version < format_version]
+      if unsupported_attribute_names:
+        schema = {
+            name: data_type for name, data_type in schema.items()
+            if name not in unsupported_attribute_names}
+
+    return schema
+
+  def _GetCompressionCodec(self, container_type):
+    """Retrieves the compression codec of a specific attribute container type.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Returns:
+      CompressionCodec: compression codec.
+
+    Raises:
+      IOError: when there is an error querying the storage file or if
+          the compression format is not supported.
+      OSError: when there is an error querying the storage file or if
+          the compression format is not supported.
+    """
+    codec = self._compression_codecs.get(container_type, None)
+    if not codec:
+      try:
+        codec = compression.CompressionCodecsManager.GetCodec(
+            self.compression_format)
+      except ValueError as exception:
+        raise IOError(exception)
+
+      if codec.SUPPORTS_DICTIONARY and self._HasTable(
+          self._COMPRESSION_DICTIONARY_TABLE_NAME):
+        query = 'SELECT _data FROM {0:s} WHERE container_type = ?'.format(
+            self._COMPRESSION_DICTIONARY_TABLE_NAME)
+
+        # Use a local cursor since the dictionary is read while the results
+        # of another query are being decompressed.
+        cursor = self._connection.cursor()
+
+        try:
+          cursor.execute(query, (container_type, ))
+          row = cursor.fetchone()
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+          raise IOError(
+              'Unable to query storage file with error: {0!s}'.format(
+                  exception))
+
+        if row:
+          codec.SetDictionary(bytes(row[0]))
+
+      self._compression_codecs[container_type] = codec
+
+    return codec
+
+  def _GetSortedEventsFromEventIndex(self, column_names, time_range=None):
+    """Retrieves the events in increasing chronological order.
+
+    The order and time range are determined by the event index, which
+    prevents a full scan of the event table.
+
+    Args:
+      column_names (list[str]): names of the event columns to retrieve.
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+
+    Yields:
+      EventObject: event.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._CommitWriteCache(self._CONTAINER_TYPE_EVENT)
+    self._CommitWriteCache(self._EVENT_INDEX_TABLE_NAME)
+
+    if not self._attribute_container_sequence_numbers[
+        self._CONTAINER_TYPE_EVENT]:
+      return
+
+    # CROSS JOIN is used to ensure SQLite uses the event index as the outer
+    # loop so that the timestamp index is used to order the events.
+    query_parts = [
+        'SELECT event._identifier, {0:s}'.format(', '.join([
+            'event.{0:s}'.format(name) for name in column_names])),
+        'FROM event_index CROSS JOIN event ON '
+        'event._identifier = event_index._event_identifier']
+
+    if time_range:
+      filter_expression = self._GetTimeRangeFilterExpression(
+          time_range, 'event_index.timestamp')
+      if filter_expression:
+        query_parts.append('WHERE {0:s}'.format(filter_expression))
+
+    query_parts.append('ORDER BY event_index.timestamp')
+
+    # Use a local cursor to prevent another query interrupting the generator.
+    cursor = self._connection.cursor()
+
+    try:
+      cursor.execute(' '.join(query_parts))
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    for row in cursor:
+      event = self._CreateAttributeContainerFromRow(
+          self._CONTAINER_TYPE_EVENT, column_names, row, 1)
+
+      identifier = containers_interface.AttributeContainerIdentifier(
+          name=self._CONTAINER_TYPE_EVENT, sequence_number=row[0])
+      event.SetIdentifier(identifier)
+
+      yield event
+
+  def _GetTimeRangeFilterExpression(self, time_range, column_name):
+    """Retrieves a SQL filter expression of a time range.
+
+    Args:
+      time_range (TimeRange): time range used to filter events that fall in
+          a specific period.
+      column_name (str): name of the timestamp column to filter by.
+
+    Returns:
+      str: SQL filter expression or None if the time range is not bounded.
+    """
+    filter_expression = []
+
+    if time_range.start_timestamp:
+      filter_expression.append('{0:s} >= {1:d}'.format(
+          column_name, time_range.start_timestamp))
+
+    if time_range.end_timestamp:
+      filter_expression.append('{0:s} <= {1:d}'.format(
+          column_name, time_range.end_timestamp))
+
+    return ' AND '.join(filter_expression) or None
+
+  def _HasEventIndex(self):
+    """Determines if the storage file contains an event index.
+
+    Returns:
+      bool: True if the storage file contains an event index.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    if self._has_event_index is None:
+      self._has_event_index = self._HasTable(self._EVENT_INDEX_TABLE_NAME)
+
+    return self._has_event_index
+
+  def _RegexpFunction(self, expression, value):
+    """Determines if a value matches a regular expression.
+
+    This function is used as the SQLite regexp function, which implements
+    the REGEXP operator.
+
+    Args:
+      expression (str): regular expression.
+      value (object): value of the column.
+
+    Returns:
+      bool: True if the value matches the regular expression, False otherwise.
+    """
+    if value is None:
+      return False
+
+    try:
+      return re.search(expression, str(value)) is not None
+    except re.error:
+      return False
+
   def _ReadAndCheckStorageMetadata(self, check_readable_only=False):
     """Reads storage metadata and checks that the values are valid.
 
@@ -216,6 +689,41 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     self.compression_format = metadata_values['compression_format']
     self.serialization_format = metadata_values['serialization_format']
 
+    self._SetSerializer()
+
+  def _ReadInternedPathSpec(self, identifier):
+    """Reads an interned path specification.
+
+    Args:
+      identifier (int): identifier of the interned path specification.
+
+    Returns:
+      bytes: MessagePack serialized path specification or None if not
+          available.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    query = 'SELECT _data FROM {0:s} WHERE _identifier = ?'.format(
+        self._INTERNED_PATH_SPEC_TABLE_NAME)
+
+    # Use a local cursor since the path specification is read while the
+    # results of another query are being deserialized.
+    cursor = self._connection.cursor()
+
+    try:
+      cursor.execute(query, (identifier, ))
+      row = cursor.fetchone()
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    if not row:
+      return None
+
+    return row[0]
+
   def _SerializeAttributeContainer(self, container):
     """Serializes an attribute container.
 
@@ -242,23 +750,106 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
               event_data_stream_identifier.CopyToString())
 
       try:
-        serialized_string = json.dumps(json_dict)
-      except TypeError as exception:
+        if self.serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK:
+          serialized_data = self._serializer.WriteSerializedValue(json_dict)
+        else:
+          serialized_data = json.dumps(json_dict)
+          serialized_data = serialized_data.encode('utf-8')
+
+      except (TypeError, ValueError) as exception:
         raise IOError((
             'Unable to serialize attribute container: {0:s} with error: '
             '{1!s}.').format(container.CONTAINER_TYPE, exception))
 
-      if not serialized_string:
+      if not serialized_data:
         raise IOError('Unable to serialize attribute container: {0:s}.'.format(
             container.CONTAINER_TYPE))
 
-      serialized_string = serialized_string.encode('utf-8')
-
     finally:
       if self._serializers_profiler:
         self._serializers_profiler.StopTiming(container.CONTAINER_TYPE)
 
-    return serialized_string
+    return serialized_data
+
+  def _SetSerializer(self):
+    """Sets the serializer for the serialization format.
+
+    Raises:
+      IOError: if the serialization format is not supported.
+      OSError: if the serialization format is not supported.
+    """
+    if self.serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK:
+      if not msgpack_serializer:
+        raise IOError('Missing MessagePack serialization support.')
+
+      self._serializer = (
+          msgpack_serializer.MessagePackAttributeContainerSerializer(
+              intern_callback=self._WriteInternedPathSpec,
+              lookup_callback=self._ReadInternedPathSpec))
+      self._schema_helper = MessagePackSQLiteSchemaHelper(self._serializer)
+
+    else:
+      self._serializer = json_serializer.JSONAttributeContainerSerializer
+      self._schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+  def _WriteCompressionDictionary(self, container_type, dictionary):
+    """Writes a compression dictionary.
+
+    Args:
+      container_type (str): attribute container type.
+      dictionary (bytes): compression dictionary.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    query = 'INSERT INTO {0:s} (container_type, _data) VALUES (?, ?)'.format(
+        self._COMPRESSION_DICTIONARY_TABLE_NAME)
+
+    # Use a local cursor since the dictionary is written while the results
+    # of another query can be iterated.
+    cursor = self._connection.cursor()
+
+    try:
+      if not self._HasTable(self._COMPRESSION_DICTIONARY_TABLE_NAME):
+        cursor.execute(self._CREATE_COMPRESSION_DICTIONARY_TABLE_QUERY)
+
+      cursor.execute(query, (container_type, sqlite3.Binary(dictionary)))
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+  def _WriteEventIndexValues(self, event):
+    """Writes the event index values of a new event.
+
+    Args:
+      event (EventObject): event.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    event_data = None
+    event_data_row_identifier = None
+
+    event_data_identifier = event.GetEventDataIdentifier()
+    if event_data_identifier:
+      # The event data is typically written right before the event and is
+      # therefore expected to be available in the attribute container cache.
+      event_data = self.GetAttributeContainerByIdentifier(
+          self._CONTAINER_TYPE_EVENT_DATA, event_data_identifier)
+      event_data_row_identifier = event_data_identifier.sequence_number
+
+    identifier = event.GetIdentifier()
+
+    values = [
+        identifier.sequence_number, event.timestamp, event.timestamp_desc,
+        getattr(event_data, 'data_type', None),
+        getattr(event_data, '_parser_chain', None), event_data_row_identifier]
+
+    self._CacheAttributeContainerForWrite(
+        self._EVENT_INDEX_TABLE_NAME, self._EVENT_INDEX_COLUMN_NAMES, values)
 
   def _WriteExistingAttributeContainer(self, container):
     """Writes an existing attribute container to the store.
@@ -293,17 +884,9 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     values = []
     for name, data_type in sorted(schema.items()):
       attribute_value = getattr(container, name, None)
-      if attribute_value is not None:
-        if data_type == 'AttributeContainerIdentifier' and isinstance(
-            attribute_value, containers_interface.AttributeContainerIdentifier):
-          attribute_value = attribute_value.CopyToString()
-
-        elif data_type == 'bool':
-          attribute_value = int(attribute_value)
-
-        elif data_type not in self._CONTAINER_SCHEMA_TO_SQLITE_TYPE_MAPPINGS:
-          # TODO: add compression support
-          attribute_value = self._serializer.WriteSerialized(attribute_value)
+      # TODO: add compression support
+      attribute_value = self._schema_helper.SerializeValue(
+          data_type, attribute_value)
 
       column_names.append('{0:s} = ?'.format(name))
       values.append(attribute_value)
@@ -326,6 +909,50 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       if self._storage_profiler:
         self._storage_profiler.StopTiming('write_existing')
 
+  def _WriteInternedPathSpec(self, data):
+    """Writes an interned path specification.
+
+    Args:
+      data (bytes): MessagePack serialized path specification.
+
+    Returns:
+      int: identifier of the interned path specification.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    # Use a local cursor since the path specification is written while the
+    # results of another query can be iterated.
+    cursor = self._connection.cursor()
+
+    try:
+      if self._interned_path_spec_identifiers is None:
+        self._interned_path_spec_identifiers = {}
+
+        if self._HasTable(self._INTERNED_PATH_SPEC_TABLE_NAME):
+          cursor.execute('SELECT _identifier, _data FROM {0:s}'.format(
+              self._INTERNED_PATH_SPEC_TABLE_NAME))
+          self._interned_path_spec_identifiers = {
+              bytes(row[1]): row[0] for row in cursor.fetchall()}
+        else:
+          cursor.execute(self._CREATE_INTERNED_PATH_SPEC_TABLE_QUERY)
+
+      identifier = self._interned_path_spec_identifiers.get(data, None)
+      if identifier is None:
+        query = 'INSERT INTO {0:s} (_data) VALUES (?)'.format(
+            self._INTERNED_PATH_SPEC_TABLE_NAME)
+        cursor.execute(query, (sqlite3.Binary(data), ))
+
+        identifier = cursor.lastrowid
+        self._interned_path_spec_identifiers[data] = identifier
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    return identifier
+
   def _WriteMetadata(self):
     """Writes metadata.
 
@@ -333,6 +960,13 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       IOError: when there is an error querying the attribute container store.
       OSError: when there is an error querying the attribute container store.
     """
+    if self.serialization_format not in definitions.SERIALIZER_FORMATS:
+      raise IOError('Unsupported serialization format: {0!s}'.format(
+          self.serialization_format))
+
+    self._CheckCompressionFormat(self.compression_format)
+    self._SetSerializer()
+
     try:
       self._cursor.execute(self._CREATE_METADATA_TABLE_QUERY)
     except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
@@ -365,6 +999,11 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
     if schema:
       super(SQLiteStorageFile, self)._WriteNewAttributeContainer(container)
+
+      if (container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT and
+          self._HasEventIndex()):
+        self._WriteEventIndexValues(container)
+
     else:
       next_sequence_number = self._GetAttributeContainerNextSequenceNumber(
           container.CONTAINER_TYPE)
@@ -379,8 +1018,9 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
       serialized_data = self._SerializeAttributeContainer(container)
 
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        compressed_data = zlib.compress(serialized_data)
+      if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
+        compressed_data = self._CompressSerializedData(
+            container.CONTAINER_TYPE, serialized_data)
         serialized_data = sqlite3.Binary(compressed_data)
       else:
         compressed_data = ''
@@ -398,6 +1038,19 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
       self._CacheAttributeContainerByIndex(container, next_sequence_number - 1)
 
+  def Close(self):
+    """Closes the file.
+
+    Raises:
+      IOError: if the storage file is already closed.
+      OSError: if the storage file is already closed.
+    """
+    super(SQLiteStorageFile, self).Close()
+    self._compression_codecs = {}
+    self._compression_dictionary_samples = {}
+    self._has_event_index = None
+    self._interned_path_spec_identifiers = None
+
   def GetAttributeContainerByIndex(self, container_type, index):
     """Retrieves a specific attribute container.
 
@@ -511,28 +1164,205 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
     Returns:
       generator(EventObject): event generator.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
     """
     schema = self._GetAttributeContainerSchema(self._CONTAINER_TYPE_EVENT)
     column_names = sorted(schema.keys())
 
+    if self._HasEventIndex():
+      return self._GetSortedEventsFromEventIndex(
+          column_names, time_range=time_range)
+
     filter_expression = None
     if time_range:
-      filter_expression = []
-
-      if time_range.start_timestamp:
-        filter_expression.append('timestamp >= {0:d}'.format(
-            time_range.start_timestamp))
-
-      if time_range.end_timestamp:
-        filter_expression.append('timestamp <= {0:d}'.format(
-            time_range.end_timestamp))
-
-      filter_expression = ' AND '.join(filter_expression)
+      filter_expression = self._GetTimeRangeFilterExpression(
+          time_range, 'timestamp')
 
     return self._GetAttributeContainersWithFilter(
         self._CONTAINER_TYPE_EVENT, column_names=column_names,
         filter_expression=filter_expression, order_by='timestamp')
 
+  def GetSortedEventsWithData(self, time_range=None, event_filter=None):
+    """Retrieves the events in increasing chronological order with their data.
+
+    The event, event data and event tag are retrieved with a single joined
+    query instead of a separate query per attribute container.
+
+    If the storage file contains an event index, the parts of the event
+    filter that apply to the event index columns are evaluated by SQLite,
+    so that events that cannot match the filter are not deserialized. Note
+    that the events returned still need to be matched against the event
+    filter.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+      event_filter (Optional[EventObjectFilter]): event filter used to
+          select events.
+
+    Yields:
+      tuple: containing:
+        EventObject: event.
+        EventData: event data.
+        EventDataStream: event data stream or None if not available.
+        EventTag: event tag or None if not available.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    for container_type in (
+        self._CONTAINER_TYPE_EVENT, self._CONTAINER_TYPE_EVENT_DATA,
+        self._CONTAINER_TYPE_EVENT_TAG, self._EVENT_INDEX_TABLE_NAME):
+      self._CommitWriteCache(container_type)
+
+    if not self._attribute_container_sequence_numbers[
+        self._CONTAINER_TYPE_EVENT]:
+      return
+
+    event_schema = self._GetAttributeContainerSchema(
+        self._CONTAINER_TYPE_EVENT)
+    event_column_names = sorted(event_schema.keys())
+
+    event_data_schema = self._GetAttributeContainerSchema(
+        self._CONTAINER_TYPE_EVENT_DATA)
+    if event_data_schema:
+      event_data_column_names = sorted(event_data_schema.keys())
+    else:
+      event_data_column_names = ['_data']
+
+    column_names = ['event._identifier']
+    column_names.extend([
+        'event.{0:s}'.format(name) for name in event_column_names])
+    column_names.append('event_data._identifier')
+    column_names.extend([
+        'event_data.{0:s}'.format(name) for name in event_data_column_names])
+
+    has_event_index = self._HasEventIndex()
+    if has_event_index:
+      # CROSS JOIN is used to ensure SQLite uses the event index as the outer
+      # loop so that the timestamp index is used to order the events.
+      query_parts = [
+          'FROM event_index CROSS JOIN event ON '
+          'event._identifier = event_index._event_identifier',
+          'JOIN event_data ON '
+          'event_data._identifier = event_index._event_data_identifier']
+      timestamp_column_name = 'event_index.timestamp'
+
+    else:
+      # The event data identifier is stored as a string, such as
+      # "event_data.1", where the sequence number corresponds to the row
+      # identifier.
+      query_parts = [
+          'FROM event JOIN event_data ON event_data._identifier = '
+          'CAST(SUBSTR(event._event_data_identifier, {0:d}) AS '
+          'INTEGER)'.format(len(self._CONTAINER_TYPE_EVENT_DATA) + 2)]
+      timestamp_column_name = 'event.timestamp'
+
+    has_event_tags = self._HasTable(self._CONTAINER_TYPE_EVENT_TAG)
+    if has_event_tags:
+      event_tag_schema = self._GetAttributeContainerSchema(
+          self._CONTAINER_TYPE_EVENT_TAG)
+      event_tag_column_names = sorted(event_tag_schema.keys())
+
+      column_names.append('event_tag._identifier')
+      column_names.extend([
+          'event_tag.{0:s}'.format(name) for name in event_tag_column_names])
+
+      query_parts.append(
+          'LEFT JOIN event_tag ON event_tag._event_identifier = '
+          '\'event.\' || event._identifier')
+
+    filter_expressions = []
+    query_parameters = []
+    if time_range:
+      filter_expression = self._GetTimeRangeFilterExpression(
+          time_range, timestamp_column_name)
+      if filter_expression:
+        filter_expressions.append(filter_expression)
+
+    if event_filter and has_event_index:
+      filter_expression, filter_parameters = (
+          event_filter.GetSQLFilterExpression(
+              self._EVENT_INDEX_FILTER_COLUMN_NAMES))
+      if filter_expression:
+        filter_expressions.append('({0:s})'.format(filter_expression))
+        query_parameters.extend(filter_parameters)
+
+        self._connection.create_function(
+            'regexp', 2, self._RegexpFunction, deterministic=True)
+
+    if filter_expressions:
+      query_parts.append('WHERE {0:s}'.format(' AND '.join(
+          filter_expressions)))
+
+    query_parts.append('ORDER BY {0:s}'.format(timestamp_column_name))
+
+    query = 'SELECT {0:s} {1:s}'.format(
+        ', '.join(column_names), ' '.join(query_parts))
+
+    # Use a local cursor to prevent another query interrupting the generator.
+    cursor = self._connection.cursor()
+
+    try:
+      cursor.execute(query, query_parameters)
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    event_data_identifier_index = len(event_column_names) + 1
+    event_tag_identifier_index = (
+        event_data_identifier_index + len(event_data_column_names) + 1)
+
+    for row in cursor:
+      event = self._CreateAttributeContainerFromRow(
+          self._CONTAINER_TYPE_EVENT, event_column_names, row, 1)
+
+      identifier = containers_interface.AttributeContainerIdentifier(
+          name=self._CONTAINER_TYPE_EVENT, sequence_number=row[0])
+      event.SetIdentifier(identifier)
+
+      # Multiple events typically share the same event data, hence the event
+      # data is only deserialized if not already cached.
+      event_data_row_identifier = row[event_data_identifier_index]
+      event_data = self._GetCachedAttributeContainer(
+          self._CONTAINER_TYPE_EVENT_DATA, event_data_row_identifier - 1)
+      if not event_data:
+        event_data = self._CreateAttributeContainerFromRow(
+            self._CONTAINER_TYPE_EVENT_DATA, event_data_column_names, row,
+            event_data_identifier_index + 1)
+
+        identifier = containers_interface.AttributeContainerIdentifier(
+            name=self._CONTAINER_TYPE_EVENT_DATA,
+            sequence_number=event_data_row_identifier)
+        event_data.SetIdentifier(identifier)
+
+        self._CacheAttributeContainerByIndex(
+            event_data, event_data_row_identifier - 1)
+
+      event_data_stream = None
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream = self.GetAttributeContainerByIdentifier(
+            self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+            event_data_stream_identifier)
+
+      event_tag = None
+      if has_event_tags and row[event_tag_identifier_index] is not None:
+        event_tag = self._CreateAttributeContainerFromRow(
+            self._CONTAINER_TYPE_EVENT_TAG, event_tag_column_names, row,
+            event_tag_identifier_index + 1)
+
+        identifier = containers_interface.AttributeContainerIdentifier(
+            name=self._CONTAINER_TYPE_EVENT_TAG,
+            sequence_number=row[event_tag_identifier_index])
+        event_tag.SetIdentifier(identifier)
+
+      yield event, event_data, event_data_stream, event_tag
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
@@ -108,11 +108,19 @@ class SQLiteStorageFileWriter(writer.StorageWriter):
     return event_source
 
   # pylint: disable=arguments-differ
-  def Open(self, path=None, **unused_kwargs):
+  def Open(
+      self, compression_format=None, path=None, serialization_format=None,
+      **unused_kwargs):
     """Opens the storage writer.
 
     Args:
+      compression_format (Optional[str]): compression format of a new storage
+          file, where None represents the default (zlib). The compression
+          format of an existing storage file is not changed.
       path (Optional[str]): path to the output file.
+      serialization_format (Optional[str]): serialization format of a new
+          storage file, where None represents the default (JSON). The
+          serialization format of an existing storage file is not changed.
 
     Raises:
       IOError: if the storage writer is already opened.
@@ -123,6 +131,12 @@ class SQLiteStorageFileWriter(writer.StorageWriter):
 
     self._store = sqlite_file.SQLiteStorageFile()
 
+    if compression_format:
+      self._store.compression_format = compression_format
+
+    if serialization_format:
+      self._store.serialization_format = serialization_format
+
     if self._serializers_profiler:
       self._store.SetSerializersProfiler(self._serializers_profiler)
 
@@ -3,6 +3,8 @@
 """Tests for the tagging analysis plugin."""
 
 import collections
+import os
+import pickle
 import unittest
 
 from plaso.analysis import tagging
@@ -10,6 +12,7 @@ from plaso.containers import events
 from plaso.containers import reports
 from plaso.lib import definitions
 
+from tests import test_lib as shared_test_lib
 from tests.analysis import test_lib
 
 
@@ -91,6 +94,38 @@ class TaggingAnalysisPluginTest(test_lib.AnalysisPluginTestCase):
         'security_event', 'text_contains']
     self.assertEqual(sorted(labels), expected_labels)
 
+  def testPickle(self):
+    """Tests pickling a tagging analysis plugin with a loaded tagging file."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_file_path = os.path.join(temp_directory, 'tagging.txt')
+      with open(test_file_path, 'w', encoding='utf-8') as file_object:
+        file_object.write((
+            'application_execution\n'
+            '  data_type is \'windows:prefetch\'\n'
+            'text_contains\n'
+            '  body contains \'message\'\n'))
+
+      plugin = tagging.TaggingAnalysisPlugin()
+      plugin.SetAndLoadTagFile(test_file_path)
+
+    # Ensure the match functions are created before pickling.
+    storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
+
+    number_of_event_tags = storage_writer.GetNumberOfAttributeContainers(
+        'event_tag')
+    self.assertEqual(number_of_event_tags, 2)
+
+    plugin = pickle.loads(pickle.dumps(plugin))
+
+    storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
+
+    labels = []
+    for event_tag in storage_writer.GetAttributeContainers(
+        events.EventTag.CONTAINER_TYPE):
+      labels.extend(event_tag.labels)
+
+    self.assertEqual(sorted(labels), ['application_execution', 'text_contains'])
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -7,6 +7,7 @@ import unittest
 
 from plaso.cli import tools
 from plaso.cli.helpers import extraction
+from plaso.lib import definitions
 from plaso.lib import errors
 
 from tests.cli import test_lib as cli_test_lib
@@ -19,7 +20,7 @@ class ExtractionArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
 
   _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--extract_winreg_binary] [--preferred_year YEAR]
-                     [--skip_compressed_streams]
+                     [--skip_compressed_streams] [--worker_timelining]
 
 Test argument parser.
 
@@ -34,6 +35,11 @@ Test argument parser.
   --skip_compressed_streams, --skip-compressed-streams
                         Skip processing file content within compressed
                         streams, such as syslog.gz and syslog.bz2.
+  --worker_timelining, --worker-timelining
+                        Generate events from event data in the worker
+                        processes instead of the main (foreman) process. This
+                        can make processing faster when many worker processes
+                        are used.
 """.format(cli_test_lib.ARGPARSE_OPTIONS)
 
   def testAddArguments(self):
@@ -57,10 +63,22 @@ Test argument parser.
 
     self.assertIsNone(test_tool._preferred_year)
     self.assertTrue(test_tool._process_compressed_streams)
+    self.assertFalse(test_tool._worker_timelining)
 
     with self.assertRaises(errors.BadConfigObject):
       extraction.ExtractionArgumentsHelper.ParseOptions(options, None)
 
+    options.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+    options.worker_timelining = True
+
+    extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
+    self.assertTrue(test_tool._worker_timelining)
+
+    options.task_storage_format = definitions.STORAGE_FORMAT_REDIS
+
+    with self.assertRaises(errors.BadConfigOption):
+      extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
+
     # TODO: improve test coverage.
 
 
@@ -21,8 +21,8 @@ class OpenSearchOutputArgumentsHelperTest(
 
   _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--index_name NAME] [--flush_interval INTERVAL]
-                     [--opensearch-server HOSTNAME] [--opensearch-port PORT]
-                     [--opensearch-user USERNAME]
+                     [--bulk_requests NUMBER] [--opensearch-server HOSTNAME]
+                     [--opensearch-port PORT] [--opensearch-user USERNAME]
                      [--opensearch-password PASSWORD]
                      [--opensearch-mappings PATH]
                      [--opensearch-url-prefix URL_PREFIX] [--use_ssl]
@@ -31,6 +31,9 @@ usage: cli_helper.py [--index_name NAME] [--flush_interval INTERVAL]
 Test argument parser.
 
 {0:s}:
+  --bulk_requests NUMBER, --bulk-requests NUMBER
+                        Number of bulk inserts that are sent to OpenSearch
+                        concurrently.
   --ca_certificates_file_path PATH, --ca-certificates-file-path PATH
                         Path to a file containing a list of root certificates
                         to trust.
@@ -6,6 +6,8 @@ import json
 import os
 import unittest
 
+from concurrent import futures
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.path import factory as path_spec_factory
@@ -67,35 +69,6 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
 
     return results
 
-  def testCalculateDigestHash(self):
-    """Tests the _CalculateDigestHash function."""
-    test_file_path = self._GetTestFilePath(['ímynd.dd'])
-    self._SkipIfPathNotExists(test_file_path)
-
-    test_tool = image_export_tool.ImageExportTool()
-
-    os_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
-    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
-        location='/a_directory/another_file', parent=os_path_spec)
-
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
-    digest_hash = test_tool._CalculateDigestHash(file_entry, '')
-    expected_digest_hash = (
-        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16')
-    self.assertEqual(digest_hash, expected_digest_hash)
-
-    os_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
-    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=12,
-        location='/a_directory', parent=os_path_spec)
-
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
-    with self.assertRaises(dfvfs_errors.BackEndError):
-      test_tool._CalculateDigestHash(file_entry, '')
-
   # TODO: add tests for _CreateSanitizedDestination.
   # TODO: add tests for _Extract.
 
@@ -118,6 +91,42 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       test_tool._ExtractDataStream(
           file_entry, '', temp_directory, output_writer)
 
+  def testExtractDataStreamWithDuplicates(self):
+    """Tests the _ExtractDataStream function with duplicate data streams."""
+    test_tool = image_export_tool.ImageExportTool()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      source_path = os.path.join(temp_directory, 'source')
+      os.mkdir(source_path)
+
+      for filename, data in (
+          ('file1', b'duplicate'), ('file2', b'duplicate'),
+          ('file3', b'unique')):
+        with open(os.path.join(source_path, filename), 'wb') as file_object:
+          file_object.write(data)
+
+      destination_path = os.path.join(temp_directory, 'export')
+
+      for filename in ('file1', 'file2', 'file3'):
+        os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS,
+            location=os.path.join(source_path, filename))
+        file_entry = path_spec_resolver.Resolver.OpenFileEntry(os_path_spec)
+        test_tool._ExtractDataStream(file_entry, '', destination_path)
+
+      exported_files = sorted(
+          os.path.basename(path)
+          for path in self._RecursiveList(destination_path)
+          if os.path.isfile(path))
+      self.assertEqual(exported_files, ['file1', 'file3'])
+
+      self.assertEqual(len(test_tool._digests), 2)
+      self.assertEqual(len(test_tool._paths_by_hash), 2)
+
+      digest = (
+          'e24a5a32c9b8c8637ee33cd72bff6a05a140a48891a1c1a3b06447e1900b6446')
+      self.assertEqual(len(test_tool._paths_by_hash[digest]), 2)
+
   def testExtractFileEntry(self):
     """Tests the _ExtractFileEntry function."""
     test_file_path = self._GetTestFilePath(['ímynd.dd'])
@@ -136,6 +145,31 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
       test_tool._ExtractFileEntry(file_entry, temp_directory, output_writer)
 
+  def testExtractPathSpec(self):
+    """Tests the _ExtractPathSpec function."""
+    test_tool = image_export_tool.ImageExportTool()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      source_file_path = os.path.join(temp_directory, 'source_file')
+      with open(source_file_path, 'wb') as file_object:
+        file_object.write(b'test data')
+
+      destination_path = os.path.join(temp_directory, 'export')
+
+      os_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=source_file_path)
+
+      with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        future = executor.submit(
+            test_tool._ExtractPathSpec, os_path_spec, destination_path)
+        future.result()
+
+      exported_files = [
+          path for path in self._RecursiveList(destination_path)
+          if os.path.isfile(path)]
+      self.assertEqual(len(exported_files), 1)
+      self.assertEqual(os.path.basename(exported_files[0]), 'source_file')
+
   # TODO: add tests for _ExtractWithFilter.
   # TODO: add tests for _GetSourceFileSystem.
 
@@ -185,7 +219,23 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
     file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
     with shared_test_lib.TempDirectory() as temp_directory:
       destination_path = os.path.join(temp_directory, 'another_file')
-      test_tool._WriteFileEntry(file_entry, '', destination_path)
+      digest_hash = test_tool._WriteFileEntry(file_entry, '', destination_path)
+
+    expected_digest_hash = (
+        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16')
+    self.assertEqual(digest_hash, expected_digest_hash)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=12,
+        location='/a_directory', parent=os_path_spec)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
+    with shared_test_lib.TempDirectory() as temp_directory:
+      destination_path = os.path.join(temp_directory, 'a_directory')
+      with self.assertRaises(dfvfs_errors.BackEndError):
+        test_tool._WriteFileEntry(file_entry, '', destination_path)
 
   # TODO: add tests for AddFilterOptions.
 
@@ -166,6 +166,25 @@ class Log2TimelineToolTest(test_lib.CLIToolTestCase):
     with self.assertRaises(errors.BadConfigOption):
       test_tool.ParseOptions(options)
 
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.source = test_file_path
+    options.serializer_format = definitions.SERIALIZER_FORMAT_MSGPACK
+    options.storage_file = 'storage.plaso'
+    options.storage_format = definitions.STORAGE_FORMAT_SQLITE
+    options.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
+    # ParseOptions will raise if the msgpack Python module is not available.
+    msgpack_serializer = log2timeline_tool.msgpack_serializer
+    try:
+      log2timeline_tool.msgpack_serializer = None
+
+      with self.assertRaises(errors.BadConfigOption):
+        test_tool.ParseOptions(options)
+
+    finally:
+      log2timeline_tool.msgpack_serializer = msgpack_serializer
+
     # TODO: improve test coverage.
 
   def testExtractEventsFromSourcesOnDirectory(self):
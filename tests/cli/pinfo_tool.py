@@ -810,6 +810,7 @@ Storage files are different.
     table_view.AddRow(['Filename', test_filename])
     table_view.AddRow(['Format version', format_version])
     table_view.AddRow(['Serialization format', 'json'])
+    table_view.AddRow(['Compression format', 'zlib'])
     table_view.Write(output_writer)
 
     table_view = cli_views.ViewsFactory.GetTableView(
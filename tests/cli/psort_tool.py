@@ -99,10 +99,17 @@ class PsortToolTest(test_lib.CLIToolTestCase):
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--temporary_directory DIRECTORY]
                      [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--formatting_workers NUMBER]
 
 Test argument parser.
 
 {0:s}:
+  --formatting_workers NUMBER, --formatting-workers NUMBER
+                        Number of worker processes that format the events for
+                        output, where 0 represents that the events are
+                        formatted by the main process. The default is 0. The
+                        output order is the same as when the events are
+                        formatted by the main process.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -125,10 +132,17 @@ Test argument parser.
 usage: psort_test.py [--process_memory_limit SIZE]
                      [--temporary_directory DIRECTORY]
                      [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--formatting_workers NUMBER]
 
 Test argument parser.
 
 {0:s}:
+  --formatting_workers NUMBER, --formatting-workers NUMBER
+                        Number of worker processes that format the events for
+                        output, where 0 represents that the events are
+                        formatted by the main process. The default is 0. The
+                        output order is the same as when the events are
+                        formatted by the main process.
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
@@ -17,7 +17,9 @@ class EventSourceTest(shared_test_lib.BaseTestCase):
     attribute_container = event_sources.EventSource()
 
     expected_attribute_names = [
-        'data_type', 'file_entry_type', 'path_spec']
+        'data_type', 'event_data_stream_values', 'file_entry_type',
+        'file_size', 'first_record_index', 'number_of_records', 'parser_name',
+        'path_spec']
 
     attribute_names = sorted(attribute_container.GetAttributeNames())
 
@@ -32,12 +34,45 @@ class FileEntryEventSourceTest(shared_test_lib.BaseTestCase):
     attribute_container = event_sources.FileEntryEventSource()
 
     expected_attribute_names = [
-        'data_type', 'file_entry_type', 'path_spec']
+        'data_type', 'event_data_stream_values', 'file_entry_type',
+        'file_size', 'first_record_index', 'number_of_records', 'parser_name',
+        'path_spec']
 
     attribute_names = sorted(attribute_container.GetAttributeNames())
 
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class ProcessedEventSourceTest(shared_test_lib.BaseTestCase):
+  """Tests for the processed event source attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = event_sources.ProcessedEventSource()
+
+    expected_attribute_names = [
+        'file_size', 'modification_time', 'parser_names', 'path_spec']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+  def testIsUnchanged(self):
+    """Tests the IsUnchanged function."""
+    attribute_container = event_sources.ProcessedEventSource(
+        file_size=1024, modification_time=1621839644000000,
+        parser_names=['filestat'])
+
+    self.assertTrue(attribute_container.IsUnchanged(1024, 1621839644000000))
+    self.assertFalse(attribute_container.IsUnchanged(2048, 1621839644000000))
+    self.assertFalse(attribute_container.IsUnchanged(1024, 1621839645000000))
+    self.assertFalse(attribute_container.IsUnchanged(1024, None))
+
+    attribute_container = event_sources.ProcessedEventSource(
+        file_size=1024, parser_names=['filestat'])
+
+    self.assertFalse(attribute_container.IsUnchanged(1024, None))
+
+
 if __name__ == '__main__':
   unittest.main()
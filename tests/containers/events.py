@@ -12,6 +12,15 @@ from tests import test_lib as shared_test_lib
 class EventValuesHelperTest(shared_test_lib.BaseTestCase):
   """Tests for the event values helper functions."""
 
+  def testCalculateEventDataStreamValuesDigest(self):
+    """Tests the CalculateEventDataStreamValuesDigest function."""
+    event_data_stream = events.EventDataStream()
+    event_data_stream.attribute1 = 'ATTR1'
+    event_data_stream.attribute2 = 99
+
+    digest = events.CalculateEventDataStreamValuesDigest(event_data_stream)
+    self.assertEqual(digest.hex(), 'ad759e78080d40990eb0484db44e9bab')
+
   def testCalculateEventValuesHash(self):
     """Tests the CalculateEventValuesHash function."""
     event_data = events.EventData()
@@ -27,7 +36,29 @@ class EventValuesHelperTest(shared_test_lib.BaseTestCase):
     content_identifier = events.CalculateEventValuesHash(
         event_data, event_data_stream)
 
-    self.assertEqual(content_identifier, '31aac7b1f8c1446f4b638c0dc5f92981')
+    self.assertEqual(
+        content_identifier, 'v2:7d5f72b507f361594915e7566e18c27b')
+
+    digest = events.CalculateEventDataStreamValuesDigest(event_data_stream)
+    content_identifier = events.CalculateEventValuesHash(
+        event_data, event_data_stream, event_data_stream_values_digest=digest)
+
+    self.assertEqual(
+        content_identifier, 'v2:7d5f72b507f361594915e7566e18c27b')
+
+    # Test that values of different types result in a different hash.
+    event_data.attribute2 = '10'
+
+    content_identifier = events.CalculateEventValuesHash(
+        event_data, event_data_stream)
+
+    self.assertEqual(
+        content_identifier, 'v2:18eda4d6e3d6fe20704066c20895bbd8')
+
+    event_data.attribute2 = b'10'
+
+    with self.assertRaises(RuntimeError):
+      events.CalculateEventValuesHash(event_data, event_data_stream)
 
 
 class EventDataTest(shared_test_lib.BaseTestCase):
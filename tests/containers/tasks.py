@@ -39,12 +39,14 @@ class TaskTest(shared_test_lib.BaseTestCase):
     session_identifier = '{0:s}'.format(uuid.uuid4().hex)
     task = tasks.Task(session_identifier=session_identifier)
     task.path_spec = 'test_path_spec'
+    task.path_specs = ['test_path_spec', 'other_test_path_spec']
 
     retry_task = task.CreateRetryTask()
     self.assertNotEqual(retry_task.identifier, task.identifier)
     self.assertTrue(task.has_retry)
     self.assertFalse(retry_task.has_retry)
     self.assertEqual(retry_task.path_spec, task.path_spec)
+    self.assertEqual(retry_task.path_specs, task.path_specs)
 
   def testUpdateProcessingTime(self):
     """Tests the UpdateProcessingTime function."""
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the cached file-like object."""
+
+import io
+import os
+import unittest
+
+from plaso.engine import cached_file_io
+
+from tests import test_lib as shared_test_lib
+
+
+class TestFileIO(io.BytesIO):
+  """Test file-like object that counts the number of reads."""
+
+  def __init__(self, data):
+    """Initializes a test file-like object.
+
+    Args:
+      data (bytes): data of the file-like object.
+    """
+    super(TestFileIO, self).__init__(data)
+    self.number_of_reads = 0
+
+  # pylint: disable=invalid-name
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+    """
+    return len(self.getvalue())
+
+  def read(self, size=-1):
+    """Reads a byte string from the file-like object at the current offset.
+
+    Args:
+      size (Optional[int]): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+    """
+    self.number_of_reads += 1
+    return super(TestFileIO, self).read(size)
+
+
+class CachedFileIOTest(shared_test_lib.BaseTestCase):
+  """Tests for the cached file-like object."""
+
+  _TEST_DATA = bytes(bytearray(range(256))) * 1024
+
+  def testRead(self):
+    """Tests the read function."""
+    test_file_object = TestFileIO(self._TEST_DATA)
+    file_object = cached_file_io.CachedFileIO(test_file_object)
+
+    data = file_object.read(16)
+    self.assertEqual(data, self._TEST_DATA[:16])
+    self.assertEqual(test_file_object.number_of_reads, 1)
+
+    file_object.seek(100000, os.SEEK_SET)
+    data = file_object.read(100000)
+    self.assertEqual(data, self._TEST_DATA[100000:200000])
+    self.assertEqual(test_file_object.number_of_reads, 2)
+
+    # All the blocks have been read and are cached.
+    file_object.seek(0, os.SEEK_SET)
+    data = file_object.read()
+    self.assertEqual(data, self._TEST_DATA)
+    self.assertEqual(test_file_object.number_of_reads, 2)
+
+    data = file_object.read(16)
+    self.assertEqual(data, b'')
+
+    file_object.seek(-16, os.SEEK_END)
+    data = file_object.read(-1)
+    self.assertEqual(data, self._TEST_DATA[-16:])
+
+    file_object.seek(100000, os.SEEK_SET)
+    data = file_object.read(-16)
+    self.assertEqual(data, self._TEST_DATA[100000:])
+
+    data = file_object.read(0)
+    self.assertEqual(data, b'')
+
+  def testSeek(self):
+    """Tests the seek, get_offset and tell functions."""
+    test_file_object = TestFileIO(self._TEST_DATA)
+    file_object = cached_file_io.CachedFileIO(test_file_object)
+
+    self.assertEqual(file_object.get_size(), len(self._TEST_DATA))
+
+    file_object.seek(128, os.SEEK_SET)
+    self.assertEqual(file_object.get_offset(), 128)
+
+    file_object.seek(128, os.SEEK_CUR)
+    self.assertEqual(file_object.tell(), 256)
+
+    file_object.seek(-16, os.SEEK_END)
+    self.assertEqual(file_object.tell(), len(self._TEST_DATA) - 16)
+
+    data = file_object.read(32)
+    self.assertEqual(data, self._TEST_DATA[-16:])
+
+    with self.assertRaises(IOError):
+      file_object.seek(-1, os.SEEK_SET)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the extractor classes."""
 
+import io
 import os
 import shutil
 import unittest
@@ -22,6 +23,8 @@ from tests.engine import test_lib
 class EventDataExtractorTest(test_lib.EngineTestCase):
   """Tests for the event data extractor."""
 
+  # pylint: disable=protected-access
+
   def _CreateParserMediator(self, storage_writer, file_entry=None):
     """Creates a parser mediator.
 
@@ -41,11 +44,56 @@ class EventDataExtractorTest(test_lib.EngineTestCase):
     return parser_mediator
 
   # TODO: add test for _CheckParserCanProcessFileEntry
+
+  def testContainsBinaryData(self):
+    """Tests the _ContainsBinaryData function."""
+    test_extractor = extractors.EventDataExtractor(
+        parser_filter_expression='bodyfile')
+
+    file_object = io.BytesIO(b'0|/a_file|1|r/rrwxrwxrwx|0|0|0|0|0|0|0\n')
+    result = test_extractor._ContainsBinaryData(file_object)
+    self.assertFalse(result)
+    self.assertEqual(file_object.tell(), 0)
+
+    file_object = io.BytesIO('Text\n'.encode('utf-32-le'))
+    result = test_extractor._ContainsBinaryData(file_object)
+    self.assertFalse(result)
+
+    file_object = io.BytesIO(
+        b'MZ\x90\x00\x03\x00\x00\x00\x04\x00\x00\x00\xff\xff\x00\x00'
+        b'\xb8\x00\x00\x00\x00\x00\x00\x00')
+    result = test_extractor._ContainsBinaryData(file_object)
+    self.assertTrue(result)
+    self.assertEqual(file_object.tell(), 0)
+
   # TODO: add test for _GetSignatureMatchParserNames
   # TODO: add test for _InitializeParserObjects
   # TODO: add test for _ParseDataStreamWithParser
   # TODO: add test for _ParseFileEntryWithParser
-  # TODO: add test for _ParseFileEntryWithParsers
+
+  def testParseFileEntryWithParsers(self):
+    """Tests the _ParseFileEntryWithParsers function."""
+    test_extractor = extractors.EventDataExtractor(
+        parser_filter_expression='bodyfile')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_file_path = os.path.join(temp_directory, 'binary.raw')
+      with open(test_file_path, 'wb') as file_object:
+        file_object.write(b'\x00\x00\x00\x00' * 16)
+
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+      file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+      file_object = file_entry.GetFileObject()
+
+      storage_writer = self._CreateStorageWriter()
+      parser_mediator = self._CreateParserMediator(
+          storage_writer, file_entry=file_entry)
+
+      # The bodyfile parser is text-based and not probed for binary data.
+      result = test_extractor._ParseFileEntryWithParsers(
+          parser_mediator, ['bodyfile'], file_entry, file_object=file_object)
+      self.assertEqual(result, test_extractor._PARSE_RESULT_UNSUPPORTED)
 
   def testParseDataStream(self):
     """Tests the ParseDataStream function."""
@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Tests for the profiler classes."""
 
+import gzip
+import os
 import time
 import unittest
 
@@ -119,6 +121,43 @@ class AnalyzersProfilerTest(shared_test_lib.BaseTestCase):
       test_profiler.Stop()
 
 
+class ParserProbesProfilerTest(shared_test_lib.BaseTestCase):
+  """Tests for the parser probes profiler."""
+
+  def testSample(self):
+    """Tests the Sample function."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.ParserProbesProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      for _ in range(5):
+        test_profiler.Sample('text', 'prefiltered')
+
+      test_profiler.Sample('text', 'unsupported')
+      test_profiler.Sample('bodyfile', 'success')
+
+      with self.assertRaises(ValueError):
+        test_profiler.Sample('text', 'bogus')
+
+      test_profiler.Stop()
+
+      sample_file_path = os.path.join(
+          temp_directory, 'parser_probes-test.csv.gz')
+      with gzip.open(sample_file_path, 'rt', encoding='utf-8') as file_object:
+        lines = file_object.readlines()
+
+    self.assertEqual(lines, [
+        'Name\tPrefiltered\tUnsupported\tFailure\tSuccess\n',
+        'bodyfile\t0\t0\t0\t1\n',
+        'text\t5\t1\t0\t0\n'])
+
+
 class ProcessingProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the processing CPU time profiler."""
 
@@ -13,6 +13,27 @@ from tests import test_lib as shared_test_lib
 class TaggingFileTestCase(shared_test_lib.BaseTestCase):
   """Tests for the tagging file."""
 
+  def testGetEventTaggingRuleSet(self):
+    """Tests the GetEventTaggingRuleSet function."""
+    test_file_path = self._GetTestFilePath(['tagging_file', 'valid.txt'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    tag_file = tagging_file.TaggingFile(test_file_path)
+
+    tagging_rule_set = tag_file.GetEventTaggingRuleSet()
+    self.assertIsNotNone(tagging_rule_set)
+
+  def testGetEventTaggingRuleSetInvalidSyntax(self):
+    """Tests the GetEventTaggingRuleSet function on invalid syntax."""
+    test_file_path = self._GetTestFilePath([
+        'tagging_file', 'invalid_syntax.txt'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    tag_file = tagging_file.TaggingFile(test_file_path)
+
+    with self.assertRaises(errors.TaggingFileError):
+      tag_file.GetEventTaggingRuleSet()
+
   def testGetEventTaggingRules(self):
     """Tests the GetEventTaggingRules function."""
     test_file_path = self._GetTestFilePath(['tagging_file', 'valid.txt'])
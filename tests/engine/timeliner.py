@@ -4,6 +4,8 @@
 
 import unittest
 
+import pytz
+
 from dfdatetime import time_elements as dfdatetime_time_elements
 
 from plaso.containers import events
@@ -207,6 +209,58 @@ class EventDataTimelinerTest(test_lib.EngineTestCase):
     self.assertEqual(event.date_time.year, 4)
     self.assertEqual(event.timestamp, -62035818808570124)
 
+  def testGetTimeZoneByHint(self):
+    """Tests the _GetTimeZoneByHint function."""
+    event_data_timeliner = timeliner.EventDataTimeliner(
+        data_location=shared_test_lib.TEST_DATA_PATH)
+
+    time_zone = event_data_timeliner._GetTimeZoneByHint('Europe/Amsterdam')
+    self.assertIsNotNone(time_zone)
+    self.assertEqual(time_zone.zone, 'Europe/Amsterdam')
+
+    self.assertIn('Europe/Amsterdam', event_data_timeliner._time_zone_per_hint)
+
+    with self.assertRaises(pytz.UnknownTimeZoneError):
+      event_data_timeliner._GetTimeZoneByHint('Bogus')
+
+  def testGetTimeZoneOffset(self):
+    """Tests the _GetTimeZoneOffset function."""
+    event_data_timeliner = timeliner.EventDataTimeliner(
+        data_location=shared_test_lib.TEST_DATA_PATH)
+
+    time_zone = pytz.timezone('Europe/Amsterdam')
+
+    # Test local date and time values in winter and summer time.
+    utc_offset = event_data_timeliner._GetTimeZoneOffset(
+        time_zone, 1325376000000000)
+    self.assertEqual(utc_offset, 3600)
+
+    utc_offset = event_data_timeliner._GetTimeZoneOffset(
+        time_zone, 1281643591000000)
+    self.assertEqual(utc_offset, 7200)
+
+    utc_offset = event_data_timeliner._GetTimeZoneOffset(
+        time_zone, 1351389599000000)
+    self.assertEqual(utc_offset, 7200)
+
+    # Test an ambiguous local date and time value.
+    utc_offset = event_data_timeliner._GetTimeZoneOffset(
+        time_zone, 1351391400000000)
+    self.assertEqual(utc_offset, 3600)
+
+    # Test a local date and time value that does not exist.
+    utc_offset = event_data_timeliner._GetTimeZoneOffset(
+        time_zone, 1332642600000000)
+    self.assertEqual(utc_offset, 3600)
+
+    self.assertIn(time_zone, event_data_timeliner._time_zone_transitions)
+
+    time_zone = pytz.timezone('Etc/GMT+5')
+
+    utc_offset = event_data_timeliner._GetTimeZoneOffset(
+        time_zone, 1281643591000000)
+    self.assertEqual(utc_offset, -18000)
+
   # TODO: add tests for _ProduceTimeliningWarning
   # TODO: add tests for _ReadConfigurationFile
 
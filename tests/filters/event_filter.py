@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the event object filter."""
 
+import pickle
 import unittest
 
 from plaso.containers import events
@@ -68,6 +69,76 @@ class EventObjectFilterTest(test_lib.FilterTestCase):
     result = test_filter.Match(None, event_data, None, None)
     self.assertFalse(result)
 
+  def testPickle(self):
+    """Tests pickling a compiled event filter."""
+    test_filter = event_filter.EventObjectFilter()
+    test_filter.CompileFilter(
+        'data_type is "test:event" and filename contains PATH("etc/issue")')
+
+    event_data = events.EventData(data_type='test:event')
+    event_data.filename = '/usr/local/etc/issue'
+
+    result = test_filter.Match(None, event_data, None, None)
+    self.assertTrue(result)
+
+    test_filter = pickle.loads(pickle.dumps(test_filter))
+
+    result = test_filter.Match(None, event_data, None, None)
+    self.assertTrue(result)
+
+    event_data.filename = '/etc/issue.net'
+
+    result = test_filter.Match(None, event_data, None, None)
+    self.assertFalse(result)
+
+
+class EventFilterRuleSetTest(test_lib.FilterTestCase):
+  """Tests for the event filter rule set."""
+
+  # pylint: disable=protected-access
+
+  def testAddRule(self):
+    """Tests the AddRule function."""
+    rule_set = event_filter.EventFilterRuleSet()
+
+    rule_set.AddRule('login', (
+        'data_type is \'windows:evt:record\' AND event_identifier is 528'))
+    rule_set.AddRule('login', 'body contains \'login\' OR data_type is \'x\'')
+
+    self.assertEqual(rule_set._label_names, ['login'])
+    self.assertEqual(
+        sorted(rule_set._rules_per_data_type.keys()),
+        ['windows:evt:record', 'x'])
+    self.assertEqual(len(rule_set._rules_without_data_type), 1)
+
+    with self.assertRaises(errors.ParseError):
+      rule_set.AddRule('bogus', 'some random stuff that is destined to fail')
+
+  def testGetMatchingLabels(self):
+    """Tests the GetMatchingLabels function."""
+    rule_set = event_filter.EventFilterRuleSet()
+
+    rule_set.AddRule('login', (
+        'data_type is \'windows:evt:record\' AND event_identifier is 528'))
+    rule_set.AddRule('message', 'body contains \'message\'')
+    rule_set.AddRule('evt', 'data_type is \'windows:evt:record\'')
+    rule_set.AddRule('logout', (
+        'data_type is \'windows:evt:record\' AND event_identifier is 538 '
+        'AND body contains \'message\''))
+
+    event_data = events.EventData(data_type='windows:evt:record')
+    event_data.body = 'this is a message'
+    event_data.event_identifier = 538
+
+    labels = rule_set.GetMatchingLabels(None, event_data, None, None)
+    self.assertEqual(labels, ['message', 'evt', 'logout'])
+
+    event_data = events.EventData(data_type='text:entry')
+    event_data.body = 'this is a message'
+
+    labels = rule_set.GetMatchingLabels(None, event_data, None, None)
+    self.assertEqual(labels, ['message'])
+
 
 if __name__ == '__main__':
   unittest.main()
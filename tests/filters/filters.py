@@ -6,6 +6,7 @@ import unittest
 
 from plaso.containers import events
 from plaso.filters import filters
+from plaso.filters import value_types
 from plaso.lib import definitions
 
 from tests import test_lib as shared_test_lib
@@ -107,6 +108,46 @@ class AndFilterTest(shared_test_lib.BaseTestCase):
     result = filter_object.Matches(event, event_data, None, None)
     self.assertFalse(result)
 
+  def testGetMatchFunction(self):
+    """Tests the GetMatchFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    filter_object = filters.AndFilter(arguments=[
+        filters.Regexp(arguments=['data_type', '^test:']),
+        filters.EqualsOperator(arguments=['test_value', 1])])
+
+    match_function = filter_object.GetMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    filter_object = filters.AndFilter(arguments=[
+        filters.Regexp(arguments=['data_type', '^test:']),
+        filters.EqualsOperator(arguments=['test_value', 2])])
+
+    match_function = filter_object.GetMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
+  def testGetSQLFilterExpression(self):
+    """Tests the GetSQLFilterExpression function."""
+    column_names = {'data_type': 'data_type'}
+
+    filter_object = filters.AndFilter(arguments=[
+        filters.EqualsOperator(arguments=['data_type', 'test:event']),
+        filters.EqualsOperator(arguments=['test_value', 1])])
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertEqual(sql_filter_expression, '(data_type = \'test:event\')')
+    self.assertEqual(sql_parameters, [])
+
+    filter_object = filters.AndFilter(arguments=[
+        filters.EqualsOperator(arguments=['test_value', 1])])
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertIsNone(sql_filter_expression)
+    self.assertIsNone(sql_parameters)
+
 
 class OrFilterTest(shared_test_lib.BaseTestCase):
   """Tests the boolean OR filter."""
@@ -137,6 +178,30 @@ class OrFilterTest(shared_test_lib.BaseTestCase):
     result = filter_object.Matches(event, event_data, None, None)
     self.assertFalse(result)
 
+  def testGetSQLFilterExpression(self):
+    """Tests the GetSQLFilterExpression function."""
+    column_names = {'data_type': 'data_type'}
+
+    filter_object = filters.OrFilter(arguments=[
+        filters.EqualsOperator(arguments=['data_type', 'test:event']),
+        filters.Contains(arguments=['data_type', 'other'])])
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertEqual(sql_filter_expression, (
+        '(data_type = \'test:event\') OR '
+        '(INSTR(LOWER(data_type), LOWER(\'other\')) > 0)'))
+    self.assertEqual(sql_parameters, [])
+
+    filter_object = filters.OrFilter(arguments=[
+        filters.EqualsOperator(arguments=['data_type', 'test:event']),
+        filters.EqualsOperator(arguments=['test_value', 1])])
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertIsNone(sql_filter_expression)
+    self.assertIsNone(sql_parameters)
+
 
 class IdentityFilterTest(shared_test_lib.BaseTestCase):
   """Tests the filter which always evaluates to True."""
@@ -206,6 +271,63 @@ class GenericBinaryOperatorTest(shared_test_lib.BaseTestCase):
         'tag', event, event_data, None, event_tag)
     self.assertEqual(test_value, ['browser_search'])
 
+  def testGetSQLValue(self):
+    """Tests the _GetSQLValue function."""
+    filter_object = filters.GenericBinaryOperator(
+        arguments=['data_type', 'test\'s:event'])
+
+    sql_value = filter_object._GetSQLValue()
+    self.assertEqual(sql_value, '\'test\'\'s:event\'')
+
+    filter_object = filters.GenericBinaryOperator(arguments=['test_value', 1])
+
+    sql_value = filter_object._GetSQLValue()
+    self.assertIsNone(sql_value)
+
+    date_time = value_types.DateTimeValueType(5134324321)
+    filter_object = filters.GenericBinaryOperator(
+        arguments=['timestamp', date_time])
+
+    sql_value = filter_object._GetSQLValue()
+    self.assertEqual(sql_value, '5134324321')
+
+  def testGetSQLFilterExpression(self):
+    """Tests the GetSQLFilterExpression function."""
+    column_names = {'data_type': 'data_type'}
+
+    filter_object = filters.EqualsOperator(
+        arguments=['data_type', 'test:event'])
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertEqual(sql_filter_expression, 'data_type = \'test:event\'')
+    self.assertEqual(sql_parameters, [])
+
+    filter_object = filters.EqualsOperator(
+        arguments=['test_value', 'test:event'])
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertIsNone(sql_filter_expression)
+    self.assertIsNone(sql_parameters)
+
+    filter_object = filters.EqualsOperator(
+        arguments=['data_type', 'test:event'])
+    filter_object.FlipBool()
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertIsNone(sql_filter_expression)
+    self.assertIsNone(sql_parameters)
+
+    filter_object = filters.RegexpInsensitive(
+        arguments=['data_type', '^test:'])
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertEqual(sql_filter_expression, 'data_type REGEXP \'(?is)^test:\'')
+    self.assertEqual(sql_parameters, [])
+
   # TODO: add tests for FlipBool function
 
 
@@ -224,6 +346,26 @@ class EqualsOperatorTest(shared_test_lib.BaseTestCase):
     result = filter_object._CompareValue(10, 10)
     self.assertTrue(result)
 
+  def testGetMatchFunction(self):
+    """Tests the GetMatchFunction function."""
+    event = events.EventObject()
+    event.timestamp = 5134324321
+
+    date_time = value_types.DateTimeValueType(5134324321)
+    filter_object = filters.EqualsOperator(arguments=['timestamp', date_time])
+
+    match_function = filter_object.GetMatchFunction()
+    self.assertTrue(match_function(event, None, None, None))
+
+    event.timestamp = 0
+    self.assertFalse(match_function(event, None, None, None))
+
+    filter_object = filters.EqualsOperator(arguments=['timestamp', date_time])
+    filter_object.FlipBool()
+
+    match_function = filter_object.GetMatchFunction()
+    self.assertTrue(match_function(event, None, None, None))
+
 
 class NotEqualsOperatorTest(shared_test_lib.BaseTestCase):
   """Tests the not equals operator."""
@@ -318,7 +460,57 @@ class GreaterEqualOperatorTest(shared_test_lib.BaseTestCase):
 
 
 # TODO: add tests for Contains
-# TODO: add tests for InSet
+
+
+class InSetTest(shared_test_lib.BaseTestCase):
+  """Tests the in set operator."""
+
+  def testGetSQLFilterExpression(self):
+    """Tests the GetSQLFilterExpression function."""
+    column_names = {
+        'data_type': 'data_type',
+        'timestamp': 'timestamp'}
+
+    filter_object = filters.InSet(
+        arguments=['data_type', ['windows:registry:key_value', 'text:entry']])
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertEqual(sql_filter_expression, 'data_type IN (?, ?)')
+    self.assertEqual(
+        sql_parameters, ['text:entry', 'windows:registry:key_value'])
+
+    filter_object = filters.InSet(arguments=['data_type', 'text:entry:line'])
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertEqual(
+        sql_filter_expression, 'INSTR(\'text:entry:line\', data_type) > 0')
+    self.assertEqual(sql_parameters, [])
+
+    filter_object = filters.InSet(arguments=['data_type', ['text:entry', 1]])
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertIsNone(sql_filter_expression)
+    self.assertIsNone(sql_parameters)
+
+    filter_object = filters.InSet(arguments=['timestamp', ['1', '2']])
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertIsNone(sql_filter_expression)
+    self.assertIsNone(sql_parameters)
+
+    filter_object = filters.InSet(arguments=['data_type', ['text:entry']])
+    filter_object.FlipBool()
+
+    sql_filter_expression, sql_parameters = (
+        filter_object.GetSQLFilterExpression(column_names))
+    self.assertIsNone(sql_filter_expression)
+    self.assertIsNone(sql_parameters)
+
+
 # TODO: add tests for Regexp
 # TODO: add tests for RegexpInsensitive
 
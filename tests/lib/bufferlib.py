@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Tests for the circular buffer for storing event objects."""
+"""Tests for the buffers for storing event objects."""
 
 import unittest
 
@@ -50,5 +50,29 @@ class CircularBufferTest(unittest.TestCase):
     self.assertEqual(items, expected_items)
 
 
+class SortedRunsBufferTest(unittest.TestCase):
+  """Tests for the buffer of sorted runs for an external merge sort."""
+
+  def testWriteRunAndMerge(self):
+    """Tests the WriteRun and Merge functions."""
+    sorted_runs_buffer = bufferlib.SortedRunsBuffer()
+
+    self.assertEqual(sorted_runs_buffer.number_of_items, 0)
+    self.assertEqual(sorted_runs_buffer.number_of_runs, 0)
+
+    sorted_runs_buffer.WriteRun([(1, 'b'), (4, 'a'), (7, 'c')])
+    sorted_runs_buffer.WriteRun([(2, 'a'), (5, 'c')])
+
+    self.assertEqual(sorted_runs_buffer.number_of_items, 5)
+    self.assertEqual(sorted_runs_buffer.number_of_runs, 2)
+
+    items = list(sorted_runs_buffer.Merge([(3, 'z'), (6, 'z')]))
+    self.assertEqual(items, [
+        (1, 'b'), (2, 'a'), (3, 'z'), (4, 'a'), (5, 'c'), (6, 'z'), (7, 'c')])
+
+    self.assertEqual(sorted_runs_buffer.number_of_items, 0)
+    self.assertEqual(sorted_runs_buffer.number_of_runs, 0)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -3,6 +3,7 @@
 """Tests for the task-based multi-process processing analysis engine."""
 
 import os
+import pickle
 import shutil
 import unittest
 
@@ -11,6 +12,7 @@ from plaso.containers import sessions
 from plaso.engine import configurations
 from plaso.lib import definitions
 from plaso.multi_process import analysis_engine
+from plaso.multi_process import plaso_queue
 from plaso.storage import factory as storage_factory
 
 from tests import test_lib as shared_test_lib
@@ -18,6 +20,58 @@ from tests.filters import test_lib as filters_test_lib
 from tests.multi_process import test_lib
 
 
+class TestQueue(plaso_queue.Queue):
+  """Queue for testing.
+
+  Attributes:
+    items (list[object]): items pushed onto the queue.
+  """
+
+  def __init__(self):
+    """Initializes a queue for testing."""
+    super(TestQueue, self).__init__()
+    self.items = []
+
+  def Close(self, abort=False):
+    """Closes the queue.
+
+    Args:
+      abort (Optional[bool]): whether the Close is the result of an abort
+          condition.
+    """
+    return
+
+  def IsEmpty(self):
+    """Determines if the queue is empty.
+
+    Returns:
+      bool: True if the queue is empty.
+    """
+    return not self.items
+
+  def Open(self):
+    """Opens the queue."""
+    return
+
+  def PopItem(self):
+    """Pops an item off the queue.
+
+    Returns:
+      object: item from the queue.
+    """
+    return self.items.pop(0)
+
+  def PushItem(self, item, block=True):
+    """Pushes an item on to the queue.
+
+    Args:
+      item (object): item to push on the queue.
+      block (Optional[bool]): whether the push should be performed in blocking
+          or non-blocking mode.
+    """
+    self.items.append(item)
+
+
 class AnalysisEngineMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
   """Tests for the task-based multi-process processing analysis engine."""
 
@@ -72,6 +126,21 @@ class AnalysisEngineMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
     self.assertEqual(events_counter['Events processed'], 38)
 
   # TODO: add test for _CheckStatusAnalysisProcess.
+
+  def testPushEventBatch(self):
+    """Tests the _PushEventBatch function."""
+    test_engine = analysis_engine.AnalysisMultiProcessEngine()
+    test_engine._event_queues = {
+        'plugin1': TestQueue(), 'plugin2': TestQueue()}
+
+    test_engine._PushEventBatch([(1, 2, None), (3, 4, None)])
+
+    for event_queue in test_engine._event_queues.values():
+      self.assertEqual(len(event_queue.items), 1)
+
+      event_batch = pickle.loads(event_queue.items[0])
+      self.assertEqual(event_batch, [(1, 2, None), (3, 4, None)])
+
   # TODO: add test for _StartAnalysisProcesses.
   # TODO: add test for _StatusUpdateThreadMain.
   # TODO: add test for _StopAnalysisProcesses.
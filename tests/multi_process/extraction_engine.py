@@ -8,8 +8,11 @@ import unittest
 
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.containers import event_sources
 from plaso.containers import sessions
+from plaso.containers import tasks
 from plaso.lib import definitions
 from plaso.engine import configurations
 from plaso.multi_process import extraction_engine
@@ -18,9 +21,136 @@ from plaso.storage.sqlite import writer as sqlite_writer
 from tests import test_lib as shared_test_lib
 
 
+class EventSourceHeapTest(shared_test_lib.BaseTestCase):
+  """Tests for the event source heap."""
+
+  def _CreateEventSource(self, location, file_entry_type, file_size=None):
+    """Creates an event source.
+
+    Args:
+      location (str): location of the file entry.
+      file_entry_type (str): dfVFS file entry type.
+      file_size (Optional[int]): size of the file entry data.
+
+    Returns:
+      EventSource: event source.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_FAKE, location=location)
+    return event_sources.FileEntryEventSource(
+        file_entry_type=file_entry_type, file_size=file_size,
+        path_spec=path_spec)
+
+  def testPopEventSources(self):
+    """Tests the PopEventSources and PushEventSource functions."""
+    event_source_heap = extraction_engine._EventSourceHeap()  # pylint: disable=protected-access
+
+    for index in range(3):
+      event_source = self._CreateEventSource(
+          '/small{0:d}.txt'.format(index),
+          dfvfs_definitions.FILE_ENTRY_TYPE_FILE, file_size=1024)
+      event_source_heap.PushEventSource(event_source)
+
+    event_source = self._CreateEventSource(
+        '/large.txt', dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+        file_size=4 * 1024 * 1024)
+    event_source_heap.PushEventSource(event_source)
+
+    event_source = self._CreateEventSource(
+        '/medium.evtx', dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+        file_size=2 * 1024 * 1024)
+    event_source_heap.PushEventSource(event_source)
+
+    event_source = self._CreateEventSource(
+        '/directory', dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    event_source_heap.PushEventSource(event_source)
+
+    locations = [
+        [event_source.path_spec.location for event_source in batch]
+        for batch in iter(event_source_heap.PopEventSources, [])]
+
+    self.assertEqual(locations, [
+        ['/directory'], ['/medium.evtx'], ['/large.txt'],
+        ['/small0.txt', '/small1.txt', '/small2.txt']])
+
+
 class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task-based multi-process extraction engine."""
 
+  # pylint: disable=protected-access
+
+  def testCheckProcessedFileEntry(self):
+    """Tests the _CheckProcessedFileEntry function."""
+    test_engine = extraction_engine.ExtractionMultiProcessEngine()
+    test_engine._enabled_parser_names = set(['filestat'])
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      directory_path = os.path.join(temp_directory, 'directory')
+      os.mkdir(directory_path)
+
+      with open(os.path.join(directory_path, 'file.txt'), 'wb') as file_object:
+        file_object.write(b'test')
+
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=directory_path)
+      file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_writer = sqlite_writer.SQLiteStorageFileWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        result = test_engine._CheckProcessedFileEntry(
+            storage_writer, file_entry)
+        self.assertFalse(result)
+
+        processed_event_source = (
+            test_engine._pending_processed_event_sources.pop(
+                path_spec.comparable))
+        self.assertEqual(processed_event_source.parser_names, ['filestat'])
+
+        # An unchanged directory is skipped and its sub file entries added.
+        test_engine._processed_event_sources = {
+            path_spec.comparable: processed_event_source}
+
+        result = test_engine._CheckProcessedFileEntry(
+            storage_writer, file_entry)
+        self.assertTrue(result)
+        self.assertEqual(test_engine._pending_processed_event_sources, {})
+
+        number_of_event_sources = (
+            storage_writer.GetNumberOfAttributeContainers('event_source'))
+        self.assertEqual(number_of_event_sources, 1)
+
+        # An unchanged directory is not skipped for a newly enabled parser.
+        test_engine._enabled_parser_names = set(['filestat', 'test'])
+        test_engine._processed_event_sources = {
+            path_spec.comparable: processed_event_source}
+
+        result = test_engine._CheckProcessedFileEntry(
+            storage_writer, file_entry)
+        self.assertFalse(result)
+
+        processed_event_source = (
+            test_engine._pending_processed_event_sources.get(
+                path_spec.comparable))
+        self.assertEqual(
+            processed_event_source.parser_names, ['filestat', 'test'])
+
+        task = tasks.Task()
+        task.path_spec = path_spec
+
+        test_engine._WriteProcessedEventSources(storage_writer, task)
+        self.assertEqual(test_engine._pending_processed_event_sources, {})
+
+        number_of_processed_event_sources = (
+            storage_writer.GetNumberOfAttributeContainers(
+                'processed_event_source'))
+        self.assertEqual(number_of_processed_event_sources, 1)
+
+      finally:
+        storage_writer.Close()
+
   def testProcessSource(self):
     """Tests the PreprocessSource and ProcessSource functions."""
     test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
@@ -93,5 +223,78 @@ class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
     self.assertEqual(parsers_counter, expected_parsers_counter)
 
 
+  def testProcessSourceWithWorkerTimelining(self):
+    """Tests the ProcessSource function with worker timelining."""
+    test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        maximum_number_of_tasks=100)
+    test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=os_path_spec)
+
+    session = sessions.Session()
+
+    processing_configuration = configurations.ProcessingConfiguration()
+    processing_configuration.data_location = shared_test_lib.DATA_PATH
+    processing_configuration.parser_filter_expression = 'filestat'
+    processing_configuration.task_storage_format = (
+        definitions.STORAGE_FORMAT_SQLITE)
+    processing_configuration.worker_timelining = True
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_writer = sqlite_writer.SQLiteStorageFileWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        system_configurations = test_engine.PreprocessSource(
+            [source_path_spec], storage_writer)
+
+        # The method is named ProcessSourceMulti because pylint 2.6.0 and
+        # later gets confused about keyword arguments when ProcessSource
+        # is used.
+        processing_status = test_engine.ProcessSourceMulti(
+            storage_writer, session.identifier, processing_configuration,
+            system_configurations, [source_path_spec],
+            storage_file_path=temp_directory)
+
+        number_of_events = storage_writer.GetNumberOfAttributeContainers(
+            'event')
+        number_of_extraction_warnings = (
+            storage_writer.GetNumberOfAttributeContainers(
+                'extraction_warning'))
+        number_of_recovery_warnings = (
+            storage_writer.GetNumberOfAttributeContainers(
+                'recovery_warning'))
+
+        parsers_counter = collections.Counter({
+            parser_count.name: parser_count.number_of_events
+            for parser_count in storage_writer.GetAttributeContainers(
+                'parser_count')})
+
+      finally:
+        storage_writer.Close()
+
+    self.assertFalse(processing_status.aborted)
+
+    self.assertEqual(number_of_events, 15)
+    self.assertEqual(number_of_extraction_warnings, 0)
+    self.assertEqual(number_of_recovery_warnings, 0)
+
+    expected_parsers_counter = collections.Counter({
+        'filestat': 15,
+        'total': 15})
+    self.assertEqual(parsers_counter, expected_parsers_counter)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -7,9 +7,13 @@ import unittest
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from dfdatetime import posix_time as dfdatetime_posix_time
+
+from plaso.containers import events
 from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.engine import configurations
+from plaso.engine import timeliner
 from plaso.engine import worker
 from plaso.lib import definitions
 from plaso.multi_process import extraction_process
@@ -146,6 +150,45 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       task = tasks.Task(session_identifier=session.identifier)
       test_process._ProcessTask(task)
 
+  def testTimelineEventData(self):
+    """Tests the _TimelineEventData function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.task_storage_path = temp_directory
+      configuration.worker_timelining = True
+
+      test_process = extraction_process.ExtractionWorkerProcess(
+          None, configuration, [], None, name='TestWorker')
+      test_process._event_data_timeliner = timeliner.EventDataTimeliner(
+          data_location=shared_test_lib.TEST_DATA_PATH)
+
+      task_storage_writer = self._CreateStorageWriter()
+
+      event_data_stream = events.EventDataStream()
+      task_storage_writer.AddAttributeContainer(event_data_stream)
+
+      event_data = events.EventData(data_type='test:fs:stat')
+      event_data.access_time = dfdatetime_posix_time.PosixTime(
+          timestamp=1281647191)
+      event_data._parser_chain = 'test_parser'
+      event_data.SetEventDataStreamIdentifier(
+          event_data_stream.GetIdentifier())
+      task_storage_writer.AddAttributeContainer(event_data)
+
+      test_process._TimelineEventData(task_storage_writer)
+
+      self.assertEqual(test_process._number_of_produced_events, 1)
+
+      number_of_events = task_storage_writer.GetNumberOfAttributeContainers(
+          'event')
+      self.assertEqual(number_of_events, 1)
+
+      parsers_counter = {
+          parser_count.name: parser_count.number_of_events
+          for parser_count in task_storage_writer.GetAttributeContainers(
+              'parser_count')}
+      self.assertEqual(parsers_counter, {'test_parser': 1, 'total': 1})
+
   def testStartAndStopProfiling(self):
     """Tests the _StartProfiling and _StopProfiling functions."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -163,6 +163,80 @@ class PsortEventHeapTest(test_lib.MultiProcessingTestCase):
 
     self.assertEqual(len(event_heap._heap), 1)
 
+    # Test with an event values hash calculated with an older format.
+    event, event_data, event_data_stream = (
+        containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[1]))
+    event_data._event_values_hash = '31aac7b1f8c1446f4b638c0dc5f92981'
+    event_heap.PushEvent(event, event_data, event_data_stream)
+
+    self.assertEqual(len(event_heap._heap), 2)
+
+    event_values_hash, _, _, _ = event_heap.PopEvent()
+    self.assertTrue(event_values_hash.startswith('v2:'))
+
+  def testPushEventWithSortedRuns(self):
+    """Tests the PushEvent function with events written to sorted runs."""
+    test_events = [{
+        'data_type': 'test:event',
+        'text': 'text{0:d}'.format(index % 4),
+        'timestamp': 5134324321,
+        'timestamp_desc': definitions.TIME_DESCRIPTION_WRITTEN}
+        for index in range(9)]
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+
+      storage_file = storage_factory.StorageFactory.CreateStorageFile(
+          definitions.DEFAULT_STORAGE_FORMAT)
+      storage_file.Open(path=temp_file, read_only=False)
+
+      for event, event_data, event_data_stream in (
+          containers_test_lib.CreateEventsFromValues(test_events)):
+        storage_file.AddAttributeContainer(event_data_stream)
+
+        event_data.SetEventDataStreamIdentifier(
+            event_data_stream.GetIdentifier())
+        storage_file.AddAttributeContainer(event_data)
+
+        event.SetEventDataIdentifier(event_data.GetIdentifier())
+        storage_file.AddAttributeContainer(event)
+
+      storage_file.Close()
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+
+      try:
+        expected_event_heap = output_engine.PsortEventHeap()
+
+        event_heap = output_engine.PsortEventHeap(storage_reader=storage_reader)
+        event_heap._MAXIMUM_NUMBER_OF_EVENTS = 2
+
+        for event, event_data, event_data_stream, _ in (
+            storage_reader.GetSortedEventsWithData()):
+          expected_event_heap.PushEvent(event, event_data, event_data_stream)
+          event_heap.PushEvent(event, event_data, event_data_stream)
+
+        self.assertEqual(event_heap.number_of_events, 9)
+        self.assertEqual(event_heap._sorted_runs.number_of_runs, 4)
+
+        expected_events = [
+            (event_values_hash, event.GetIdentifier().sequence_number)
+            for event_values_hash, event, _, _ in (
+                expected_event_heap.PopEvents())]
+
+        test_events = [
+            (event_values_hash, event.GetIdentifier().sequence_number)
+            for event_values_hash, event, _, _ in event_heap.PopEvents()]
+
+        self.assertEqual(len(test_events), 9)
+        self.assertEqual(test_events, expected_events)
+
+        self.assertEqual(event_heap.number_of_events, 0)
+
+      finally:
+        storage_reader.Close()
+
 
 class OutputAndFormattingMultiProcessEngineTest(
     test_lib.MultiProcessingTestCase):
@@ -343,6 +417,45 @@ class OutputAndFormattingMultiProcessEngineTest(
         'repeated')
     self.assertEqual(lines[14], expected_line)
 
+  def testExportEventsWithFormattingWorkers(self):
+    """Tests the ExportEvents function with formatting worker processes."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_file_object = io.StringIO()
+
+    storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+        test_file_path)
+
+    output_module = dynamic.DynamicOutputModule()
+    output_module._file_object = test_file_object
+
+    configuration = configurations.ProcessingConfiguration()
+    configuration.data_location = shared_test_lib.DATA_PATH
+    configuration.preferred_language = 'en-US'
+
+    test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+    test_engine.ExportEvents(
+        storage_reader, output_module, configuration,
+        number_of_worker_processes=2, storage_file_path=test_file_path)
+
+    output = test_file_object.getvalue()
+    lines = output.split('\n')
+
+    self.assertEqual(len(lines), 22)
+
+    expected_line = (
+        '2014-11-18T01:15:43.000000+00:00,'
+        'Content Modification Time,'
+        'LOG,'
+        'Log File,'
+        '[---] last message repeated 5 times ---,'
+        'text/syslog_traditional,'
+        'OS:/tmp/test/test_data/syslog,'
+        'repeated')
+    self.assertEqual(lines[14], expected_line)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -5,6 +5,8 @@
 import platform
 import unittest
 
+import pytz
+
 from dfdatetime import posix_time as dfdatetime_posix_time
 from dfdatetime import semantic_time as dfdatetime_semantic_time
 
@@ -24,6 +26,46 @@ class TestFieldFormattingHelper(formatting_helper.FieldFormattingHelper):
   _FIELD_FORMAT_CALLBACKS = {'zone': '_FormatTimeZone'}
 
 
+class TimestampFormattingHelperTest(test_lib.OutputModuleTestCase):
+  """Test the timestamp formatting helper."""
+
+  def testCopyToISO8601String(self):
+    """Tests the CopyToISO8601String function."""
+    test_helper = formatting_helper.TimestampFormattingHelper(pytz.UTC)
+
+    iso8601_string = test_helper.CopyToISO8601String(1340821021000000)
+    self.assertEqual(iso8601_string, '2012-06-27T18:17:01.000000+00:00')
+
+    iso8601_string = test_helper.CopyToISO8601String(-1567517139327447)
+    self.assertEqual(iso8601_string, '1920-04-30T10:34:20.672553+00:00')
+
+    with self.assertRaises(ValueError):
+      test_helper.CopyToISO8601String(-9223372036854775808)
+
+    time_zone = pytz.timezone('Europe/Amsterdam')
+    test_helper = formatting_helper.TimestampFormattingHelper(time_zone)
+
+    iso8601_string = test_helper.CopyToISO8601String(1340821021000000)
+    self.assertEqual(iso8601_string, '2012-06-27T20:17:01.000000+02:00')
+
+    # Daylight saving time ended at 2012-10-28 01:00:00 UTC.
+    iso8601_string = test_helper.CopyToISO8601String(1351385999123456)
+    self.assertEqual(iso8601_string, '2012-10-28T02:59:59.123456+02:00')
+
+    iso8601_string = test_helper.CopyToISO8601String(1351386000123456)
+    self.assertEqual(iso8601_string, '2012-10-28T02:00:00.123456+01:00')
+
+    # Local mean time (LMT) of Amsterdam was 18 minutes ahead of UTC.
+    iso8601_string = test_helper.CopyToISO8601String(-2524521600000000)
+    self.assertEqual(iso8601_string, '1890-01-01T00:18:00.000000+00:18')
+
+    time_zone = pytz.timezone('America/St_Johns')
+    test_helper = formatting_helper.TimestampFormattingHelper(time_zone)
+
+    iso8601_string = test_helper.CopyToISO8601String(1340821021000000)
+    self.assertEqual(iso8601_string, '2012-06-27T15:47:01.000000-02:30')
+
+
 class FieldFormattingHelperTest(test_lib.OutputModuleTestCase):
   """Test the output module field formatting helper."""
 
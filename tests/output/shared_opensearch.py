@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the shared functionality for OpenSearch output modules."""
 
+import collections
 import unittest
 
 from unittest.mock import MagicMock
@@ -106,6 +107,48 @@ class SharedOpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     self.assertIsNone(output_module._client)
 
+  def testFlushEvents(self):
+    """Tests the _FlushEvents function.
+
+    Raises:
+      SkipTest: if opensearch-py is missing.
+    """
+    if shared_opensearch.opensearchpy is None:
+      raise unittest.SkipTest('missing opensearch-py')
+
+    output_module = TestOpenSearchOutputModule()
+    output_module._RETRY_DELAY = 0
+
+    output_module._Connect()
+    output_module._client.bulk.side_effect = [
+        shared_opensearch.opensearchpy.exceptions.TransportError(
+            429, 'too_many_requests', {}),
+        {'errors': True, 'items': [
+            {'index': {'status': 201}},
+            {'index': {'status': 429, 'error': {
+                'type': 'rejected_execution_exception'}}},
+            {'index': {'status': 400, 'error': {
+                'type': 'mapper_parsing_exception'}}}]},
+        {'errors': False, 'items': [
+            {'index': {'status': 201}}]}]
+
+    for index in range(3):
+      output_module._event_documents.append({'index': {'_index': 'test'}})
+      output_module._event_documents.append({'my_number': index})
+      output_module._number_of_buffered_events += 1
+
+    output_module._FlushEvents()
+
+    self.assertEqual(output_module._event_documents, [])
+    self.assertEqual(output_module._number_of_buffered_events, 0)
+
+    output_module.Close()
+
+    self.assertEqual(output_module._number_of_inserted_events, 2)
+    self.assertEqual(
+        output_module._rejected_events_counter,
+        collections.Counter({'mapper_parsing_exception': 1}))
+
   def testGetFieldValues(self):
     """Tests the _GetFieldValues function."""
     output_mediator = self._CreateOutputMediator()
@@ -148,6 +191,37 @@ class SharedOpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     self.assertEqual(field_values, expected_field_values)
 
+  def testSerializeEventDocuments(self):
+    """Tests the _SerializeEventDocuments function.
+
+    Raises:
+      SkipTest: if opensearch-py is missing.
+    """
+    if shared_opensearch.opensearchpy is None:
+      raise unittest.SkipTest('missing opensearch-py')
+
+    output_module = TestOpenSearchOutputModule()
+    output_module._MAXIMUM_BULK_REQUEST_SIZE = 96
+
+    for index in range(3):
+      output_module._event_documents.append({'index': {'_index': 'test'}})
+      output_module._event_documents.append({'my_number': index})
+
+    output_module._event_documents.append({'index': {'_index': 'test'}})
+    output_module._event_documents.append({'my_object': object()})
+
+    bulk_requests = list(output_module._SerializeEventDocuments())
+    self.assertEqual(len(bulk_requests), 2)
+    self.assertEqual(bulk_requests[0], [
+        ('{"index":{"_index":"test"}}', '{"my_number":0}'),
+        ('{"index":{"_index":"test"}}', '{"my_number":1}')])
+    self.assertEqual(bulk_requests[1], [
+        ('{"index":{"_index":"test"}}', '{"my_number":2}')])
+
+    self.assertEqual(
+        output_module._rejected_events_counter,
+        collections.Counter({'serialization_error': 1}))
+
   def testSetFlushInterval(self):
     """Tests the SetFlushInterval function."""
     output_module = TestOpenSearchOutputModule()
@@ -169,6 +243,18 @@ class SharedOpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     self.assertEqual(output_module._index_name, 'test_index')
 
+  def testSetNumberOfBulkRequests(self):
+    """Tests the SetNumberOfBulkRequests function."""
+    output_module = TestOpenSearchOutputModule()
+
+    self.assertEqual(
+        output_module._number_of_bulk_requests,
+        output_module._DEFAULT_NUMBER_OF_BULK_REQUESTS)
+
+    output_module.SetNumberOfBulkRequests(8)
+
+    self.assertEqual(output_module._number_of_bulk_requests, 8)
+
   def testSetPassword(self):
     """Tests the SetPassword function."""
     output_module = TestOpenSearchOutputModule()
@@ -10,6 +10,34 @@ from plaso.output import text_file
 from tests.output import test_lib
 
 
+class SortedStringHeapTest(test_lib.OutputModuleTestCase):
+  """Tests for the heap to sort output strings."""
+
+  # pylint: disable=protected-access
+
+  def testPushStringAndPopStrings(self):
+    """Tests the PushString and PopStrings functions."""
+    sorted_string_heap = text_file.SortedStringHeap()
+    sorted_string_heap._MAXIMUM_NUMBER_OF_STRINGS = 3
+
+    for sort_key in ('e', 'b', 'g', 'a', 'f', 'c', 'd'):
+      sorted_string_heap.PushString(sort_key, '{0:s}\n'.format(sort_key))
+
+    self.assertEqual(sorted_string_heap.number_of_strings, 7)
+    self.assertEqual(sorted_string_heap._sorted_runs.number_of_runs, 2)
+
+    strings = list(sorted_string_heap.PopStrings())
+    self.assertEqual(strings, [
+        'a\n', 'b\n', 'c\n', 'd\n', 'e\n', 'f\n', 'g\n'])
+
+    self.assertEqual(sorted_string_heap.number_of_strings, 0)
+
+    sorted_string_heap.PushString('a', 'a\n')
+
+    strings = list(sorted_string_heap.PopStrings())
+    self.assertEqual(strings, ['a\n'])
+
+
 class TextFileOutputModuleTest(test_lib.OutputModuleTestCase):
   """Tests for the shared functionality for text file based output modules."""
 
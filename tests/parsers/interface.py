@@ -4,6 +4,7 @@
 
 import unittest
 
+from plaso.lib import errors
 from plaso.parsers import interface
 
 from tests.parsers import test_lib
@@ -43,5 +44,55 @@ class BaseParserTest(test_lib.ParserTestCase):
   # TODO: add tests for GetPlugins
 
 
+class TestFileObjectParser(interface.FileObjectParser):
+  """File-like object parser for testing."""
+
+  NAME = 'test_file_object'
+
+  _MAXIMUM_FILE_SIZE = 16
+
+  _MINIMUM_FILE_SIZE = 4
+
+  def ParseFileObject(self, parser_mediator, file_object):
+    """Parses a file-like object.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_object (dfvfs.FileIO): a file-like object to parse.
+    """
+    return
+
+
+class FileObjectParserTest(test_lib.ParserTestCase):
+  """Tests for the file-like object parser interface."""
+
+  def testCheckFileSize(self):
+    """Tests the CheckFileSize function."""
+    parser = TestFileObjectParser()
+
+    self.assertFalse(parser.CheckFileSize(3))
+    self.assertTrue(parser.CheckFileSize(4))
+    self.assertTrue(parser.CheckFileSize(16))
+    self.assertFalse(parser.CheckFileSize(17))
+
+  def testParse(self):
+    """Tests the Parse function."""
+    parser = TestFileObjectParser()
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(storage_writer)
+
+    file_object = self._CreateFileObject('test', b'test')
+    parser.Parse(parser_mediator, file_object)
+
+    file_object = self._CreateFileObject('test', b'tst')
+    with self.assertRaises(errors.WrongParser):
+      parser.Parse(parser_mediator, file_object)
+
+    file_object = self._CreateFileObject('test', b'test' * 5)
+    with self.assertRaises(errors.WrongParser):
+      parser.Parse(parser_mediator, file_object)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -10,6 +10,7 @@ from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.containers import events
 from plaso.parsers import mediator
+from plaso.serializer import json_serializer
 from plaso.storage.fake import writer as fake_writer
 
 from tests.parsers import test_lib
@@ -132,6 +133,65 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
     # TODO: improve test coverage.
 
   # TODO: add tests for GetParserChain.
+
+  def testGetRecordIndexRange(self):
+    """Tests the GetRecordIndexRange function."""
+    parser_mediator = mediator.ParserMediator()
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    storage_writer.Open()
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_FAKE, location='/test.evtx')
+    event_data_stream = events.EventDataStream()
+    event_data_stream.md5_hash = 'e3df0d2abd2c27fbdadfb41a47442520'
+    event_data_stream.path_spec = path_spec
+    event_data_stream.yara_match = ['test_rule']
+    parser_mediator.ProduceEventDataStream(event_data_stream)
+
+    parser_mediator.AppendToParserChain('test_parser')
+
+    record_indexes = parser_mediator.GetRecordIndexRange(250, 100)
+    self.assertEqual(record_indexes, range(0, 250))
+
+    number_of_event_sources = storage_writer.GetNumberOfAttributeContainers(
+        'event_source')
+    self.assertEqual(number_of_event_sources, 0)
+
+    parser_mediator.SetSplitRecordRanges(True)
+
+    record_indexes = parser_mediator.GetRecordIndexRange(250, 100)
+    self.assertEqual(record_indexes, range(0, 100))
+
+    number_of_event_sources = storage_writer.GetNumberOfAttributeContainers(
+        'event_source')
+    self.assertEqual(number_of_event_sources, 2)
+
+    event_source = storage_writer.GetAttributeContainerByIndex(
+        'event_source', 1)
+    self.assertIsNotNone(event_source.event_data_stream_values)
+    self.assertEqual(event_source.first_record_index, 200)
+    self.assertEqual(event_source.number_of_records, 100)
+    self.assertEqual(event_source.parser_name, 'test_parser')
+    self.assertEqual(event_source.path_spec, path_spec)
+
+    event_data_stream = (
+        json_serializer.JSONAttributeContainerSerializer.ReadSerialized(
+            event_source.event_data_stream_values))
+    self.assertEqual(
+        event_data_stream.md5_hash, 'e3df0d2abd2c27fbdadfb41a47442520')
+    self.assertEqual(event_data_stream.path_spec, path_spec)
+    self.assertEqual(event_data_stream.yara_match, ['test_rule'])
+
+    parser_mediator.SetRecordRange(200, 100)
+
+    record_indexes = parser_mediator.GetRecordIndexRange(250, 100)
+    self.assertEqual(record_indexes, range(200, 250))
+
+    parser_mediator.ResetRecordRange()
+
   # TODO: add tests for GetRelativePathForPathSpec.
   # TODO: add tests for PopFromParserChain.
 
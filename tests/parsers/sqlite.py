@@ -2,18 +2,42 @@
 # -*- coding: utf-8 -*-
 """Tests for the SQLite database parser."""
 
+import os
+import sqlite3
 import unittest
 
 from plaso.parsers import sqlite
 # Register all plugins.
 from plaso.parsers import sqlite_plugins  # pylint: disable=unused-import
 
+from tests import test_lib as shared_test_lib
 from tests.parsers import test_lib
 
 
+class SQLiteCacheTest(test_lib.ParserTestCase):
+  """Tests for the SQLite cache."""
+
+  def testCreateDeltaCache(self):
+    """Tests the CreateDeltaCache function."""
+    cache = sqlite.SQLiteCache()
+    cache.url = {1: ['https://example.com', 'Example']}
+
+    row_cache = cache.GetRowCache('SELECT * FROM MyTable')
+    row_cache.add(12345)
+
+    delta_cache = cache.CreateDeltaCache()
+
+    row_cache = delta_cache.GetRowCache('SELECT * FROM MyTable')
+    self.assertEqual(row_cache, set([12345]))
+
+    self.assertIsNone(delta_cache.GetResults('url'))
+
+
 class SQLiteDatabaseTest(test_lib.ParserTestCase):
   """Tests for the SQLite database."""
 
+  # pylint: disable=protected-access
+
   # TODO: add tests for tables property
   # TODO: add tests for _CopyFileObjectToTemporaryFile
   # TODO: add tests for Open and Close
@@ -38,6 +62,43 @@ class SQLiteDatabaseTest(test_lib.ParserTestCase):
       database.Open(database_file_object)
       database.Close()
 
+  def testOpenInMemory(self):
+    """Tests the Open function on a database that is opened in memory."""
+    if not sqlite.SQLiteDatabase._SUPPORTS_IN_MEMORY_DATABASE:
+      raise unittest.SkipTest('missing sqlite3 deserialize support')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      database_file_path = os.path.join(temp_directory, 'test.db')
+
+      connection = sqlite3.connect(database_file_path)
+      connection.execute('PRAGMA journal_mode=WAL')
+      connection.execute('CREATE TABLE MyTable (Field1 TEXT, Field2 INT)')
+      connection.execute('INSERT INTO MyTable VALUES ("Text 1", 1)')
+      connection.commit()
+      # Closing the connection checkpoints the WAL file into the database.
+      connection.close()
+
+      database = sqlite.SQLiteDatabase(
+          'test.db', temporary_directory=temp_directory)
+      with open(database_file_path, 'rb') as database_file_object:
+        database.Open(database_file_object)
+
+      try:
+        self.assertEqual(database._temp_db_file_path, '')
+        self.assertEqual(list(database.tables), ['MyTable'])
+        self.assertEqual(
+            database.columns_per_table['MyTable'], ['Field1', 'Field2'])
+
+        row_results = [
+            (row['Field1'], row['Field2'])
+            for row in database.Query('SELECT * FROM MyTable')]
+        self.assertEqual(row_results, [('Text 1', 1)])
+
+      finally:
+        database.Close()
+
+      self.assertEqual(os.listdir(temp_directory), ['test.db'])
+
   def testQueryOnDatabaseWithWAL(self):
     """Tests the Query function on a database with a WAL file."""
     database_file_path = self._GetTestFilePath(['wal_database.db'])
@@ -120,6 +181,30 @@ class SQLiteParserTest(test_lib.ParserTestCase):
     parser.EnablePlugins(['chrome_27_history'])
     self.assertEqual(len(parser._plugins_per_name), 1)
 
+    parser.EnablePlugins([])
+    self.assertEqual(len(parser._plugins_per_table_name), 0)
+
+  def testGetPluginsForDatabase(self):
+    """Tests the _GetPluginsForDatabase function."""
+    database_file_path = self._GetTestFilePath(['contacts2.db'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    parser = sqlite.SQLiteParser()
+
+    database = sqlite.SQLiteDatabase('contacts2.db')
+    with open(database_file_path, 'rb') as database_file_object:
+      database.Open(database_file_object)
+
+    try:
+      plugins = parser._GetPluginsForDatabase(database)
+    finally:
+      database.Close()
+
+    plugin_names = [plugin.NAME for plugin in plugins]
+    self.assertIn('android_calls', plugin_names)
+    self.assertNotIn('chrome_27_history', plugin_names)
+    self.assertLess(len(plugin_names), len(parser._plugins_per_name))
+
   def testGetFormatSpecification(self):
     """Tests the GetFormatSpecification function."""
     format_specification = sqlite.SQLiteParser.GetFormatSpecification()
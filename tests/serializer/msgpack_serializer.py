@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the serializer object implementation using MessagePack."""
+
+import collections
+import unittest
+
+from dfdatetime import posix_time as dfdatetime_posix_time
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+try:
+  from plaso.serializer import msgpack_serializer
+except ModuleNotFoundError:
+  msgpack_serializer = None
+
+from plaso.containers import events
+from plaso.containers import reports
+
+from tests import test_lib as shared_test_lib
+
+
+@unittest.skipIf(msgpack_serializer is None, 'missing msgpack support')
+class MessagePackAttributeContainerSerializerTest(
+    shared_test_lib.BaseTestCase):
+  """Tests for the MessagePack attribute container serializer object."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestPathSpec(self, location):
+    """Creates a path specification with an OS parent for testing.
+
+    Args:
+      location (str): location of the TSK path specification.
+
+    Returns:
+      dfvfs.PathSpec: path specification.
+    """
+    volume_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/image.raw')
+    return path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location=location,
+        parent=volume_path_spec)
+
+  def testReadAndWriteSerializedAnalysisReport(self):
+    """Test ReadSerialized and WriteSerialized of AnalysisReport."""
+    expected_analysis_counter = collections.Counter({
+        'bar': 2, 'foo': 1})
+
+    expected_analysis_report = reports.AnalysisReport(
+        plugin_name='test', text='This is a test analysis report.')
+    expected_analysis_report.analysis_counter = expected_analysis_counter
+
+    serializer = msgpack_serializer.MessagePackAttributeContainerSerializer()
+
+    data = serializer.WriteSerialized(expected_analysis_report)
+    self.assertIsInstance(data, bytes)
+
+    analysis_report = serializer.ReadSerialized(data)
+    self.assertIsInstance(analysis_report, reports.AnalysisReport)
+    self.assertEqual(analysis_report.plugin_name, 'test')
+    self.assertEqual(
+        analysis_report.text, 'This is a test analysis report.')
+    self.assertIsInstance(
+        analysis_report.analysis_counter, collections.Counter)
+    self.assertEqual(
+        analysis_report.analysis_counter, expected_analysis_counter)
+
+  def testReadAndWriteSerializedEventData(self):
+    """Test ReadSerialized and WriteSerialized of EventData."""
+    expected_event_data = events.EventData()
+    expected_event_data._event_data_stream_identifier = 'event_data_stream.1'
+    expected_event_data._ignored = 'Not serialized'
+    expected_event_data._parser_chain = 'test_parser'
+    expected_event_data.data_type = 'test:event2'
+
+    expected_event_data.empty_string = ''
+    expected_event_data.zero_integer = 0
+    expected_event_data.integer = 34
+    expected_event_data.float = -122.082203542683
+    expected_event_data.string = 'Normal string'
+    expected_event_data.unicode_string = 'And I am a unicorn.'
+    expected_event_data.my_list = ['asf', 4234, 2, 54, 'asf']
+    expected_event_data.a_tuple = ('some item', [234, 52, 15])
+    expected_event_data.null_value = None
+
+    serializer = msgpack_serializer.MessagePackAttributeContainerSerializer()
+
+    data = serializer.WriteSerialized(expected_event_data)
+    self.assertIsNotNone(data)
+
+    event_data = serializer.ReadSerialized(data)
+    self.assertIsInstance(event_data, events.EventData)
+
+    expected_event_data_dict = {
+        '_event_data_stream_identifier': 'event_data_stream.1',
+        '_parser_chain': 'test_parser',
+        'a_tuple': ('some item', [234, 52, 15]),
+        'data_type': 'test:event2',
+        'empty_string': '',
+        'integer': 34,
+        'float': -122.082203542683,
+        'my_list': ['asf', 4234, 2, 54, 'asf'],
+        'string': 'Normal string',
+        'unicode_string': 'And I am a unicorn.',
+        'zero_integer': 0}
+
+    event_data_dict = event_data.CopyToDict()
+    self.assertEqual(event_data_dict, expected_event_data_dict)
+
+  def testReadAndWriteSerializedEventDataStream(self):
+    """Test ReadSerialized and WriteSerialized of EventDataStream."""
+    path_spec = self._CreateTestPathSpec('/')
+
+    expected_event_data_stream = events.EventDataStream()
+    expected_event_data_stream.md5_hash = 'e3df0d2abd2c27fbdadfb41a47442520'
+    expected_event_data_stream.path_spec = path_spec
+
+    serializer = msgpack_serializer.MessagePackAttributeContainerSerializer()
+
+    data = serializer.WriteSerialized(expected_event_data_stream)
+    self.assertIsNotNone(data)
+
+    event_data_stream = serializer.ReadSerialized(data)
+    self.assertIsInstance(event_data_stream, events.EventDataStream)
+    self.assertEqual(
+        event_data_stream.md5_hash, 'e3df0d2abd2c27fbdadfb41a47442520')
+    self.assertEqual(
+        event_data_stream.path_spec.comparable, path_spec.comparable)
+
+  def testReadAndWriteSerializedEventDataStreamWithInterning(self):
+    """Test ReadSerialized and WriteSerialized with interned path specs."""
+    interned_data = []
+
+    def _InternCallback(data):
+      interned_data.append(data)
+      return len(interned_data)
+
+    def _LookupCallback(identifier):
+      return interned_data[identifier - 1]
+
+    serializer = msgpack_serializer.MessagePackAttributeContainerSerializer(
+        intern_callback=_InternCallback, lookup_callback=_LookupCallback)
+
+    serialized_data = []
+    for location in ('/a_directory', '/a_directory/a_file', '/passwords.txt'):
+      event_data_stream = events.EventDataStream()
+      event_data_stream.path_spec = self._CreateTestPathSpec(location)
+
+      serialized_data.append(serializer.WriteSerialized(event_data_stream))
+
+    # The shared parent path specification is only interned once.
+    self.assertEqual(len(interned_data), 1)
+
+    serializer = msgpack_serializer.MessagePackAttributeContainerSerializer(
+        intern_callback=_InternCallback, lookup_callback=_LookupCallback)
+
+    event_data_stream = serializer.ReadSerialized(serialized_data[1])
+    self.assertIsInstance(event_data_stream, events.EventDataStream)
+
+    expected_path_spec = self._CreateTestPathSpec('/a_directory/a_file')
+    self.assertEqual(
+        event_data_stream.path_spec.comparable, expected_path_spec.comparable)
+
+    serializer = msgpack_serializer.MessagePackAttributeContainerSerializer()
+
+    with self.assertRaises(ValueError):
+      serializer.ReadSerialized(serialized_data[0])
+
+  def testReadAndWriteSerializedEventObject(self):
+    """Test ReadSerialized and WriteSerialized of EventObject."""
+    expected_event = events.EventObject()
+    expected_event._event_data_identifier = 'event_data.1'
+    expected_event.date_time = dfdatetime_posix_time.PosixTime(
+        timestamp=1621839644)
+    expected_event.timestamp = 1621839644000000
+    expected_event.timestamp_desc = 'Written'
+
+    serializer = msgpack_serializer.MessagePackAttributeContainerSerializer()
+
+    data = serializer.WriteSerialized(expected_event)
+    self.assertIsNotNone(data)
+
+    event = serializer.ReadSerialized(data)
+    self.assertIsInstance(event, events.EventObject)
+    self.assertEqual(event.timestamp, 1621839644000000)
+    self.assertEqual(event.timestamp_desc, 'Written')
+    self.assertIsInstance(event.date_time, dfdatetime_posix_time.PosixTime)
+    self.assertEqual(event.date_time.timestamp, 1621839644)
+
+  def testReadAndWriteSerializedValue(self):
+    """Test ReadSerializedValue and WriteSerializedValue."""
+    serializer = msgpack_serializer.MessagePackAttributeContainerSerializer()
+
+    expected_value = {
+        'a_set': ['item'],
+        'a_tuple': (1, 'two'),
+        'bytes': b'\x00\x01',
+        'integer': 1}
+
+    data = serializer.WriteSerializedValue({
+        'a_set': {'item'},
+        'a_tuple': (1, 'two'),
+        'bytes': b'\x00\x01',
+        'integer': 1})
+
+    value = serializer.ReadSerializedValue(data)
+    self.assertEqual(value, expected_value)
+
+    with self.assertRaises(TypeError):
+      serializer.WriteSerializedValue(object())
+
+
+if __name__ == '__main__':
+  unittest.main()
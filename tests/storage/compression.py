@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the attribute container store compression codecs."""
+
+import unittest
+
+from plaso.lib import definitions
+from plaso.storage import compression
+
+from tests import test_lib as shared_test_lib
+
+
+class TestCompressionCodec(compression.CompressionCodec):
+  """Compression codec for testing."""
+
+  COMPRESSION_FORMAT = 'test'
+
+  def Compress(self, data):
+    """Compresses data.
+
+    Args:
+      data (bytes): uncompressed data.
+
+    Returns:
+      bytes: compressed data.
+    """
+    return data
+
+  def Decompress(self, data):
+    """Decompresses data.
+
+    Args:
+      data (bytes): compressed data.
+
+    Returns:
+      bytes: uncompressed data.
+    """
+    return data
+
+
+class CompressionCodecTestCase(shared_test_lib.BaseTestCase):
+  """Shared functionality for compression codec tests."""
+
+  _TEST_DATA = (
+      b'{"__container_type__": "event_data", "data_type": "test:event", '
+      b'"parser": "test_parser", "value": 1}')
+
+  def _TestCompressAndDecompress(self, codec):
+    """Tests the Compress and Decompress functions.
+
+    Args:
+      codec (CompressionCodec): compression codec.
+    """
+    compressed_data = codec.Compress(self._TEST_DATA)
+    self.assertIsInstance(compressed_data, bytes)
+
+    data = codec.Decompress(compressed_data)
+    self.assertEqual(data, self._TEST_DATA)
+
+    with self.assertRaises(IOError):
+      codec.Decompress(b'\xff' * 16)
+
+
+class CompressionCodecTest(CompressionCodecTestCase):
+  """Tests for the compression codec interface."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    # pylint: disable=abstract-class-instantiated
+    with self.assertRaises(TypeError):
+      compression.CompressionCodec()
+
+    codec = TestCompressionCodec()
+    self.assertIsNone(codec.dictionary)
+
+
+class LZ4CompressionCodecTest(CompressionCodecTestCase):
+  """Tests for the LZ4 block compression codec."""
+
+  def testCompressAndDecompress(self):
+    """Tests the Compress and Decompress functions."""
+    codec = compression.LZ4CompressionCodec()
+    self._TestCompressAndDecompress(codec)
+
+    with self.assertRaises(ValueError):
+      codec.SetDictionary(b'dictionary')
+
+
+class ZlibCompressionCodecTest(CompressionCodecTestCase):
+  """Tests for the zlib compression codec."""
+
+  def testCompressAndDecompress(self):
+    """Tests the Compress and Decompress functions."""
+    codec = compression.ZlibCompressionCodec()
+    self._TestCompressAndDecompress(codec)
+
+    dictionary = codec.TrainDictionary([self._TEST_DATA])
+    self.assertIsNone(dictionary)
+
+
+@unittest.skipIf(compression.zstandard is None, 'missing zstandard support')
+class ZstdCompressionCodecTest(CompressionCodecTestCase):
+  """Tests for the Zstandard compression codec."""
+
+  def _CreateSamples(self, number_of_samples):
+    """Creates data samples.
+
+    Args:
+      number_of_samples (int): number of samples.
+
+    Returns:
+      list[bytes]: data samples.
+    """
+    return [(
+        '{{"__container_type__": "event_data", "data_type": "test:event", '
+        '"parser": "test_parser", "offset": {0:d}, "path": '
+        '"/home/user{1:d}/.bash_history"}}').format(
+            index * 37, index % 13).encode('utf-8')
+            for index in range(number_of_samples)]
+
+  def testCompressAndDecompress(self):
+    """Tests the Compress and Decompress functions."""
+    codec = compression.ZstdCompressionCodec()
+    self._TestCompressAndDecompress(codec)
+
+  def testTrainDictionary(self):
+    """Tests the TrainDictionary and SetDictionary functions."""
+    samples = self._CreateSamples(1000)
+
+    codec = compression.ZstdCompressionCodec()
+
+    compressed_data_without_dictionary = codec.Compress(samples[0])
+
+    dictionary = codec.TrainDictionary(samples)
+    self.assertIsNotNone(dictionary)
+
+    codec.SetDictionary(dictionary)
+    self.assertEqual(codec.dictionary, dictionary)
+
+    compressed_data = codec.Compress(samples[0])
+    self.assertLess(
+        len(compressed_data), len(compressed_data_without_dictionary))
+
+    # Data compressed with and without the dictionary can be decompressed.
+    self.assertEqual(codec.Decompress(compressed_data), samples[0])
+    self.assertEqual(
+        codec.Decompress(compressed_data_without_dictionary), samples[0])
+
+    codec = compression.ZstdCompressionCodec()
+    with self.assertRaises(IOError):
+      codec.Decompress(compressed_data)
+
+    dictionary = codec.TrainDictionary(samples[:2])
+    self.assertIsNone(dictionary)
+
+
+class CompressionCodecsManagerTest(shared_test_lib.BaseTestCase):
+  """Tests for the compression codecs manager."""
+
+  def testCodecRegistration(self):
+    """Tests the RegisterCodec and DeregisterCodec functions."""
+    number_of_codecs = len(
+        compression.CompressionCodecsManager._codec_classes)
+
+    compression.CompressionCodecsManager.RegisterCodec(TestCompressionCodec)
+
+    try:
+      self.assertEqual(
+          len(compression.CompressionCodecsManager._codec_classes),
+          number_of_codecs + 1)
+
+      with self.assertRaises(KeyError):
+        compression.CompressionCodecsManager.RegisterCodec(
+            TestCompressionCodec)
+
+    finally:
+      compression.CompressionCodecsManager.DeregisterCodec(
+          TestCompressionCodec)
+
+    self.assertEqual(
+        len(compression.CompressionCodecsManager._codec_classes),
+        number_of_codecs)
+
+    with self.assertRaises(KeyError):
+      compression.CompressionCodecsManager.DeregisterCodec(
+          TestCompressionCodec)
+
+  def testGetCodec(self):
+    """Tests the GetCodec function."""
+    codec = compression.CompressionCodecsManager.GetCodec(
+        definitions.COMPRESSION_FORMAT_NONE)
+    self.assertIsNone(codec)
+
+    codec = compression.CompressionCodecsManager.GetCodec(
+        definitions.COMPRESSION_FORMAT_ZLIB)
+    self.assertIsInstance(codec, compression.ZlibCompressionCodec)
+
+    with self.assertRaises(ValueError):
+      compression.CompressionCodecsManager.GetCodec('bogus')
+
+  def testGetCompressionFormats(self):
+    """Tests the GetCompressionFormats function."""
+    compression_formats = (
+        compression.CompressionCodecsManager.GetCompressionFormats())
+    self.assertIn(definitions.COMPRESSION_FORMAT_LZ4, compression_formats)
+    self.assertIn(definitions.COMPRESSION_FORMAT_NONE, compression_formats)
+    self.assertIn(definitions.COMPRESSION_FORMAT_ZLIB, compression_formats)
+
+
+if __name__ == '__main__':
+  unittest.main()
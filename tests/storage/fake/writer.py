@@ -140,6 +140,37 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
 
     # TODO: add test with time range.
 
+  def testGetSortedEventsWithData(self):
+    """Tests the GetSortedEventsWithData function."""
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    try:
+      test_events = self._AddTestEvents(storage_writer)
+
+      event_tag = events.EventTag()
+      event_tag.SetEventIdentifier(test_events[1].GetIdentifier())
+      event_tag.AddLabel('Malware')
+      storage_writer.AddAttributeContainer(event_tag)
+
+      test_values = list(storage_writer.GetSortedEventsWithData())
+      self.assertEqual(len(test_values), 4)
+
+      event, event_data, event_data_stream, event_tag = test_values[0]
+      self.assertEqual(event_data.data_type, 'text:entry')
+      self.assertEqual(
+          event.GetEventDataIdentifier().CopyToString(),
+          event_data.GetIdentifier().CopyToString())
+      self.assertIsNotNone(event_data_stream)
+      self.assertIsNone(event_tag)
+
+      event, _, _, event_tag = test_values[3]
+      self.assertIsNotNone(event_tag)
+      self.assertEqual(event_tag.labels, ['Malware'])
+
+    finally:
+      storage_writer.Close()
+
   def testOpenClose(self):
     """Tests the Open and Close functions."""
     storage_writer = fake_writer.FakeStorageWriter()
@@ -89,6 +89,14 @@ class StorageReaderTest(test_lib.StorageTestCase):
     finally:
       test_reader._store.Close()
 
+  def testGetCompressionFormat(self):
+    """Tests the GetCompressionFormat function."""
+    test_reader = reader.StorageReader()
+    test_reader._store = fake_store.FakeStore()
+
+    compression_format = test_reader.GetCompressionFormat()
+    self.assertIsNone(compression_format)
+
   def testGetFormatVersion(self):
     """Tests the GetFormatVersion function."""
     test_reader = reader.StorageReader()
@@ -378,6 +378,17 @@ class RedisStoreTest(test_lib.StorageTestCase):
       retrieved_events = list(test_store.GetSortedEvents())
       self.assertEqual(len(retrieved_events), 4)
 
+      timestamps = [event.timestamp for event in retrieved_events]
+      self.assertEqual(timestamps, sorted(timestamps))
+
+      test_store.read_batch_size = 3
+
+      retrieved_events = list(test_store.GetSortedEvents())
+      self.assertEqual(len(retrieved_events), 4)
+
+      timestamps = [event.timestamp for event in retrieved_events]
+      self.assertEqual(timestamps, sorted(timestamps))
+
     finally:
       test_store.Close()
 
@@ -5,8 +5,14 @@
 import os
 import unittest
 
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
 from plaso.containers import events
+from plaso.filters import event_filter
+from plaso.filters import filters
 from plaso.lib import definitions
+from plaso.storage import time_range
 from plaso.storage.sqlite import sqlite_file
 
 from tests import test_lib as shared_test_lib
@@ -113,6 +119,27 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
   # TODO: add tests for _CreateAttributeContainerFromRow
   # TODO: add tests for _DeserializeAttributeContainer
 
+  def testFlushWriteCache(self):
+    """Tests the _FlushWriteCache function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        number_of_containers = test_store._MAXIMUM_WRITE_CACHE_SIZE + 5
+        for _ in range(number_of_containers):
+          event_data_stream = events.EventDataStream()
+          test_store.AddAttributeContainer(event_data_stream)
+
+        result_number_of_containers = (
+            test_store.GetNumberOfAttributeContainers(
+                events.EventDataStream.CONTAINER_TYPE))
+        self.assertEqual(result_number_of_containers, number_of_containers)
+
+      finally:
+        test_store.Close()
+
   def testGetAttributeContainersWithFilter(self):
     """Tests the _GetAttributeContainersWithFilter function."""
     event_data_stream = events.EventDataStream()
@@ -193,6 +220,26 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
+  def testHasEventIndex(self):
+    """Tests the _HasEventIndex function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        result = test_store._HasEventIndex()
+        self.assertFalse(result)
+
+        test_store._CreateAttributeContainerTable(
+            events.EventObject.CONTAINER_TYPE)
+
+        result = test_store._HasEventIndex()
+        self.assertTrue(result)
+
+      finally:
+        test_store.Close()
+
   # TODO: add tests for _RaiseIfNotReadable
   # TODO: add tests for _RaiseIfNotWritable
   # TODO: add tests for _ReadAndCheckStorageMetadata
@@ -237,6 +284,37 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
   # TODO: add tests for _WriteMetadata
   # TODO: add tests for _WriteMetadataValue
 
+  def testWriteEventIndexValues(self):
+    """Tests the _WriteEventIndexValues function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_store.AddAttributeContainer(event_data)
+
+        event.SetEventDataIdentifier(event_data.GetIdentifier())
+        test_store.AddAttributeContainer(event)
+
+        test_store._CommitWriteCache('event_index')
+
+        test_store._cursor.execute(
+            'SELECT _event_identifier, timestamp, timestamp_desc, data_type, '
+            'parser_chain, _event_data_identifier FROM event_index')
+        rows = test_store._cursor.fetchall()
+
+      finally:
+        test_store.Close()
+
+    expected_rows = [(
+        1, 1334961526929596, 'Content Modification Time',
+        'windows:registry:key_value', 'test_parser', 1)]
+    self.assertEqual(rows, expected_rows)
+
   def testWriteNewAttributeContainer(self):
     """Tests the _WriteNewAttributeContainer function."""
     event_data_stream = events.EventDataStream()
@@ -440,10 +518,130 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
         test_events = list(test_store.GetSortedEvents())
         self.assertEqual(len(test_events), 4)
 
+        timestamps = [event.timestamp for event in test_events]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+        test_time_range = time_range.TimeRange(
+            1334950000000000, 1334966400000000)
+        test_events = list(test_store.GetSortedEvents(
+            time_range=test_time_range))
+        self.assertEqual(len(test_events), 2)
+
+      finally:
+        test_store.Close()
+
+      # Test a storage file without an event index.
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_store._cursor.execute('DROP TABLE event_index')
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        test_events = list(test_store.GetSortedEvents())
+        self.assertEqual(len(test_events), 4)
+
+        test_events = list(test_store.GetSortedEvents(
+            time_range=test_time_range))
+        self.assertEqual(len(test_events), 2)
+
+      finally:
+        test_store.Close()
+
+  def testGetSortedEventsWithData(self):
+    """Tests the GetSortedEventsWithData function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_events = []
+        for event, event_data, event_data_stream in (
+            containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+          test_store.AddAttributeContainer(event_data_stream)
+
+          event_data.SetEventDataStreamIdentifier(
+              event_data_stream.GetIdentifier())
+          test_store.AddAttributeContainer(event_data)
+
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+          test_events.append(event)
+
+        event_tag = events.EventTag()
+        event_tag.SetEventIdentifier(test_events[1].GetIdentifier())
+        event_tag.AddLabel('Malware')
+        test_store.AddAttributeContainer(event_tag)
+
       finally:
         test_store.Close()
 
-    # TODO: add test with time range.
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        test_values = list(test_store.GetSortedEventsWithData())
+        self.assertEqual(len(test_values), 4)
+
+        timestamps = [event.timestamp for event, _, _, _ in test_values]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+        event, event_data, event_data_stream, event_tag = test_values[0]
+        self.assertEqual(event_data.data_type, 'text:entry')
+        self.assertEqual(
+            event.GetEventDataIdentifier().CopyToString(),
+            event_data.GetIdentifier().CopyToString())
+        self.assertIsNotNone(event_data_stream)
+        self.assertIsNone(event_tag)
+
+        event, event_data, event_data_stream, event_tag = test_values[3]
+        self.assertEqual(event_data.key_path, (
+            'HKEY_CURRENT_USER\\Secret\\EvilEmpire\\Malicious_key'))
+        self.assertIsNotNone(event_tag)
+        self.assertEqual(event_tag.labels, ['Malware'])
+        self.assertEqual(
+            event_tag.GetEventIdentifier().CopyToString(),
+            event.GetIdentifier().CopyToString())
+
+        test_event_filter = event_filter.EventObjectFilter()
+        test_event_filter.CompileFilter('data_type is \'text:entry\'')
+
+        test_values = list(test_store.GetSortedEventsWithData(
+            event_filter=test_event_filter))
+        self.assertEqual(len(test_values), 1)
+
+        test_event_filter = event_filter.EventObjectFilter()
+        test_event_filter.CompileFilter(
+            'data_type regexp \'^windows:registry:\' and '
+            'timestamp > DATETIME("2012-04-20T20:00:00")')
+
+        test_values = list(test_store.GetSortedEventsWithData(
+            event_filter=test_event_filter))
+        self.assertEqual(len(test_values), 2)
+
+        # The filter expression parser does not support sets, hence the in set
+        # operator is set directly.
+        test_event_filter = event_filter.EventObjectFilter()
+        test_event_filter._event_filter = filters.InSet(
+            arguments=['data_type', ['text:entry', 'test\'s:event']])
+
+        test_values = list(test_store.GetSortedEventsWithData(
+            event_filter=test_event_filter))
+        self.assertEqual(len(test_values), 1)
+
+        _, event_data, _, _ = test_values[0]
+        self.assertEqual(event_data.data_type, 'text:entry')
+
+      finally:
+        test_store.Close()
 
   def testHasAttributeContainers(self):
     """Tests the HasAttributeContainers function."""
@@ -473,6 +671,110 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
   # TODO: add tests for Open and Close
 
+  @unittest.skipIf(
+      sqlite_file.compression.zstandard is None, 'missing zstandard support')
+  def testCompressionFormatZstd(self):
+    """Tests reading and writing with the Zstandard compression format."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.compression_format = definitions.COMPRESSION_FORMAT_ZSTD
+      test_store._COMPRESSION_DICTIONARY_NUMBER_OF_SAMPLES = 500
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for index in range(1000):
+          event_data = events.EventData(data_type='test:event')
+          event_data.offset = index * 37
+          event_data.path = '/home/user{0:d}/.bash_history'.format(index % 13)
+          test_store.AddAttributeContainer(event_data)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertEqual(
+            test_store.compression_format, definitions.COMPRESSION_FORMAT_ZSTD)
+
+        test_store._cursor.execute(
+            'SELECT container_type FROM compression_dictionary')
+        self.assertEqual(test_store._cursor.fetchall(), [('event_data', )])
+
+        containers = list(test_store.GetAttributeContainers('event_data'))
+        self.assertEqual(len(containers), 1000)
+        self.assertEqual(containers[0].offset, 0)
+        self.assertEqual(containers[999].offset, 999 * 37)
+        self.assertEqual(containers[999].path, '/home/user11/.bash_history')
+
+      finally:
+        test_store.Close()
+
+  @unittest.skipIf(
+      sqlite_file.msgpack_serializer is None, 'missing msgpack support')
+  def testSerializationFormatMessagePack(self):
+    """Tests reading and writing with the MessagePack serialization format."""
+    volume_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/image.raw')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.serialization_format = definitions.SERIALIZER_FORMAT_MSGPACK
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for location in ('/a_directory', '/a_directory/a_file'):
+          event_data_stream = events.EventDataStream()
+          event_data_stream.path_spec = path_spec_factory.Factory.NewPathSpec(
+              dfvfs_definitions.TYPE_INDICATOR_TSK, location=location,
+              parent=volume_path_spec)
+          test_store.AddAttributeContainer(event_data_stream)
+
+        for event, event_data, _ in containers_test_lib.CreateEventsFromValues(
+            self._TEST_EVENTS):
+          test_store.AddAttributeContainer(event_data)
+
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertEqual(
+            test_store.serialization_format,
+            definitions.SERIALIZER_FORMAT_MSGPACK)
+
+        # The shared parent path specification is only stored once.
+        test_store._cursor.execute(
+            'SELECT COUNT(*) FROM interned_path_spec')
+        self.assertEqual(test_store._cursor.fetchone()[0], 1)
+
+        containers = list(test_store.GetAttributeContainers(
+            'event_data_stream'))
+        self.assertEqual(len(containers), 2)
+        self.assertEqual(
+            containers[1].path_spec.location, '/a_directory/a_file')
+        self.assertEqual(
+            containers[1].path_spec.parent.location, '/tmp/image.raw')
+
+        containers = list(test_store.GetAttributeContainers('event_data'))
+        self.assertEqual(len(containers), len(self._TEST_EVENTS))
+        self.assertEqual(
+            containers[0].data_type, 'windows:registry:key_value')
+
+        containers = list(test_store.GetSortedEvents())
+        self.assertEqual(len(containers), len(self._TEST_EVENTS))
+
+      finally:
+        test_store.Close()
+
   def testUpdateAttributeContainer(self):
     """Tests the UpdateAttributeContainer function."""
     event_data_stream = events.EventDataStream()
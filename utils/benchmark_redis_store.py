@@ -0,0 +1,205 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark reading events from the Redis store."""
+
+import argparse
+import random
+import sys
+import time
+
+import redis
+
+try:
+  import fakeredis
+except ModuleNotFoundError:
+  fakeredis = None
+
+from plaso.containers import events
+from plaso.containers import sessions
+from plaso.containers import tasks
+from plaso.storage.redis import redis_store
+
+
+class RedisStoreBenchmark(object):
+  """Redis store benchmark."""
+
+  def __init__(self, redis_client):
+    """Initializes a Redis store benchmark.
+
+    Args:
+      redis_client (Redis): Redis client.
+    """
+    super(RedisStoreBenchmark, self).__init__()
+    self._redis_client = redis_client
+    self._session_identifier = None
+    self._task_identifier = None
+
+  def _OpenStore(self, read_batch_size=None):
+    """Opens a Redis store of the benchmark task.
+
+    Args:
+      read_batch_size (Optional[int]): maximum number of attribute containers
+          read in a single round trip.
+
+    Returns:
+      RedisStore: Redis store.
+    """
+    store = redis_store.RedisStore()
+    if read_batch_size:
+      store.read_batch_size = read_batch_size
+
+    store.Open(
+        redis_client=self._redis_client,
+        session_identifier=self._session_identifier,
+        task_identifier=self._task_identifier)
+    return store
+
+  def Cleanup(self):
+    """Removes the benchmark data from Redis."""
+    if self._session_identifier:
+      redis_hash_pattern = '{0:s}-*'.format(self._session_identifier)
+      for redis_hash_name in self._redis_client.keys(redis_hash_pattern):
+        self._redis_client.delete(redis_hash_name)
+
+  def TimeGetAttributeContainers(self, read_batch_size):
+    """Times reading all events in storage order.
+
+    Args:
+      read_batch_size (int): maximum number of attribute containers read in
+          a single round trip.
+
+    Returns:
+      tuple[int, float]: number of events read and elapsed time in seconds.
+    """
+    store = self._OpenStore(read_batch_size=read_batch_size)
+    try:
+      start_time = time.perf_counter()
+      number_of_events = sum(
+          1 for _ in store.GetAttributeContainers('event'))
+      elapsed_time = time.perf_counter() - start_time
+    finally:
+      store.Close()
+
+    return number_of_events, elapsed_time
+
+  def TimeGetSortedEvents(self, read_batch_size):
+    """Times reading all events in chronological order.
+
+    Args:
+      read_batch_size (int): maximum number of attribute containers read in
+          a single round trip.
+
+    Returns:
+      tuple[int, float]: number of events read and elapsed time in seconds.
+    """
+    store = self._OpenStore(read_batch_size=read_batch_size)
+    try:
+      start_time = time.perf_counter()
+      number_of_events = sum(1 for _ in store.GetSortedEvents())
+      elapsed_time = time.perf_counter() - start_time
+    finally:
+      store.Close()
+
+    return number_of_events, elapsed_time
+
+  def WriteEvents(self, number_of_events):
+    """Writes events with random timestamps to a new benchmark task.
+
+    Args:
+      number_of_events (int): number of events to write.
+    """
+    session = sessions.Session()
+    task = tasks.Task(session_identifier=session.identifier)
+
+    self._session_identifier = session.identifier
+    self._task_identifier = task.identifier
+
+    store = self._OpenStore()
+    try:
+      event_data = events.EventData(data_type='test:event')
+      store.AddAttributeContainer(event_data)
+      event_data_identifier = event_data.GetIdentifier()
+
+      for _ in range(number_of_events):
+        event = events.EventObject()
+        event.timestamp = random.randint(0, 1 << 52)
+        event.timestamp_desc = 'Test Time'
+        event.SetEventDataIdentifier(event_data_identifier)
+        store.AddAttributeContainer(event)
+
+    finally:
+      store.Close()
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmark reading events from the Redis store.'))
+
+  argument_parser.add_argument(
+      '--batch_sizes', '--batch-sizes', dest='batch_sizes', type=str,
+      action='store', default='1,100,1000', metavar='SIZES', help=(
+          'comma separated read batch sizes to benchmark.'))
+
+  argument_parser.add_argument(
+      '--events', dest='number_of_events', type=int, action='store',
+      default=100000, metavar='NUMBER', help='number of events to write.')
+
+  argument_parser.add_argument(
+      '--url', dest='url', type=str, action='store',
+      default=redis_store.RedisStore.DEFAULT_REDIS_URL, metavar='URL', help=(
+          'URL of the Redis server, where a fake Redis server is used if no '
+          'server is available.'))
+
+  options = argument_parser.parse_args()
+
+  try:
+    batch_sizes = [int(value, 10) for value in options.batch_sizes.split(',')]
+  except ValueError:
+    print('Unsupported batch sizes: {0:s}'.format(options.batch_sizes))
+    return False
+
+  try:
+    redis_client = redis.from_url(options.url, socket_timeout=60)
+    redis_client.ping()
+  except redis.exceptions.ConnectionError:
+    if not fakeredis:
+      print('Unable to connect to Redis server: {0:s}'.format(options.url))
+      return False
+
+    print('Unable to connect to Redis server, using fake Redis server.')
+    redis_client = fakeredis.FakeStrictRedis()
+
+  benchmark = RedisStoreBenchmark(redis_client)
+
+  try:
+    benchmark.WriteEvents(options.number_of_events)
+
+    for batch_size in batch_sizes:
+      number_of_events, elapsed_time = benchmark.TimeGetSortedEvents(
+          batch_size)
+      print((
+          'GetSortedEvents batch size: {0:d} events: {1:d} time: {2:.3f} '
+          'seconds').format(batch_size, number_of_events, elapsed_time))
+
+      number_of_events, elapsed_time = benchmark.TimeGetAttributeContainers(
+          batch_size)
+      print((
+          'GetAttributeContainers batch size: {0:d} events: {1:d} time: '
+          '{2:.3f} seconds').format(batch_size, number_of_events, elapsed_time))
+
+  finally:
+    benchmark.Cleanup()
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)